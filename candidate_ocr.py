@@ -0,0 +1,155 @@
+"""
+OCR multi-configurations en parallèle pour OCR Grec
+===================================================
+Les configurations candidates (grc, grc+eng, grc+fra...) sont reconnues en
+même temps sur le pool de processus, chaque processus bornant OpenMP à sa
+part des cœurs. Dès qu'un candidat atteint le seuil de fiabilité, les
+candidats pas encore lancés sont annulés. Un candidat déjà lancé ne peut pas
+être interrompu : il est abandonné (résultat ignoré, compté à part) et
+occupe son processus jusqu'à la fin de sa passe. Les candidats sont soumis
+par fenêtre de la taille du pool, moins les abandonnés encore en cours :
+le travail abandonné ne retient jamais plus de processus qu'il n'en occupe
+déjà, et les candidats suivants ne s'empilent pas derrière lui.
+Les durées et les victoires de chaque configuration sont cumulées pour
+repérer celles qui ne l'emportent jamais.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from PIL import Image
+
+from config import Config
+from engine_pool import get_engine_pool
+from ocr_data import mean_confidence, text_from_words, word_boxes
+from process_pool import default_worker_count, get_process_pool
+
+
+@dataclass
+class CandidateConfig:
+    """Configuration Tesseract candidate"""
+    name: str
+    lang: str
+    config: str
+
+
+@dataclass
+class CandidateOutcome:
+    """Résultat d'un candidat"""
+    candidate: CandidateConfig
+    text: str
+    confidence: float
+    processing_time: float
+    words: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _recognize(image: Image.Image, lang: str, config: str) -> Tuple[Dict[str, List[Any]], float]:
+    """Une passe image_to_data dans un processus du pool, avec le moteur du processus
+    (modèles gardés chargés d'une tâche à l'autre ; durée mesurée côté processus)"""
+    start = time.perf_counter()
+    data = get_engine_pool().image_to_data(image, lang, config)
+    return data, time.perf_counter() - start
+
+
+class CandidateOCR:
+    """Lance les configurations candidates en parallèle, avec sortie anticipée"""
+
+    def __init__(self, threshold: Optional[float] = None, max_workers: Optional[int] = None) -> None:
+        self.threshold = Config.thresholds.reliable if threshold is None else threshold
+        self.max_workers = max_workers or default_worker_count()
+        # Statistiques cumulées par configuration
+        self.stats: Dict[str, Dict[str, float]] = {}
+        # Candidats abandonnés encore en cours dans le pool
+        self._abandoned: Set[Future] = set()
+        self._lock = threading.Lock()
+
+    def run(self, image: Image.Image, candidates: List[CandidateConfig]) -> List[CandidateOutcome]:
+        """Reconnaît l'image avec chaque candidat ; s'arrête au premier résultat fiable"""
+        start = time.perf_counter()
+        pool = get_process_pool(self.max_workers)
+        with self._lock:
+            window = max(1, self.max_workers - len(self._abandoned))
+
+        queue = list(candidates)
+        futures: Dict[Future, CandidateConfig] = {}
+
+        def submit_next() -> Future:
+            candidate = queue.pop(0)
+            future = pool.submit(_recognize, image, candidate.lang, candidate.config)
+            futures[future] = candidate
+            return future
+
+        pending = {submit_next() for _ in range(min(window, len(queue)))}
+        outcomes: List[CandidateOutcome] = []
+        reliable = None
+        while pending and reliable is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                candidate = futures[future]
+                stats = self._stats(candidate.name)
+                try:
+                    data, seconds = future.result()
+                except Exception as e:
+                    stats["errors"] += 1
+                    logging.error(f"Erreur OCR {candidate.name}: {e}")
+                    continue
+
+                words = word_boxes(data)
+                outcome = CandidateOutcome(candidate, text_from_words(words).strip(),
+                                           mean_confidence(data), seconds, words)
+                outcomes.append(outcome)
+                stats["runs"] += 1
+                stats["total_time"] += seconds
+                logging.info(f"OCR {candidate.name}: {len(outcome.text)} caractères, "
+                             f"confiance {outcome.confidence:.1f}%, {seconds:.2f}s")
+                if outcome.confidence >= self.threshold and reliable is None:
+                    reliable = outcome
+
+            while queue and reliable is None and len(pending) < window:
+                pending.add(submit_next())
+
+        # Candidats jamais soumis ou encore en attente : annulés
+        for candidate in queue:
+            self._stats(candidate.name)["cancelled"] += 1
+        for future in pending:
+            stats = self._stats(futures[future].name)
+            if future.cancel():
+                stats["cancelled"] += 1
+                continue
+            # Déjà lancé : le processus termine sa passe, le résultat est ignoré
+            stats["abandoned"] += 1
+            with self._lock:
+                self._abandoned.add(future)
+            future.add_done_callback(self._release_abandoned)
+
+        if outcomes:
+            best = reliable or max(outcomes, key=lambda outcome: outcome.confidence)
+            self._stats(best.candidate.name)["wins"] += 1
+            logging.info(f"Candidat retenu: {best.candidate.name} ({best.confidence:.1f}%), "
+                         f"{len(outcomes)}/{len(candidates)} candidats en {time.perf_counter() - start:.2f}s")
+        return outcomes
+
+    def _release_abandoned(self, future: Future) -> None:
+        with self._lock:
+            self._abandoned.discard(future)
+
+    @property
+    def abandoned_running(self) -> int:
+        """Candidats abandonnés qui occupent encore un processus du pool"""
+        with self._lock:
+            return len(self._abandoned)
+
+    def _stats(self, name: str) -> Dict[str, float]:
+        return self.stats.setdefault(name, {"runs": 0, "wins": 0, "cancelled": 0, "abandoned": 0,
+                                            "errors": 0, "total_time": 0.0})
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Durée moyenne, victoires, annulations et abandons de chaque configuration"""
+        return {
+            name: {**stats, "average_time": stats["total_time"] / stats["runs"] if stats["runs"] else 0.0}
+            for name, stats in self.stats.items()
+        }
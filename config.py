@@ -39,6 +39,7 @@ class ThresholdConfig:
 class PDFConfig:
     """Configuration PDF optimisée"""
     cache_size: int = 50
+    cache_memory_limit: int = 512 * 1024 * 1024  # 512MB
     batch_size: int = 100
     max_dpi: int = 600
     default_dpi: int = 300
@@ -156,8 +157,15 @@ class Config:
         "max_image_size": 4096,
         "max_memory_usage": 2 * 1024 * 1024 * 1024,  # 2GB
         "thread_pool_size": 8,
+        "preprocessing_cache_memory": 256 * 1024 * 1024,  # 256MB
+        "preprocessing_cache_disk": 2 * 1024 * 1024 * 1024,  # 2GB
         "cache_ttl": 3600,  # 1 heure
-        "batch_timeout": 300  # 5 minutes
+        "batch_timeout": 300,  # 5 minutes
+        "ocr_backend": "auto",  # auto, tesserocr (libtesseract en processus, modèles gardés chargés) ou cli (un processus tesseract par appel, sans persistance)
+        "page_workers": None,  # processus de l'OCR de document complet (None : thread_pool_size borné par les cœurs)
+        "ocr_engines_per_language": None,  # instances Tesseract gardées par jeu de langues (None : une par cœur utilisé)
+        "ocr_journal_max_age_days": 30,  # travaux OCR journalisés inactifs depuis plus longtemps supprimés
+        "ocr_journal_max_jobs": 50  # travaux OCR gardés au plus dans le journal (les plus récents)
     }
     
     @classmethod
@@ -0,0 +1,116 @@
+"""
+Chargement de documents en arrière-plan pour OCR Grec
+=====================================================
+Le décodage des images et le rendu des pages PDF se font dans un thread ;
+la progression et le résultat reviennent au thread Tk via `after()`, de sorte
+que la fenêtre reste réactive. Ouvrir un autre fichier annule le chargement
+en cours, dont le résultat est alors simplement libéré.
+"""
+
+import logging
+import threading
+from collections.abc import Sequence
+from typing import Callable, Optional
+
+# Ouvre le document (chemin, rappel de progression) et retourne ses pages
+DocumentOpener = Callable[[str, Callable[[str], None]], Sequence]
+
+
+class DocumentLoadTask:
+    """Chargement en cours d'un document"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+
+class BackgroundDocumentLoader:
+    """Ouvre les documents hors du thread Tk, un seul chargement actif à la fois"""
+
+    def __init__(self, root) -> None:
+        # Widget Tk utilisé pour revenir dans la boucle d'événements (after)
+        self.root = root
+        self._current: Optional[DocumentLoadTask] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loading(self) -> bool:
+        return self._current is not None
+
+    def load(self, path: str, opener: DocumentOpener,
+             on_loaded: Callable[[Sequence, str], None],
+             on_error: Callable[[Exception, str], None],
+             on_progress: Optional[Callable[[str], None]] = None) -> DocumentLoadTask:
+        """Lance le chargement de `path` (annule le précédent)"""
+        task = DocumentLoadTask(path)
+        with self._lock:
+            if self._current:
+                logging.info(f"Chargement annulé: {self._current.path}")
+                self._current.cancel()
+            self._current = task
+
+        thread = threading.Thread(target=self._worker, args=(task, opener, on_loaded, on_error, on_progress),
+                                  daemon=True, name="document-loader")
+        thread.start()
+        return task
+
+    def cancel(self) -> None:
+        """Annule le chargement en cours, s'il y en a un"""
+        with self._lock:
+            if self._current:
+                self._current.cancel()
+                self._current = None
+
+    def _worker(self, task: DocumentLoadTask, opener: DocumentOpener,
+                on_loaded: Callable[[Sequence, str], None],
+                on_error: Callable[[Exception, str], None],
+                on_progress: Optional[Callable[[str], None]]) -> None:
+        def progress(message: str) -> None:
+            if on_progress and not task.cancelled:
+                self.root.after(0, on_progress, message)
+
+        pages = None
+        try:
+            pages = opener(task.path, progress)
+            if not task.cancelled:
+                # La première page est décodée ici, l'affichage sera immédiat
+                progress("Affichage de la première page...")
+                pages[0]
+        except Exception as e:
+            if not task.cancelled:
+                self.root.after(0, self._finish, task, None, on_loaded, on_error, e)
+            self._discard(pages)
+            return
+
+        if task.cancelled:
+            self._discard(pages)
+            return
+        self.root.after(0, self._finish, task, pages, on_loaded, on_error, None)
+
+    def _finish(self, task: DocumentLoadTask, pages: Optional[Sequence],
+                on_loaded: Callable[[Sequence, str], None],
+                on_error: Callable[[Exception, str], None],
+                error: Optional[Exception]) -> None:
+        """Livraison dans le thread Tk (ignorée si un autre fichier a été ouvert entre-temps)"""
+        with self._lock:
+            if task.cancelled or task is not self._current:
+                self._discard(pages)
+                return
+            self._current = None
+
+        if error is not None:
+            on_error(error, task.path)
+        else:
+            on_loaded(pages, task.path)
+
+    @staticmethod
+    def _discard(pages: Optional[Sequence]) -> None:
+        if hasattr(pages, "close"):
+            pages.close()
@@ -0,0 +1,203 @@
+"""
+Pool de moteurs Tesseract pour OCR Grec
+=======================================
+Chaque appel OCR payait le lancement de Tesseract et le chargement des
+modèles grc/eng/fra. Le pool garde jusqu'à N instances initialisées par jeu
+de langues et les prête aux tâches (pages, colonnes, zones) : une instance
+sert une tâche à la fois, puis retourne au pool avec son modèle chargé. Les
+instances sont créées à la demande, ou d'avance avec `warm()`. Quand toutes
+les instances d'un jeu de langues sont occupées, les tâches attendent
+leur tour ; `get_statistics()` rapporte la taille du pool, l'attente et
+l'occupation de chaque instance.
+
+Le pool est un OCRBackend : `get_engine_pool()` retourne celui du processus
+courant (un par processus du pool de processus).
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from PIL import Image
+
+from config import Config
+from ocr_backend import OCRBackend, create_engine, engine_key, resolve_backend_kind
+from process_pool import default_worker_count
+
+
+@dataclass
+class PooledEngine:
+    """Instance du pool et son occupation"""
+    engine: Any
+    index: int
+    created_at: float = field(default_factory=time.perf_counter)
+    calls: int = 0
+    busy_time: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Part du temps passée à reconnaître depuis la création"""
+        elapsed = time.perf_counter() - self.created_at
+        return self.busy_time / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class _EngineGroup:
+    """Instances d'un même jeu de langues"""
+    engines: List[PooledEngine] = field(default_factory=list)
+    idle: List[PooledEngine] = field(default_factory=list)
+    creating: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    wait_time: float = 0.0
+
+
+class EnginePool(OCRBackend):
+    """Instances Tesseract initialisées, prêtées une à une aux tâches"""
+
+    def __init__(self, kind: Optional[str] = None, engines_per_language: Optional[int] = None,
+                 tessdata_path: Optional[str] = None) -> None:
+        self.kind = resolve_backend_kind(kind)
+        self.engines_per_language = max(1, engines_per_language
+                                        or Config.PERFORMANCE.get("ocr_engines_per_language")
+                                        or default_worker_count())
+        self.tessdata_path = tessdata_path
+        self._groups: Dict[tuple, _EngineGroup] = {}
+        self._condition = threading.Condition()
+
+    @property
+    def name(self) -> str:
+        return self.kind
+
+    def image_to_string(self, image: Image.Image, lang: str, config: str = "") -> str:
+        with self.checkout(lang, config) as engine:
+            return engine.image_to_string(image, config)
+
+    def image_to_data(self, image: Image.Image, lang: str, config: str = "") -> Dict[str, List[Any]]:
+        with self.checkout(lang, config) as engine:
+            return engine.image_to_data(image, config)
+
+    @contextmanager
+    def checkout(self, lang: str, config: str = "") -> Iterator[Any]:
+        """Emprunte une instance pour ce jeu de langues (attend si toutes sont occupées)"""
+        key = engine_key(lang, config)
+        slot = self._acquire(key, lang, config)
+        start = time.perf_counter()
+        try:
+            yield slot.engine
+        finally:
+            with self._condition:
+                slot.calls += 1
+                slot.busy_time += time.perf_counter() - start
+                self._groups[key].idle.append(slot)
+                self._condition.notify_all()
+
+    def warm(self, lang: str, config: str = "", count: int = 1) -> None:
+        """Initialise d'avance des instances (chargement des modèles hors des tâches)"""
+        if self.kind != "tesserocr":
+            # L'exécutable recharge ses modèles à chaque appel : rien à préparer
+            return
+        key = engine_key(lang, config)
+        target = min(count, self.engines_per_language)
+        slots: List[PooledEngine] = []
+        try:
+            while True:
+                with self._condition:
+                    group = self._groups.setdefault(key, _EngineGroup())
+                    if len(group.engines) + group.creating >= target:
+                        break
+                slots.append(self._acquire(key, lang, config))
+        finally:
+            with self._condition:
+                self._groups[key].idle.extend(slots)
+                self._condition.notify_all()
+        logging.info(f"Moteurs prêts: {lang} ({len(self._groups[key].engines)} instance(s))")
+
+    def _acquire(self, key: tuple, lang: str, config: str) -> PooledEngine:
+        with self._condition:
+            group = self._groups.setdefault(key, _EngineGroup())
+            while not group.idle:
+                if len(group.engines) + group.creating < self.engines_per_language:
+                    group.creating += 1
+                    break
+                # Toutes les instances sont occupées : la tâche attend son tour
+                group.waiting += 1
+                group.max_waiting = max(group.max_waiting, group.waiting)
+                start = time.perf_counter()
+                self._condition.wait()
+                group.wait_time += time.perf_counter() - start
+                group.waiting -= 1
+            else:
+                return group.idle.pop()
+
+        # Chargement du modèle hors verrou : les autres jeux de langues restent disponibles
+        try:
+            engine = create_engine(self.kind, lang, config, self.tessdata_path)
+        except Exception:
+            with self._condition:
+                group.creating -= 1
+                self._condition.notify_all()
+            raise
+
+        with self._condition:
+            group.creating -= 1
+            slot = PooledEngine(engine, len(group.engines))
+            group.engines.append(slot)
+        logging.info(f"Moteur Tesseract initialisé: {lang} (instance {slot.index + 1}/{self.engines_per_language})")
+        return slot
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Taille du pool, attente et occupation par jeu de langues et par instance"""
+        with self._condition:
+            languages = {}
+            for (lang, oem, variables), group in self._groups.items():
+                label = lang + ("" if oem is None else f" --oem {oem}") + "".join(
+                    f" -c {name}={value}" for name, value in variables)
+                languages[label] = {
+                    "engines": len(group.engines),
+                    "busy": len(group.engines) - len(group.idle),
+                    "queue_depth": group.waiting,
+                    "max_queue_depth": group.max_waiting,
+                    "wait_time": group.wait_time,
+                    "per_engine": [{
+                        "calls": slot.calls,
+                        "busy_time": slot.busy_time,
+                        "utilization": slot.utilization
+                    } for slot in group.engines]
+                }
+            return {
+                "backend": self.kind,
+                "pool_size": self.engines_per_language,
+                "total_engines": sum(len(group.engines) for group in self._groups.values()),
+                "languages": languages
+            }
+
+    def close(self) -> None:
+        """Ferme les instances au repos (celles en cours d'utilisation restent valides)"""
+        with self._condition:
+            for group in self._groups.values():
+                for slot in group.idle:
+                    slot.engine.close()
+                    group.engines.remove(slot)
+                group.idle.clear()
+
+
+_pool: Optional[EnginePool] = None
+_pool_pid = 0
+_lock = threading.Lock()
+
+
+def get_engine_pool() -> EnginePool:
+    """Pool de moteurs du processus courant (créé à la première demande)"""
+    global _pool, _pool_pid
+    with _lock:
+        # Un processus issu d'un fork ne réutilise pas les instances du parent
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = EnginePool()
+            _pool_pid = os.getpid()
+            logging.info(f"Pool de moteurs OCR: {_pool.kind}, {_pool.engines_per_language} instance(s) par jeu de langues")
+        return _pool
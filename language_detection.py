@@ -0,0 +1,173 @@
+"""
+Pré-détection de l'écriture et des langues pour OCR Grec
+========================================================
+Charger et exécuter trois modèles LSTM (grc+eng+fra) sur chaque page coûte
+cher. Une passe rapide sur un échantillon de la page (quelques bandes
+horizontales réparties sur la hauteur, à demi-résolution) compte les lettres
+grecques et latines reconnues, puis départage français et anglais par les
+accents et les mots outils. Le plus petit jeu de langues suffisant est
+retenu pour la page et mémorisé par document.
+
+L'OSD de Tesseract n'est pas utilisé : il ne rapporte qu'une écriture
+dominante et ne voit pas les pages mixtes (texte grec et apparat français).
+"""
+
+import logging
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from engine_pool import get_engine_pool
+from ocr_data import word_boxes
+
+# Jeu complet, utilisé quand l'échantillon ne permet pas de décider
+DEFAULT_LANGUAGES = "grc+eng+fra"
+
+# Passe d'échantillonnage : LSTM seul, grec et un modèle latin accentué
+SAMPLE_LANGUAGES = "grc+fra"
+SAMPLE_CONFIG = "--oem 1 --psm 6"
+
+FRENCH_WORDS = {"le", "la", "les", "des", "du", "et", "est", "une", "que", "qui", "dans", "pour", "au", "aux", "sur", "par"}
+ENGLISH_WORDS = {"the", "and", "of", "to", "is", "in", "that", "with", "for", "which", "this", "by", "from", "are"}
+FRENCH_LETTERS = set("éèêëàâçîïôûùœ")
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class LanguageChoice:
+    """Jeu de langues retenu pour une page"""
+    languages: str
+    greek_letters: int = 0
+    latin_letters: int = 0
+    detected: bool = True
+    detection_time: float = 0.0
+
+    @property
+    def greek_share(self) -> float:
+        total = self.greek_letters + self.latin_letters
+        return self.greek_letters / total if total else 0.0
+
+
+def letter_scripts(text: str) -> Tuple[int, int]:
+    """Nombre de lettres grecques et latines d'un texte"""
+    greek = latin = 0
+    for char in text:
+        if not char.isalpha():
+            continue
+        name = unicodedata.name(char, "")
+        if name.startswith("GREEK"):
+            greek += 1
+        elif name.startswith("LATIN"):
+            latin += 1
+    return greek, latin
+
+
+def latin_language(words: List[str]) -> str:
+    """Départage français et anglais (les deux si rien ne tranche)"""
+    french = english = 0
+    for word in words:
+        lower = word.lower()
+        french += (lower in FRENCH_WORDS) + any(char in FRENCH_LETTERS for char in lower)
+        english += lower in ENGLISH_WORDS
+    if french > 2 * english:
+        return "fra"
+    if english > 2 * french:
+        return "eng"
+    return "eng+fra"
+
+
+def sample_bands(image: Image.Image, bands: int = 4, band_fraction: float = 0.06,
+                 scale: float = 0.5) -> Image.Image:
+    """Bandes horizontales réparties sur la page, empilées et réduites"""
+    gray = np.asarray(image.convert("L"))
+    height = gray.shape[0]
+    band_height = max(16, int(height * band_fraction))
+    strips = []
+    for i in range(bands):
+        center = int(height * (2 * i + 1) / (2 * bands))
+        top = max(0, min(height - band_height, center - band_height // 2))
+        strips.append(gray[top:top + band_height])
+    sample = Image.fromarray(np.vstack(strips))
+    if scale < 1:
+        sample = sample.resize((max(1, int(sample.width * scale)), max(1, int(sample.height * scale))),
+                               Image.Resampling.LANCZOS)
+    return sample
+
+
+class LanguageDetector:
+    """Choisit le plus petit jeu de langues par page, mémorisé par document"""
+
+    def __init__(self, default: str = DEFAULT_LANGUAGES, min_letters: int = 40,
+                 min_share: float = 0.05, min_confidence: float = 30.0) -> None:
+        self.default = default
+        # En dessous de min_letters lettres reconnues, l'échantillon n'est pas concluant
+        self.min_letters = min_letters
+        # Part minimale d'une écriture pour garder son modèle
+        self.min_share = min_share
+        self.min_confidence = min_confidence
+        self._choices: Dict[str, Dict[int, LanguageChoice]] = {}
+        self._lock = threading.Lock()
+
+    def detect(self, image: Image.Image, document: Optional[str] = None, page: int = 0) -> str:
+        """Jeu de langues de la page (calculé une fois par page et par document)"""
+        return self.choose(image, document, page).languages
+
+    def choose(self, image: Image.Image, document: Optional[str] = None, page: int = 0) -> LanguageChoice:
+        if document is not None:
+            cached = self.cached(document, page)
+            if cached is not None:
+                return cached
+
+        choice = self._detect(image)
+        if document is not None:
+            self.remember(document, page, choice)
+        return choice
+
+    def cached(self, document: str, page: int) -> Optional[LanguageChoice]:
+        """Choix déjà connu pour cette page du document"""
+        with self._lock:
+            return self._choices.get(document, {}).get(page)
+
+    def remember(self, document: str, page: int, choice: LanguageChoice) -> None:
+        """Mémorise un choix fait ailleurs (détection dans un processus du pool)"""
+        with self._lock:
+            self._choices.setdefault(document, {})[page] = choice
+
+    def forget(self, document: str) -> None:
+        """Oublie les choix d'un document fermé (son contenu peut changer d'ici sa réouverture)"""
+        with self._lock:
+            self._choices.pop(document, None)
+
+    def _detect(self, image: Image.Image) -> LanguageChoice:
+        start = time.perf_counter()
+        try:
+            data = get_engine_pool().image_to_data(sample_bands(image), SAMPLE_LANGUAGES, SAMPLE_CONFIG)
+        except Exception as e:
+            logging.warning(f"Détection de langue impossible ({e}), jeu complet {self.default}")
+            return LanguageChoice(self.default, detected=False)
+
+        words = [word["text"] for word in word_boxes(data) if word["confidence"] >= self.min_confidence]
+        greek, latin = letter_scripts(" ".join(words))
+        elapsed = time.perf_counter() - start
+
+        if greek + latin < self.min_letters:
+            logging.info(f"Échantillon peu concluant ({greek + latin} lettres), jeu complet {self.default}")
+            return LanguageChoice(self.default, greek, latin, detected=False, detection_time=elapsed)
+
+        languages = []
+        if greek / (greek + latin) >= self.min_share:
+            languages.append("grc")
+        if latin / (greek + latin) >= self.min_share:
+            latin_words = [word for word in words if letter_scripts(word)[1] > letter_scripts(word)[0]]
+            languages.append(latin_language(_WORD_RE.findall(" ".join(latin_words))))
+
+        choice = LanguageChoice("+".join(languages), greek, latin, detection_time=elapsed)
+        logging.info(f"Langues détectées: {choice.languages} (grec {choice.greek_share:.0%}, {elapsed:.2f}s)")
+        return choice
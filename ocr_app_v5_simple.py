@@ -14,10 +14,10 @@ import logging
 import threading
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from typing import Dict, List, Tuple, Optional, Any, Callable, Sequence, Iterator
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import wraps
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from functools import partial, wraps
 from collections import defaultdict, deque
 
 # Imports Tkinter
@@ -39,13 +39,25 @@ import webbrowser
 from datetime import datetime
 import platform
 
-# Support PDF conditionnel
-try:
-    from pdf2image import convert_from_path, pdfinfo_from_path
-    PDF_SUPPORT = True
-except ImportError:
-    PDF_SUPPORT = False
-    logging.warning("pdf2image non installé : support PDF désactivé.")
+# Support PDF conditionnel (pdf2image) : rendu des pages par page_source
+from page_source import PDF_SUPPORT, LazyPDFPageSource, IMAGE_EXTENSIONS, open_image_document, get_ocr_raster, iter_ocr_rasters, ocr_raster_scale, page_display_dpi
+from page_store import DiskPageStore
+from page_cache import PageCache
+from document_loader import BackgroundDocumentLoader
+from pdf_text_layer import TextLayerPage, probe_text_layer
+from ocr_pipeline import ParallelStage, StreamingPipeline
+from ocr_journal import OCRJobJournal
+from preprocessing import PreprocessingCache, PreprocessingPipeline, stage_margin, unskew_box
+from tiled_preprocessing import TiledPreprocessor
+from language_detection import DEFAULT_LANGUAGES, SAMPLE_CONFIG, SAMPLE_LANGUAGES, LanguageDetector
+from page_ocr import PageJobOptions, column_language, detect_columns, display_region, ocr_page_job
+from engine_pool import get_engine_pool
+from ocr_backend import engine_key
+from ocr_data import text_from_positions, word_boxes
+from two_pass_ocr import two_pass_words
+from region_batching import RegionBatch, build_region_batch, plan_region_batches, split_batch_words
+from process_pool import default_worker_count, get_process_pool
+from config import Config
 
 # Configuration logging
 logging.basicConfig(
@@ -76,6 +88,7 @@ if IS_MACOS:
 CACHE_DIR = Path.home() / ".greek_ocr_cache"
 CACHE_DIR.mkdir(exist_ok=True)
 CACHE_DB_PATH = CACHE_DIR / "cache.db"
+OCR_JOURNAL_PATH = CACHE_DIR / "ocr_jobs.db"  # Journal des OCR de documents complets
 CACHE_MAX_SIZE = 500 * 1024 * 1024  # 500MB
 CACHE_TTL = 24 * 60 * 60  # 24 heures
 
@@ -419,7 +432,7 @@ class AppState:
     ai_processing: bool = False
     zoom_factor: float = 1.0
     current_theme: str = "light"
-    current_images: List[Image.Image] = field(default_factory=list)
+    current_images: Sequence[Image.Image] = field(default_factory=list)
     ocr_results: List[Dict[str, Any]] = field(default_factory=list)
     pdf_cache: Dict[str, Any] = field(default_factory=dict)
     pdf_cache_order: List[str] = field(default_factory=list)
@@ -530,6 +543,7 @@ class SimpleUIManager:
         menubar.add_cascade(label="Fichier", menu=file_menu)
         file_menu.add_command(label="Ouvrir Image", command=self.app.open_image)
         file_menu.add_command(label="Ouvrir PDF", command=self.app.open_pdf)
+        file_menu.add_command(label="Ouvrir Dossier d'images", command=self.app.open_image_folder)
         file_menu.add_separator()
         file_menu.add_command(label="Exporter", command=self.app.export_results)
         file_menu.add_separator()
@@ -975,81 +989,93 @@ class SimpleFileManager:
     
     def __init__(self, app: 'SimpleOCRApp') -> None:
         self.app = app
+        self.loader = BackgroundDocumentLoader(app)
     
     def handle_file_open(self, filename: str) -> None:
-        """Gère l'ouverture d'un fichier"""
+        """Gère l'ouverture d'un fichier (chargement en arrière-plan)"""
         if not filename:
             return
             
-        if self._is_image_file(filename):
-            self._load_image_safe(filename)
+        if os.path.isdir(filename) or self._is_image_file(filename):
+            opener = self._open_image_document
+            self.app.set_status("Chargement de l'image en cours...")
         elif self._is_pdf_file(filename):
-            self._load_pdf_safe(filename)
+            if not PDF_SUPPORT:
+                messagebox.showerror("Erreur", "Support PDF non disponible")
+                return
+            opener = self._open_pdf_document
+            self.app.set_status("Chargement PDF en cours...")
         else:
             messagebox.showerror("Erreur", f"Format de fichier non supporté: {filename}")
+            return
+        
+        # Décodage hors du thread Tk ; un nouveau fichier annule le chargement en cours
+        self.loader.load(filename, opener, self._on_document_loaded, self._on_load_error, self.app.set_status)
     
     def _is_image_file(self, filename: str) -> bool:
         """Vérifie si c'est un fichier image"""
-        extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif']
-        return any(filename.lower().endswith(ext) for ext in extensions)
+        return filename.lower().endswith(IMAGE_EXTENSIONS)
     
     def _is_pdf_file(self, filename: str) -> bool:
         """Vérifie si c'est un fichier PDF"""
         return filename.lower().endswith('.pdf')
     
-    def _load_image_safe(self, path: str) -> None:
-        """Charge une image de manière sécurisée"""
-        try:
-            with Image.open(path) as img:
-                # Conversion en RGB si nécessaire
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Redimensionnement si trop grande
-                max_size = 4096
-                if max(img.size) > max_size:
-                    ratio = max_size / max(img.size)
-                    new_size = tuple(int(dim * ratio) for dim in img.size)
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                
-                self.app.state.current_images = [img]
-                self.app.state.current_file_path = path
-                self.app.state.current_page = 0
-                self.app.display_current_image()
-                self.app.set_status(SimpleConfig.MESSAGES["info"]["image_loaded"].format(filename=Path(path).name))
-                
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement de l'image: {e}")
-    
-    def _load_pdf_safe(self, path: str) -> None:
-        """Charge un PDF de manière sécurisée"""
-        if not PDF_SUPPORT:
-            messagebox.showerror("Erreur", "Support PDF non disponible")
-            return
+    def _close_current_document(self) -> None:
+        """Libère les pages (fichiers temporaires, cache) du document précédent"""
+        previous = self.app.state.current_images
+        if hasattr(previous, "close"):
+            previous.close()
+        
+        # Langues détectées par page : mémorisées pour ce document seulement
+        if self.app.state.current_file_path:
+            self.app.ocr_manager.language_detector.forget(self.app.state.current_file_path)
+    
+    def _open_image_document(self, path: str, progress: Callable[[str], None]) -> Sequence:
+        """Ouvre une image (ou un TIFF multipage, un dossier d'images) — thread de chargement"""
+        # Raster d'affichage borné à 4096 px ; l'OCR relit l'image en pleine résolution
+        pages = open_image_document(path, max_size=4096, cache=self.app.page_cache)
+        if len(pages) > 1:
+            # Document multipage : pages lues à la demande, conservées sur disque
+            progress(f"Document de {len(pages)} pages, lecture de la première...")
+            pages = DiskPageStore(pages, cache=self.app.page_cache)
+        return pages
+    
+    def _open_pdf_document(self, path: str, progress: Callable[[str], None]) -> Sequence:
+        """Ouvre un PDF — thread de chargement"""
+        # Source paresseuse : seul le nombre de pages est lu ici,
+        # chaque page est rasterisée au moment où elle est affichée ou OCRisée,
+        # puis conservée sur disque ; seul le cache LRU reste en mémoire
+        pages = DiskPageStore(LazyPDFPageSource(path, dpi=300, max_size=2048),
+                              cache=self.app.page_cache)
+        progress(f"PDF de {len(pages)} pages, rendu de la première...")
+        return pages
+    
+    def _on_document_loaded(self, pages: Sequence, path: str) -> None:
+        """Installe le document chargé (thread Tk) et affiche sa première page"""
+        self._close_current_document()
+        
+        self.app.state.current_images = pages
+        self.app.state.current_file_path = path
+        self.app.state.current_page = 0
+        self.app.display_current_image()
+        
+        if self._is_pdf_file(path):
+            self.app.set_status(f"PDF chargé: {len(pages)} pages")
+        elif len(pages) > 1:
+            self.app.set_status(f"Document chargé: {len(pages)} pages")
+        else:
+            self.app.set_status(SimpleConfig.MESSAGES["info"]["image_loaded"].format(filename=Path(path).name))
         
-        try:
-            self.app.set_status("Chargement PDF en cours...")
-            
-            # Conversion PDF
-            images = convert_from_path(path, dpi=300, fmt='RGB')
-            
-            # Optimisation des images
-            optimized_images = []
-            for img in images:
-                if max(img.size) > 2048:
-                    ratio = 2048 / max(img.size)
-                    new_size = tuple(int(dim * ratio) for dim in img.size)
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                optimized_images.append(img)
-            
-            self.app.state.current_images = optimized_images
-            self.app.state.current_file_path = path
-            self.app.state.current_page = 0
-            self.app.display_current_image()
-            self.app.set_status(f"PDF chargé: {len(optimized_images)} pages")
-            
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement PDF: {e}")
+        # La page suivante se prépare pendant la lecture de la première
+        self.app._prefetch_page(1)
+    
+    def _on_load_error(self, error: Exception, path: str) -> None:
+        """Affiche l'erreur de chargement (thread Tk)"""
+        self.app.set_status("Prêt")
+        if self._is_pdf_file(path):
+            messagebox.showerror("Erreur", f"Erreur lors du chargement PDF: {error}")
+        else:
+            messagebox.showerror("Erreur", f"Erreur lors du chargement de l'image: {error}")
 
 
 class TuteurIA:
@@ -4057,6 +4083,10 @@ class AdvancedOCRManager:
         self.multilingual_mode = True
         self.ia_enhancement_enabled = True
         
+        # Pré-détection du plus petit jeu de langues par page (mémorisé par document)
+        self.language_detection_enabled = True
+        self.language_detector = LanguageDetector()
+        
         # Configuration des langues par colonne
         self.column_languages = {
             "left": "grc",      # Grec ancien pour colonne gauche
@@ -4066,6 +4096,55 @@ class AdvancedOCRManager:
         
         # Mode d'OCR actuel
         self.ocr_mode = "full"  # full, selected, columns, pdf_full
+        
+        # OCR intégral en deux passes : brouillon rapide, relecture des lignes douteuses
+        self.two_pass_enabled = False
+        
+        # Pages redressées/binarisées pour Tesseract, réutilisées d'un OCR à l'autre
+        # (mémoire + disque, adressées par le contenu de la page)
+        self.preprocessing_cache = PreprocessingCache()
+        
+        # Très grandes pages : binarisation en tuiles sur le pool de processus
+        self.tiled_preprocessor = TiledPreprocessor()
+        
+        # OCR de document complet : pages reconnues en parallèle sur le pool de processus
+        self.page_workers = Config.PERFORMANCE["page_workers"] or default_worker_count()
+        
+        # Moteurs Tesseract gardés initialisés et prêtés aux tâches (pages, colonnes, zones) ;
+        # ceux des langues courantes sont chargés d'avance, en arrière-plan
+        self.ocr_backend = get_engine_pool()
+        self._warmed_engines = set()
+        self._warm_lock = threading.Lock()
+        default_config = SimpleConfig.TESSERACT_CONFIG["default"]
+        self._warm_in_background([(SAMPLE_LANGUAGES, SAMPLE_CONFIG), (DEFAULT_LANGUAGES, default_config)]
+                                 + [(lang, default_config) for lang in self.column_languages.values()])
+    
+    def _warm_in_background(self, engines: List[Tuple[str, str]]) -> None:
+        """Charge en arrière-plan, une fois par jeu de langues, les moteurs des OCR à venir"""
+        if self.ocr_backend.kind != "tesserocr":
+            # Exécutable tesseract : aucun modèle gardé chargé, pas de préchargement
+            return
+        with self._warm_lock:
+            pending = []
+            for lang, config in engines:
+                key = engine_key(lang, config)
+                if key not in self._warmed_engines:
+                    self._warmed_engines.add(key)
+                    pending.append((lang, config))
+        if pending:
+            threading.Thread(target=self._warm_ocr_engines, args=(pending,), daemon=True, name="ocr-warmup").start()
+    
+    def _warm_ocr_engines(self, engines: List[Tuple[str, str]]) -> None:
+        """Charge d'avance les modèles des jeux de langues donnés"""
+        for lang, config in engines:
+            try:
+                self.ocr_backend.warm(lang, config)
+            except Exception as e:
+                logging.warning(f"Préchargement des moteurs OCR {lang} impossible: {e}")
+    
+    def get_engine_statistics(self) -> Dict[str, Any]:
+        """Taille du pool de moteurs, attente et occupation de chaque instance"""
+        return self.ocr_backend.get_statistics()
     
     def open_ocr_options(self) -> None:
         """Ouvre la fenêtre d'options OCR avancées"""
@@ -4154,6 +4233,13 @@ class AdvancedOCRManager:
                                   command=lambda: self._set_ocr_mode("pdf_full"))
         pdf_radio.pack(anchor=tk.W, pady=5)
         
+        # OCR intégral en deux passes
+        two_pass_var = tk.BooleanVar(value=self.two_pass_enabled)
+        two_pass_check = tk.Checkbutton(modes_frame, text="⚡ Deux passes (brouillon rapide + relecture des lignes douteuses)",
+                                       variable=two_pass_var, font=("Segoe UI", 11), bg="#f8f9fa",
+                                       command=lambda: self._set_two_pass(two_pass_var.get()))
+        two_pass_check.pack(anchor=tk.W, pady=5)
+        
         # Description des modes
         desc_frame = tk.Frame(modes_frame, bg="#e9ecef", relief=tk.RAISED, bd=1)
         desc_frame.pack(fill=tk.X, pady=10, padx=10)
@@ -4203,6 +4289,13 @@ class AdvancedOCRManager:
                                     command=lambda: self._set_multilingual_mode(multi_var.get()))
         multi_check.pack(anchor=tk.W, pady=5)
         
+        # Pré-détection des langues de la page
+        lang_detect_var = tk.BooleanVar(value=self.language_detection_enabled)
+        lang_detect_check = tk.Checkbutton(options_frame, text="🔤 Détection des langues par page",
+                                          variable=lang_detect_var, font=("Segoe UI", 12), bg="#f8f9fa",
+                                          command=lambda: self._set_language_detection(lang_detect_var.get()))
+        lang_detect_check.pack(anchor=tk.W, pady=5)
+        
         # Configuration des langues par colonne
         lang_frame = tk.LabelFrame(options_frame, text="🌍 Langues par Colonne", 
                                  font=("Segoe UI", 12, "bold"), bg="#f8f9fa")
@@ -4332,6 +4425,27 @@ L'IA utilise l'API OpenRouter pour analyser et améliorer les résultats OCR."""
         self.multilingual_mode = enabled
         logging.info(f"Mode multilingue: {'activé' if enabled else 'désactivé'}")
     
+    def _set_two_pass(self, enabled: bool) -> None:
+        """Active/désactive l'OCR intégral en deux passes"""
+        self.two_pass_enabled = enabled
+        logging.info(f"OCR en deux passes: {'activé' if enabled else 'désactivé'}")
+    
+    def _set_language_detection(self, enabled: bool) -> None:
+        """Active/désactive la pré-détection des langues"""
+        self.language_detection_enabled = enabled
+        logging.info(f"Détection des langues: {'activée' if enabled else 'désactivée'}")
+    
+    def _page_language(self, image: Image.Image, page: Optional[int] = None) -> str:
+        """Langues Tesseract de la page : détectées sur un échantillon, sinon jeu complet"""
+        if not self.language_detection_enabled:
+            return DEFAULT_LANGUAGES
+        if page is None:
+            page = self.app.state.current_page
+        lang = self.language_detector.detect(image, self.app.state.current_file_path, page)
+        # Jeu détecté (souvent grc ou grc+fra) : ses moteurs restent prêts pour les OCR suivants
+        self._warm_in_background([(lang, SimpleConfig.TESSERACT_CONFIG["default"])])
+        return lang
+    
     def _set_ia_enhancement(self, enabled: bool) -> None:
         """Active/désactive l'amélioration IA"""
         self.ia_enhancement_enabled = enabled
@@ -4442,37 +4556,36 @@ L'IA utilise l'API OpenRouter pour analyser et améliorer les résultats OCR."""
     def _perform_full_ocr(self) -> None:
         """OCR intégral de l'image avec positions des mots"""
         try:
-            image = self.app.state.current_images[self.app.state.current_page]
+            # Raster OCR dédié (niveaux de gris, DPI OCR) ; les positions sont
+            # ramenées dans le repère du raster d'affichage
+            image, scale = get_ocr_raster(self.app.state.current_images, self.app.state.current_page)
+            display_image = self.app.state.current_images[self.app.state.current_page]
+            
+            # Page redressée et binarisée : Tesseract n'a plus à seuiller lui-même
+            image, preprocessing = self._prepare_for_tesseract(image)
             
             # OCR avec Tesseract pour obtenir les données détaillées
             config = SimpleConfig.TESSERACT_CONFIG["default"]
+            lang = self._page_language(image)
             
-            # Obtenir les données OCR avec positions
-            ocr_data = pytesseract.image_to_data(image, config=config, lang='grc+eng+fra', output_type=pytesseract.Output.DICT)
-            
-            # Extraire le texte et les positions
-            text_lines = []
-            word_positions = []
-            
-            for i in range(len(ocr_data['text'])):
-                if int(ocr_data['conf'][i]) > 0:  # Ignorer les éléments avec confiance 0
-                    text = ocr_data['text'][i].strip()
-                    if text:
-                        x = ocr_data['left'][i]
-                        y = ocr_data['top'][i]
-                        w = ocr_data['width'][i]
-                        h = ocr_data['height'][i]
-                        conf = float(ocr_data['conf'][i])
-                        
-                        word_positions.append({
-                            'text': text,
-                            'bbox': (x, y, x + w, y + h),
-                            'confidence': conf
-                        })
-                        text_lines.append(text)
+            if self.two_pass_enabled:
+                # Brouillon rapide, puis relecture des seules lignes douteuses en pleine résolution
+                words, _ = two_pass_words(self.ocr_backend, image, lang, DEFAULT_LANGUAGES, config,
+                                          max_workers=self.page_workers)
+            else:
+                # Obtenir les données OCR avec positions
+                words = word_boxes(self.ocr_backend.image_to_data(image, lang, config))
+            
+            # Ignorer les éléments avec confiance 0 ; positions dans le repère d'affichage
+            words = [word for word in words if word['confidence'] > 0]
+            word_positions = [{
+                'text': word['text'],
+                'bbox': self._scale_box(unskew_box(word['bbox'], preprocessing), scale),
+                'confidence': word['confidence']
+            } for word in words]
             
             # Texte complet
-            full_text = ' '.join(text_lines)
+            full_text = ' '.join(word['text'] for word in words)
             
             # Amélioration IA si activée
             if self.ia_enhancement_enabled:
@@ -4490,7 +4603,7 @@ L'IA utilise l'API OpenRouter pour analyser et améliorer les résultats OCR."""
                 "evaluated_words": evaluated_words,
                 "mode": "full",
                 "word_positions": word_positions,
-                "bbox": (0, 0, image.width, image.height)  # Bbox de l'image complète
+                "bbox": (0, 0, display_image.width, display_image.height)  # Bbox de l'image complète
             }]
             
             self.app.after(0, self._on_ocr_complete, results)
@@ -4504,205 +4617,334 @@ L'IA utilise l'API OpenRouter pour analyser et améliorer les résultats OCR."""
             if not self.selected_regions:
                 raise ValueError("Aucune zone sélectionnée")
             
-            image = self.app.state.current_images[self.app.state.current_page]
-            results = []
-            
-            for i, region in enumerate(self.selected_regions):
-                # Découper la zone
-                cropped_image = image.crop((region["x1"], region["y1"], region["x2"], region["y2"]))
-                
-                # OCR sur la zone
-                config = SimpleConfig.TESSERACT_CONFIG["default"]
-                text = pytesseract.image_to_string(cropped_image, config=config, lang='grc+eng+fra')
-                
-                # Amélioration IA si activée
-                if self.ia_enhancement_enabled:
-                    text = self._enhance_text_with_ia(text)
-                
-                # Évaluation IA
-                evaluated_words = self.word_evaluator.evaluate_words(text)
-                
-                results.append({
-                    "text": text.strip(),
-                    "confidence": 100.0,
-                    "evaluated_words": evaluated_words,
-                    "mode": "selected",
-                    "region": region
+            image, scale = get_ocr_raster(self.app.state.current_images, self.app.state.current_page)
+            lang = self._page_language(image)
+            regions = list(self.selected_regions)
+            
+            # Découper et binariser les zones (coordonnées d'affichage → raster OCR) ; les
+            # petites zones sont regroupées sur des planches reconnues en une seule passe
+            crops = [self._prepare_region_for_tesseract(image, self._region_box(region, 1 / scale))
+                     for region in regions]
+            singles, groups = plan_region_batches(crops)
+            
+            # OCR des zones puis IA de chaque zone, en parallèle ; chaque zone part
+            # vers l'interface dès qu'elle est prête, l'ordre de sélection est rétabli à la fin
+            self.app.after(0, self._on_ocr_stream_start)
+            results = [None] * len(regions)
+            completed = 0
+            # Au moins quelques threads : les appels IA attendent surtout le réseau
+            workers = max(1, min(len(regions), max(4, self.page_workers)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-zone") as executor:
+                pending = {executor.submit(self._ocr_region_crop, i, crops[i], lang): ("ocr", [i]) for i in singles}
+                pending.update({
+                    executor.submit(self._ocr_region_batch, build_region_batch(crops, group), lang): ("ocr", group)
+                    for group in groups
                 })
+                
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        kind, indices = pending.pop(future)
+                        if kind == "ocr":
+                            texts = future.result()
+                            for i in indices:
+                                pending[executor.submit(self._region_result, texts[i], regions[i], "selected")] = ("ia", [i])
+                        else:
+                            completed += 1
+                            results[indices[0]] = future.result()
+                            self.app.after(0, self._on_ocr_segment_ready, results[indices[0]],
+                                           f"Zone {indices[0] + 1} terminée ({completed}/{len(regions)})")
             
             self.app.after(0, self._on_ocr_complete, results)
             
         except Exception as e:
             self.app.after(0, self._on_ocr_error, e)
     
+    def _ocr_region_crop(self, index: int, crop: Image.Image, lang: str) -> Dict[int, str]:
+        """OCR d'une zone seule"""
+        config = SimpleConfig.TESSERACT_CONFIG["default"]
+        return {index: self.ocr_backend.image_to_string(crop, lang, config)}
+    
+    def _ocr_region_batch(self, batch: RegionBatch, lang: str) -> Dict[int, str]:
+        """OCR d'une planche de petites zones en mode épars ; texte rendu à chaque zone"""
+        config = SimpleConfig.TESSERACT_CONFIG["sparse"]
+        data = self.ocr_backend.image_to_data(batch.image, lang, config)
+        by_region = split_batch_words(batch, word_boxes(data))
+        return {index: text_from_positions(words) for index, words in by_region.items()}
+    
+    def _region_result(self, text: str, region: Dict[str, int], mode: str) -> Dict[str, Any]:
+        """Résultat d'une zone : amélioration IA optionnelle et évaluation des mots"""
+        # Amélioration IA si activée
+        if self.ia_enhancement_enabled:
+            text = self._enhance_text_with_ia(text)
+        
+        # Évaluation IA
+        evaluated_words = self.word_evaluator.evaluate_words(text)
+        
+        return {
+            "text": text.strip(),
+            "confidence": 100.0,
+            "evaluated_words": evaluated_words,
+            "mode": mode,
+            "region": region
+        }
+    
     def _perform_column_ocr(self) -> None:
         """OCR avec détection de colonnes"""
         try:
-            image = self.app.state.current_images[self.app.state.current_page]
+            image, scale = get_ocr_raster(self.app.state.current_images, self.app.state.current_page)
+            image, preprocessing = self._prepare_for_tesseract(image)
             
-            # Détection des colonnes
+            # Détection des colonnes (régions ramenées dans le repère de la page non redressée)
             columns = self._detect_columns(image)
-            results = []
-            
-            for i, column in enumerate(columns):
-                # OCR sur chaque colonne avec la langue appropriée
-                lang = self._get_column_language(i, len(columns))
-                config = SimpleConfig.TESSERACT_CONFIG["default"]
-                text = pytesseract.image_to_string(column["image"], config=config, lang=lang)
-                
-                # Amélioration IA si activée
-                if self.ia_enhancement_enabled:
-                    text = self._enhance_text_with_ia(text, lang)
-                
-                # Évaluation IA
-                evaluated_words = self.word_evaluator.evaluate_words(text)
-                
-                results.append({
-                    "text": text.strip(),
-                    "confidence": 100.0,
-                    "evaluated_words": evaluated_words,
-                    "mode": "column",
-                    "column_index": i,
-                    "language": lang,
-                    "region": column["region"]
-                })
+            for column in columns:
+                column["region"] = display_region(column["region"], preprocessing, image.size, 1.0)
+            
+            # Colonnes indépendantes : OCR, IA et évaluation en parallèle ; chaque colonne
+            # part vers l'interface dès qu'elle est prête, l'ordre est rétabli à la fin
+            self.app.after(0, self._on_ocr_stream_start)
+            results = [None] * len(columns)
+            workers = max(1, min(len(columns), self.page_workers))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-colonne") as executor:
+                futures = {
+                    executor.submit(self._ocr_column, column, i, len(columns), scale): i
+                    for i, column in enumerate(columns)
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    result = future.result()
+                    results[futures[future]] = result
+                    self.app.after(0, self._on_ocr_segment_ready, result,
+                                   f"Colonne {futures[future] + 1} terminée ({done}/{len(columns)})")
             
             self.app.after(0, self._on_ocr_complete, results)
             
         except Exception as e:
             self.app.after(0, self._on_ocr_error, e)
     
+    def _ocr_column(self, column: Dict[str, Any], index: int, total_columns: int, scale: float) -> Dict[str, Any]:
+        """OCR d'une colonne avec sa langue, amélioration IA et évaluation (thread du pool)"""
+        lang = self._get_column_language(index, total_columns)
+        config = SimpleConfig.TESSERACT_CONFIG["default"]
+        text = self.ocr_backend.image_to_string(column["image"], lang, config)
+        
+        # Amélioration IA si activée
+        if self.ia_enhancement_enabled:
+            text = self._enhance_text_with_ia(text, lang)
+        
+        # Évaluation IA
+        evaluated_words = self.word_evaluator.evaluate_words(text)
+        
+        return {
+            "text": text.strip(),
+            "confidence": 100.0,
+            "evaluated_words": evaluated_words,
+            "mode": "column",
+            "column_index": index,
+            "language": lang,
+            "region": self._scale_region(column["region"], scale)
+        }
+    
     def _perform_pdf_full_ocr(self) -> None:
-        """OCR complet d'un PDF"""
+        """OCR complet d'un PDF, en flux : chaque page est livrée dès qu'elle est prête"""
         try:
-            if not self.app.state.current_file_path.endswith('.pdf'):
-                raise ValueError("Cette option n'est disponible que pour les PDF")
-            
-            # OCR de toutes les pages
-            all_results = []
-            
-            for page_num in range(len(self.app.state.current_images)):
-                self.app.set_status(f"OCR page {page_num + 1}/{len(self.app.state.current_images)}...")
+            pages = self.app.state.current_images
+            total_pages = len(pages)
+            file_path = self.app.state.current_file_path
+            is_pdf = file_path.lower().endswith('.pdf')
+            
+            if not is_pdf and total_pages < 2:
+                raise ValueError("Cette option n'est disponible que pour les documents multipages (PDF, TIFF, dossier d'images)")
+            
+            # Travail journalisé : les pages déjà terminées sont relues du journal
+            ocr_job = self.app.ocr_journal.open_job(file_path, self._pdf_job_settings(pages), total_pages)
+            completed = ocr_job.completed_pages()
+            if completed:
+                pending = [page for page in range(1, total_pages + 1) if page not in completed]
+                if pending:
+                    logging.info(f"Reprise de l'OCR à la page {pending[0]}/{total_pages}")
+                    self.app.after(0, self.app.set_status, f"Reprise de l'OCR à la page {pending[0]}/{total_pages}...")
+            
+            # Pages natives : la couche texte existante remplace l'OCR
+            text_layers = probe_text_layer(file_path) if is_pdf and len(completed) < total_pages else {}
+            
+            # Rendu → prétraitement et OCR → IA, étapes reliées par des files bornées ;
+            # chaque étape traite plusieurs pages à la fois, livrées dans l'ordre :
+            # prétraitement, colonnes, langues et Tesseract dans les processus du pool,
+            # appels IA (surtout de l'attente réseau) sur des threads
+            def on_page_recognized(job: Dict[str, Any], done: int) -> None:
+                # Jeu de langues détecté dans le processus : mémorisé pour les OCR suivants
+                if "language_choice" in job:
+                    self.language_detector.remember(file_path, job["page"] - 1, job["language_choice"])
+                self.app.after(0, self.app.set_status, f"OCR: {done}/{total_pages} pages reconnues...")
+            
+            options = PageJobOptions(
+                config=SimpleConfig.TESSERACT_CONFIG["default"],
+                column_detection=self.column_detection_enabled,
+                column_languages=dict(self.column_languages),
+                language_detection=self.language_detection_enabled
+            )
+            ia_workers = max(4, self.page_workers)
+            
+            with ThreadPoolExecutor(max_workers=ia_workers, thread_name_prefix="ocr-ia") as ia_executor:
+                pipeline = StreamingPipeline([
+                    ParallelStage("ocr", partial(ocr_page_job, options=options),
+                                  get_process_pool(self.page_workers), window=2 * self.page_workers,
+                                  bypass=lambda job: "results" in job, on_complete=on_page_recognized),
+                    ParallelStage("ia", self._pdf_stage_ia, ia_executor, window=2 * ia_workers,
+                                  bypass=lambda job: "results" in job)
+                ])
                 
-                # Charger la page
-                image = self.app.state.current_images[page_num]
+                # Chaque page terminée part vers l'interface et vers le journal
+                self.app.after(0, self._on_ocr_stream_start)
                 
-                # Détection de colonnes si activée
-                if self.column_detection_enabled:
-                    columns = self._detect_columns(image)
-                    
-                    for i, column in enumerate(columns):
-                        lang = self._get_column_language(i, len(columns))
-                        config = SimpleConfig.TESSERACT_CONFIG["default"]
-                        text = pytesseract.image_to_string(column["image"], config=config, lang=lang)
-                        
-                        if self.ia_enhancement_enabled:
-                            text = self._enhance_text_with_ia(text, lang)
-                        
-                        evaluated_words = self.word_evaluator.evaluate_words(text)
-                        
-                        all_results.append({
-                            "text": text.strip(),
-                            "confidence": 100.0,
-                            "evaluated_words": evaluated_words,
-                            "mode": "pdf_column",
-                            "page": page_num + 1,
-                            "column_index": i,
-                            "language": lang,
-                            "region": column["region"]
-                        })
-                else:
-                    # OCR intégral de la page
-                    config = SimpleConfig.TESSERACT_CONFIG["default"]
-                    text = pytesseract.image_to_string(image, config=config, lang='grc+eng+fra')
-                    
-                    if self.ia_enhancement_enabled:
-                        text = self._enhance_text_with_ia(text)
-                    
-                    evaluated_words = self.word_evaluator.evaluate_words(text)
-                    
-                    all_results.append({
-                        "text": text.strip(),
-                        "confidence": 100.0,
-                        "evaluated_words": evaluated_words,
-                        "mode": "pdf_full",
-                        "page": page_num + 1
-                    })
+                for job in pipeline.run(self._iter_pdf_page_jobs(pages, text_layers, completed)):
+                    if job["page"] not in completed:
+                        ocr_job.write_page(job["page"], job["results"])
+                    self.app.after(0, self._on_ocr_page_ready, job["results"], job["page"], total_pages)
             
-            self.app.after(0, self._on_ocr_complete, all_results)
+            ocr_job.finish()
+            self.app.after(0, self._on_ocr_stream_complete)
             
         except Exception as e:
             self.app.after(0, self._on_ocr_error, e)
     
-    def _detect_columns(self, image: Image.Image) -> List[Dict[str, Any]]:
-        """Détecte les colonnes dans l'image"""
+    def _pdf_job_settings(self, pages: Sequence) -> Dict[str, Any]:
+        """Réglages qui identifient un OCR de document complet dans le journal"""
+        return {
+            "mode": "pdf_full",
+            "ocr_dpi": getattr(pages, "ocr_dpi", None),
+            "tesseract_config": SimpleConfig.TESSERACT_CONFIG["default"],
+            "language": "auto" if self.language_detection_enabled else DEFAULT_LANGUAGES,
+            "preprocessing": PreprocessingPipeline.from_profile("tesseract").signature,
+            "column_detection": self.column_detection_enabled,
+            "column_languages": dict(self.column_languages),
+            "multilingual_mode": self.multilingual_mode,
+            "ia_enhancement": self.ia_enhancement_enabled
+        }
+    
+    def _iter_pdf_page_jobs(self, pages: Sequence, text_layers: Dict[int, TextLayerPage],
+                            completed: Optional[Dict[int, List[Dict[str, Any]]]] = None) -> Iterator[Dict[str, Any]]:
+        """Étape de rendu : une tâche par page (raster OCR, couche texte ou journal)"""
+        total_pages = len(pages)
+        completed = completed or {}
+        
+        # Seules les pages image non terminées sont rasterisées, par lots parallèles
+        ocr_page_numbers = [i for i in range(total_pages)
+                            if i not in text_layers and i + 1 not in completed]
+        rasters = iter_ocr_rasters(pages, ocr_page_numbers)
+        
         try:
-            # Conversion en niveaux de gris
-            gray = image.convert('L')
-            
-            # Détection des bords verticaux
-            import numpy as np
-            from PIL import ImageFilter
-            
-            # Filtre pour détecter les lignes verticales
-            kernel = np.array([[-1, -1, -1],
-                              [-1,  8, -1],
-                              [-1, -1, -1]])
-            
-            # Application du filtre
-            filtered = gray.filter(ImageFilter.Kernel((3, 3), kernel.flatten()))
+            for page_num in range(total_pages):
+                job = {"page": page_num + 1, "total": total_pages}
+                if page_num + 1 in completed:
+                    job["results"] = completed[page_num + 1]
+                elif page_num in text_layers:
+                    job["results"] = [self._text_layer_result(text_layers[page_num], page_num, pages)]
+                else:
+                    job["image"] = next(rasters)
+                    # Les régions des colonnes sont rendues dans le repère d'affichage
+                    job["scale"] = ocr_raster_scale(pages, page_num, job["image"])
+                    # Jeu de langues déjà détecté pour cette page : pas de nouvelle détection
+                    choice = self.language_detector.cached(self.app.state.current_file_path, page_num)
+                    if choice is not None:
+                        job["language_choice"] = choice
+                yield job
+        finally:
+            rasters.close()
+    
+    def _pdf_stage_ia(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Étape IA : amélioration optionnelle et évaluation des mots (threads du pool IA)"""
+        if "results" in job:
+            return job
+        
+        results = []
+        for segment in job.pop("segments"):
+            is_column = "column_index" in segment
+            text = segment["text"]
             
-            # Détection des zones de texte
-            # Cette méthode simplifiée divise l'image en colonnes basées sur la densité de pixels
+            if self.ia_enhancement_enabled:
+                text = self._enhance_text_with_ia(text, segment["language"]) if is_column else self._enhance_text_with_ia(text)
             
-            width, height = image.size
-            columns = []
+            evaluated_words = self.word_evaluator.evaluate_words(text)
             
-            # Division en 2 ou 3 colonnes selon la largeur
-            if width > 800:  # Largeur suffisante pour 2 colonnes
-                col_width = width // 2
-                
-                # Colonne gauche
-                left_col = image.crop((0, 0, col_width, height))
-                columns.append({
-                    "image": left_col,
-                    "region": {"x1": 0, "y1": 0, "x2": col_width, "y2": height}
-                })
-                
-                # Colonne droite
-                right_col = image.crop((col_width, 0, width, height))
-                columns.append({
-                    "image": right_col,
-                    "region": {"x1": col_width, "y1": 0, "x2": width, "y2": height}
-                })
-            else:
-                # Une seule colonne
-                columns.append({
-                    "image": image,
-                    "region": {"x1": 0, "y1": 0, "x2": width, "y2": height}
+            result = {
+                "text": text.strip(),
+                "confidence": 100.0,
+                "evaluated_words": evaluated_words,
+                "mode": "pdf_column" if is_column else "pdf_full",
+                "page": job["page"]
+            }
+            if is_column:
+                result.update({
+                    "column_index": segment["column_index"],
+                    "language": segment["language"],
+                    "region": segment["region"]
                 })
-            
-            return columns
-            
-        except Exception as e:
-            logging.error(f"Erreur détection colonnes: {e}")
-            # Fallback: retourner l'image entière
-            return [{
-                "image": image,
-                "region": {"x1": 0, "y1": 0, "x2": image.size[0], "y2": image.size[1]}
-            }]
+            results.append(result)
+        
+        job["results"] = results
+        return job
+    
+    def _text_layer_result(self, layer: TextLayerPage, page_num: int, pages: Sequence) -> Dict[str, Any]:
+        """Résultat d'une page native construit depuis sa couche texte (sans OCR)"""
+        # Boîtes exprimées dans le repère du raster d'affichage de cette page
+        # (chaque page est bornée à max_size selon sa propre taille)
+        dpi = page_display_dpi(pages, (layer.width, layer.height))
+        
+        return {
+            "text": layer.text,
+            "confidence": 100.0,
+            "evaluated_words": [],
+            "mode": "pdf_full",
+            "source": "text_layer",
+            "page": page_num + 1,
+            "word_positions": layer.word_positions(dpi)
+        }
+    
+    def _detect_columns(self, image: Image.Image) -> List[Dict[str, Any]]:
+        """Détecte les colonnes dans l'image"""
+        return detect_columns(image)
+    
+    def _prepare_for_tesseract(self, image: Image.Image, deskew: bool = True,
+                               keep_in_memory: bool = True) -> Tuple[Image.Image, Dict[str, Any]]:
+        """Page en niveaux de gris → page redressée (optionnel) et binarisée (Sauvola)"""
+        pipeline = PreprocessingPipeline.from_profile(
+            "tesseract", {"deskew": deskew},
+            cache=self.preprocessing_cache,
+            tiler=self.tiled_preprocessor
+        )
+        result = pipeline.run(np.asarray(image), keep_in_memory)
+        return result.to_pil(), result.metadata
+    
+    def _prepare_region_for_tesseract(self, image: Image.Image, box: Tuple[int, int, int, int]) -> Image.Image:
+        """Zone binarisée sans traiter toute la page : découpée avec la marge de la
+        fenêtre de Sauvola, binarisée puis recadrée (résultat identique, seuil local)"""
+        margin = stage_margin("binarize", {})
+        x1, y1, x2, y2 = box
+        outer = (max(0, x1 - margin), max(0, y1 - margin),
+                 min(image.width, x2 + margin), min(image.height, y2 + margin))
+        prepared, _ = self._prepare_for_tesseract(image.crop(outer), deskew=False)
+        return prepared.crop((x1 - outer[0], y1 - outer[1], x2 - outer[0], y2 - outer[1]))
+    
+    @staticmethod
+    def _scale_box(box: Tuple[int, int, int, int], factor: float) -> Tuple[int, int, int, int]:
+        """Change le repère d'une boîte (x1, y1, x2, y2) d'un facteur donné"""
+        return tuple(int(round(v * factor)) for v in box)
+    
+    @classmethod
+    def _region_box(cls, region: Dict[str, int], factor: float = 1.0) -> Tuple[int, int, int, int]:
+        """Boîte (x1, y1, x2, y2) d'une région, mise à l'échelle"""
+        return cls._scale_box((region["x1"], region["y1"], region["x2"], region["y2"]), factor)
+    
+    @classmethod
+    def _scale_region(cls, region: Dict[str, int], factor: float) -> Dict[str, int]:
+        """Région {x1, y1, x2, y2} mise à l'échelle"""
+        x1, y1, x2, y2 = cls._region_box(region, factor)
+        return {"x1": x1, "y1": y1, "x2": x2, "y2": y2}
     
     def _get_column_language(self, column_index: int, total_columns: int) -> str:
         """Détermine la langue pour une colonne donnée"""
-        if total_columns == 1:
-            return self.column_languages["center"]
-        elif total_columns == 2:
-            if column_index == 0:
-                return self.column_languages["left"]
-            else:
-                return self.column_languages["right"]
-        else:
-            return self.column_languages["center"]
+        return column_language(self.column_languages, column_index, total_columns)
     
     def _enhance_text_with_ia(self, text: str, language: str = "grc") -> str:
         """Améliore le texte avec l'IA via OpenRouter"""
@@ -4764,29 +5006,17 @@ Texte amélioré:"""
         
         def ocr_worker():
             try:
-                image = self.app.state.current_images[self.app.state.current_page]
+                image, scale = get_ocr_raster(self.app.state.current_images, self.app.state.current_page)
+                lang = self._page_language(image)
                 
-                # Découper la région
-                cropped_image = image.crop((region["x1"], region["y1"], region["x2"], region["y2"]))
+                # Découper et binariser la région (coordonnées d'affichage → raster OCR)
+                cropped_image = self._prepare_region_for_tesseract(image, self._region_box(region, 1 / scale))
                 
                 # OCR sur la région
                 config = SimpleConfig.TESSERACT_CONFIG["default"]
-                text = pytesseract.image_to_string(cropped_image, config=config, lang='grc+eng+fra')
-                
-                # Amélioration IA si activée
-                if self.ia_enhancement_enabled:
-                    text = self._enhance_text_with_ia(text)
+                text = self.ocr_backend.image_to_string(cropped_image, lang, config)
                 
-                # Évaluation IA
-                evaluated_words = self.word_evaluator.evaluate_words(text)
-                
-                results = [{
-                    "text": text.strip(),
-                    "confidence": 100.0,
-                    "evaluated_words": evaluated_words,
-                    "mode": "region",
-                    "region": region
-                }]
+                results = [self._region_result(text, region, "region")]
                 
                 self.app.after(0, self._on_ocr_complete, results)
                 
@@ -4809,6 +5039,40 @@ Texte amélioré:"""
         # Affichage des résultats dans l'interface principale
         self.app.display_ocr_results_in_main(results)
     
+    def _on_ocr_stream_start(self) -> None:
+        """Début d'un OCR en flux : efface les résultats précédents"""
+        self.app.state.ocr_results = []
+        self.app.ui_manager._clear_ocr_text()
+    
+    def _on_ocr_page_ready(self, results: List[Dict[str, Any]], page: int, total_pages: int) -> None:
+        """Appelé pour chaque page terminée d'un OCR en flux"""
+        self._append_streamed_results(results)
+        self.app.set_status(f"Page {page}/{total_pages} terminée")
+    
+    def _on_ocr_segment_ready(self, result: Dict[str, Any], status: str) -> None:
+        """Affiche un segment terminé (colonne, zone) sans attendre les autres"""
+        self._append_streamed_results([result])
+        self.app.set_status(status)
+    
+    def _append_streamed_results(self, results: List[Dict[str, Any]]) -> None:
+        """Ajoute des résultats arrivés en flux à ceux déjà affichés"""
+        is_first = not self.app.state.ocr_results
+        self.app.state.ocr_results.extend(results)
+        
+        if is_first:
+            self.app.display_ocr_results_in_main(self.app.state.ocr_results)
+        else:
+            self.app.append_ocr_results_in_main(results)
+    
+    def _on_ocr_stream_complete(self) -> None:
+        """Appelé quand toutes les pages d'un OCR en flux sont terminées"""
+        self.app.state.is_processing = False
+        self.app.set_status(SimpleConfig.MESSAGES["info"]["ocr_complete"])
+        
+        # Nettoyer la sélection
+        if hasattr(self.app, 'image_canvas'):
+            self.app.image_canvas.delete("selection")
+    
     def _on_ocr_error(self, error: Exception) -> None:
         """Appelé en cas d'erreur OCR"""
         self.app.state.is_processing = False
@@ -4844,6 +5108,12 @@ class SimpleOCRApp(tk.Tk):
         self.gesture_controller = GestureController(self)
         self.cache_system = CacheSystem()
         
+        # Cache LRU des pages rendues, adossé à AppState.pdf_cache / pdf_cache_order
+        self.page_cache = PageCache(self.state.pdf_cache, self.state.pdf_cache_order)
+        
+        # Journal des OCR de documents complets (reprise après interruption)
+        self.ocr_journal = OCRJobJournal(OCR_JOURNAL_PATH)
+        
         # Import et initialisation du moteur de recherche lemmatique
         try:
             from lemmatique_search import LemmatiqueSearchEngine, LemmatiqueSearchUI
@@ -4913,12 +5183,17 @@ class SimpleOCRApp(tk.Tk):
         filename = filedialog.askopenfilename(
             title="Sélectionner une image",
             filetypes=[
-                ("Images", "*.png *.jpg *.jpeg *.bmp *.tiff *.gif"),
+                ("Images", "*.png *.jpg *.jpeg *.bmp *.tif *.tiff *.gif"),
                 ("Tous les fichiers", "*.*")
             ]
         )
         self.file_manager.handle_file_open(filename)
     
+    def open_image_folder(self) -> None:
+        """Ouvre un dossier d'images comme un seul document (une page par image)"""
+        directory = filedialog.askdirectory(title="Sélectionner un dossier d'images")
+        self.file_manager.handle_file_open(directory)
+    
     def open_pdf(self) -> None:
         """Ouvre un PDF"""
         if not PDF_SUPPORT:
@@ -6080,12 +6355,12 @@ class SimpleOCRApp(tk.Tk):
 
     
     def load_page(self, page_number: int) -> None:
-        """Charge une page spécifique"""
-        if hasattr(self, 'pdf_pages') and self.pdf_pages:
-            if 0 <= page_number < len(self.pdf_pages):
-                self.current_page = page_number
-                self.load_pdf_page(page_number)
-                self.set_status(f"Page {page_number + 1}/{len(self.pdf_pages)}")
+        """Charge une page spécifique (rasterisée à la demande pour les PDF)"""
+        if self.state.current_images:
+            if 0 <= page_number < len(self.state.current_images):
+                self.state.current_page = page_number
+                self.display_current_image()
+                self.set_status(f"Page {page_number + 1}/{len(self.state.current_images)}")
     
     def export_results(self) -> None:
         """Exporte les résultats"""
@@ -6290,50 +6565,7 @@ class SimpleOCRApp(tk.Tk):
         self.ui_manager.ocr_text_widget.delete(1.0, tk.END)
         
         for result in results:
-            text = result.get('text', '')
-            evaluated_words = result.get('evaluated_words', [])
-            
-            if evaluated_words:
-                # Affichage avec codes couleur
-                for word_data in evaluated_words:
-                    word = word_data.get('word', '')
-                    confidence = word_data.get('confidence', 0)
-                    correction = word_data.get('correction', '')
-                    color = word_data.get('color', 'black')
-                    notes = word_data.get('notes', '')
-                    
-                    # Définir les couleurs
-                    color_map = {
-                        'green': '#28a745',    # Vert pour excellent
-                        'yellow': '#ffc107',   # Jaune pour correct
-                        'red': '#dc3545',      # Rouge pour erreur
-                        'blue': '#17a2b8'      # Bleu pour douteux
-                    }
-                    
-                    word_color = color_map.get(color, '#000000')
-                    
-                    # Insérer le mot avec sa couleur
-                    self.ui_manager.ocr_text_widget.insert(tk.END, f"{word} ", f"word_{color}")
-                    
-                    # Configurer la couleur du tag
-                    self.ui_manager.ocr_text_widget.tag_config(f"word_{color}", foreground=word_color)
-                    
-                    # Ajouter les informations de confiance si nécessaire
-                    if confidence < 80:
-                        self.ui_manager.ocr_text_widget.insert(tk.END, f"[{confidence}%] ", f"confidence")
-                        self.ui_manager.ocr_text_widget.tag_config("confidence", foreground="#6c757d", font=("Segoe UI", 9))
-                    
-                    # Ajouter la correction si différente
-                    if correction and correction != word:
-                        self.ui_manager.ocr_text_widget.insert(tk.END, f"→{correction} ", f"correction")
-                        self.ui_manager.ocr_text_widget.tag_config("correction", foreground="#fd7e14", font=("Segoe UI", 9, "italic"))
-                
-                # Nouvelle ligne
-                self.ui_manager.ocr_text_widget.insert(tk.END, "\n\n")
-                
-            else:
-                # Affichage simple si pas d'évaluation
-                self.ui_manager.ocr_text_widget.insert(tk.END, f"{text}\n\n")
+            self._insert_ocr_result(result)
         
         # Garder le widget éditable
         self.ui_manager.ocr_text_widget.config(state=tk.NORMAL)
@@ -6344,6 +6576,64 @@ class SimpleOCRApp(tk.Tk):
         # Ajouter les boutons d'édition
         self._add_editing_buttons()
     
+    def append_ocr_results_in_main(self, results: List[Dict[str, Any]]) -> None:
+        """Ajoute des résultats OCR à la fin du texte affiché (OCR en flux)"""
+        if not results:
+            return
+        
+        self.text_editor.set_ocr_results(self.state.ocr_results)
+        self.ui_manager.ocr_text_widget.config(state=tk.NORMAL)
+        
+        for result in results:
+            self._insert_ocr_result(result)
+    
+    def _insert_ocr_result(self, result: Dict[str, Any]) -> None:
+        """Insère un résultat OCR dans le widget de texte avec ses codes couleur"""
+        text = result.get('text', '')
+        evaluated_words = result.get('evaluated_words', [])
+        
+        if evaluated_words:
+            # Affichage avec codes couleur
+            for word_data in evaluated_words:
+                word = word_data.get('word', '')
+                confidence = word_data.get('confidence', 0)
+                correction = word_data.get('correction', '')
+                color = word_data.get('color', 'black')
+                notes = word_data.get('notes', '')
+                
+                # Définir les couleurs
+                color_map = {
+                    'green': '#28a745',    # Vert pour excellent
+                    'yellow': '#ffc107',   # Jaune pour correct
+                    'red': '#dc3545',      # Rouge pour erreur
+                    'blue': '#17a2b8'      # Bleu pour douteux
+                }
+                
+                word_color = color_map.get(color, '#000000')
+                
+                # Insérer le mot avec sa couleur
+                self.ui_manager.ocr_text_widget.insert(tk.END, f"{word} ", f"word_{color}")
+                
+                # Configurer la couleur du tag
+                self.ui_manager.ocr_text_widget.tag_config(f"word_{color}", foreground=word_color)
+                
+                # Ajouter les informations de confiance si nécessaire
+                if confidence < 80:
+                    self.ui_manager.ocr_text_widget.insert(tk.END, f"[{confidence}%] ", f"confidence")
+                    self.ui_manager.ocr_text_widget.tag_config("confidence", foreground="#6c757d", font=("Segoe UI", 9))
+                
+                # Ajouter la correction si différente
+                if correction and correction != word:
+                    self.ui_manager.ocr_text_widget.insert(tk.END, f"→{correction} ", f"correction")
+                    self.ui_manager.ocr_text_widget.tag_config("correction", foreground="#fd7e14", font=("Segoe UI", 9, "italic"))
+            
+            # Nouvelle ligne
+            self.ui_manager.ocr_text_widget.insert(tk.END, "\n\n")
+            
+        else:
+            # Affichage simple si pas d'évaluation
+            self.ui_manager.ocr_text_widget.insert(tk.END, f"{text}\n\n")
+    
     def _add_editing_buttons(self) -> None:
         """Ajoute les boutons d'édition du texte OCR"""
         # Créer un frame pour les boutons d'édition
@@ -6462,12 +6752,19 @@ class SimpleOCRApp(tk.Tk):
         if self.state.current_page < len(self.state.current_images) - 1:
             self.state.current_page += 1
             self.load_page(self.state.current_page)
+            self._prefetch_page(self.state.current_page + 1)
     
     def previous_page(self) -> None:
         """Page précédente"""
         if self.state.current_page > 0:
             self.state.current_page -= 1
             self.load_page(self.state.current_page)
+            self._prefetch_page(self.state.current_page - 1)
+    
+    def _prefetch_page(self, page_number: int) -> None:
+        """Prépare en arrière-plan la page voisine dans le cache de pages"""
+        if hasattr(self.state.current_images, "prefetch"):
+            self.state.current_images.prefetch(page_number)
     
     def show_about(self) -> None:
         """Affiche les informations sur l'application"""
@@ -0,0 +1,203 @@
+"""
+Moteurs d'exécution de Tesseract pour OCR Grec
+==============================================
+pytesseract écrit chaque image dans un PNG temporaire, lance `tesseract`,
+puis relit le résultat sur le disque : pour une page de 300 dpi, l'encodage
+PNG représente à lui seul une bonne part du temps. Deux moteurs le
+remplacent, avec la même interface (`image_to_string`, `image_to_data` au
+format Output.DICT de pytesseract) :
+
+- `TesserocrEngine` pilote libtesseract dans le processus (tesserocr) ;
+  l'instance reste initialisée, le modèle n'est chargé qu'une fois ;
+- `TesseractCLIEngine` passe l'image non compressée (PNM) sur l'entrée
+  standard et lit le résultat sur la sortie standard, sans fichier.
+
+Le moteur est choisi d'après Config.PERFORMANCE["ocr_backend"] (auto :
+tesserocr s'il est installé) ; une instance tesserocr qui ne s'initialise pas
+est remplacée par l'exécutable. Les instances sont gérées par le pool de
+moteurs (engine_pool). Seul tesserocr garde les modèles chargés : l'exécutable
+est un repli, qui lance un processus et recharge les modèles à chaque appel.
+"""
+
+import io
+import logging
+import re
+import shlex
+import subprocess
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytesseract
+from PIL import Image
+
+from config import Config
+from process_pool import limit_openmp_threads
+
+# Avant libtesseract : libgomp lit sa limite de threads une seule fois, au chargement
+limit_openmp_threads()
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Colonnes entières de la sortie TSV (conf est un flottant, text une chaîne)
+TSV_INT_COLUMNS = ("level", "page_num", "block_num", "par_num", "line_num", "word_num",
+                   "left", "top", "width", "height")
+TSV_COLUMNS = TSV_INT_COLUMNS + ("conf", "text")
+
+_OPTION_RE = re.compile(r"--(oem|psm)\s+(\d+)")
+
+
+def parse_tesseract_config(config: str) -> Tuple[Optional[int], Optional[int], Dict[str, str]]:
+    """Décompose une chaîne de configuration : (oem, psm, variables -c)"""
+    options = dict(_OPTION_RE.findall(config or ""))
+    variables: Dict[str, str] = {}
+    tokens = shlex.split(config or "")
+    for i, token in enumerate(tokens):
+        if token == "-c" and i + 1 < len(tokens) and "=" in tokens[i + 1]:
+            key, value = tokens[i + 1].split("=", 1)
+            variables[key] = value
+    oem = int(options["oem"]) if "oem" in options else None
+    psm = int(options["psm"]) if "psm" in options else None
+    return oem, psm, variables
+
+
+def parse_tsv(tsv: str) -> Dict[str, List[Any]]:
+    """Sortie TSV de Tesseract → dictionnaire au format pytesseract.Output.DICT"""
+    data: Dict[str, List[Any]] = {column: [] for column in TSV_COLUMNS}
+    for line in tsv.splitlines():
+        fields = line.split("\t")
+        if len(fields) < len(TSV_COLUMNS) - 1 or fields[0] == "level":
+            continue
+        # Les éléments sans texte n'ont pas toujours de 12e colonne
+        fields += [""] * (len(TSV_COLUMNS) - len(fields))
+        try:
+            values = [int(value) for value in fields[:10]] + [float(fields[10]), fields[11]]
+        except ValueError:
+            continue
+        for column, value in zip(TSV_COLUMNS, values):
+            data[column].append(value)
+    return data
+
+
+def encode_pnm(image: Image.Image) -> bytes:
+    """Image non compressée (PBM/PGM/PPM) : aucun coût d'encodage"""
+    if image.mode not in ("1", "L", "RGB"):
+        image = image.convert("L" if image.mode in ("I;16", "I", "F", "LA") else "RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PPM")
+    return buffer.getvalue()
+
+
+class OCRBackend(ABC):
+    """Interface commune des moteurs Tesseract"""
+
+    name = "abstract"
+
+    @abstractmethod
+    def image_to_string(self, image: Image.Image, lang: str, config: str = "") -> str:
+        """Texte reconnu"""
+
+    @abstractmethod
+    def image_to_data(self, image: Image.Image, lang: str, config: str = "") -> Dict[str, List[Any]]:
+        """Mots, boîtes et confiances (format pytesseract.Output.DICT)"""
+
+    def close(self) -> None:
+        """Libère les ressources du moteur"""
+
+
+class TesseractCLIEngine:
+    """Exécutable tesseract alimenté par l'entrée standard (PNM), sans fichier temporaire"""
+
+    name = "cli"
+
+    def __init__(self, lang: str, tesseract_cmd: Optional[str] = None, timeout: Optional[float] = None) -> None:
+        self.lang = lang
+        self.tesseract_cmd = tesseract_cmd or pytesseract.pytesseract.tesseract_cmd
+        self.timeout = timeout
+
+    def _run(self, image: Image.Image, config: str, extension: Optional[str] = None) -> str:
+        command = [self.tesseract_cmd, "stdin", "stdout", "-l", self.lang] + shlex.split(config or "")
+        if extension:
+            command.append(extension)
+        process = subprocess.run(command, input=encode_pnm(image), capture_output=True, timeout=self.timeout)
+        if process.returncode != 0:
+            raise pytesseract.TesseractError(process.returncode, process.stderr.decode("utf-8", "replace").strip())
+        return process.stdout.decode("utf-8", "replace")
+
+    def image_to_string(self, image: Image.Image, config: str = "") -> str:
+        return self._run(image, config)
+
+    def image_to_data(self, image: Image.Image, config: str = "") -> Dict[str, List[Any]]:
+        return parse_tsv(self._run(image, config, "tsv"))
+
+    def close(self) -> None:
+        pass
+
+
+class TesserocrEngine:
+    """libtesseract dans le processus, initialisé une fois pour un jeu de langues.
+    Une instance n'est pas réentrante : un seul appel à la fois."""
+
+    name = "tesserocr"
+
+    def __init__(self, lang: str, config: str = "", tessdata_path: Optional[str] = None) -> None:
+        if not TESSEROCR_AVAILABLE:
+            raise ImportError("tesserocr n'est pas installé")
+        oem, _, variables = parse_tesseract_config(config)
+        # tesserocr.OEM est un espace de constantes entières, pas un type à instancier
+        kwargs = {"lang": lang, "oem": tesserocr.OEM.DEFAULT if oem is None else oem}
+        if tessdata_path:
+            kwargs["path"] = tessdata_path
+        self.lang = lang
+        self.api = tesserocr.PyTessBaseAPI(**kwargs)
+        for name, value in variables.items():
+            self.api.SetVariable(name, value)
+
+    def _set_image(self, image: Image.Image, config: str) -> None:
+        _, psm, _ = parse_tesseract_config(config)
+        self.api.SetPageSegMode(tesserocr.PSM.AUTO if psm is None else psm)
+        self.api.SetImage(image)
+
+    def image_to_string(self, image: Image.Image, config: str = "") -> str:
+        self._set_image(image, config)
+        return self.api.GetUTF8Text()
+
+    def image_to_data(self, image: Image.Image, config: str = "") -> Dict[str, List[Any]]:
+        self._set_image(image, config)
+        self.api.Recognize()
+        return parse_tsv(self.api.GetTSVText(0))
+
+    def close(self) -> None:
+        self.api.End()
+
+
+def engine_key(lang: str, config: str = "") -> Tuple[str, Optional[int], Tuple[Tuple[str, str], ...]]:
+    """Ce qui fixe une instance initialisée : langues, oem et variables -c (pas le psm)"""
+    oem, _, variables = parse_tesseract_config(config)
+    return lang, oem, tuple(sorted(variables.items()))
+
+
+def resolve_backend_kind(kind: Optional[str] = None) -> str:
+    """« tesserocr » ou « cli », d'après le réglage (auto : tesserocr s'il est installé)"""
+    kind = kind or Config.PERFORMANCE.get("ocr_backend", "auto")
+    if kind in ("auto", "tesserocr") and TESSEROCR_AVAILABLE:
+        return "tesserocr"
+    if kind in ("auto", "tesserocr"):
+        logging.warning("tesserocr indisponible, exécutable tesseract utilisé "
+                        "(un processus par appel, modèles rechargés à chaque fois)")
+    return "cli"
+
+
+def create_engine(kind: str, lang: str, config: str = "", tessdata_path: Optional[str] = None):
+    """Nouvelle instance de moteur pour un jeu de langues ; si libtesseract ne
+    s'initialise pas (version, tessdata), l'exécutable tesseract prend le relais"""
+    if kind == "tesserocr":
+        try:
+            return TesserocrEngine(lang, config, tessdata_path)
+        except Exception as e:
+            logging.warning(f"Initialisation de tesserocr impossible pour {lang} ({e}), "
+                            f"exécutable tesseract utilisé")
+    return TesseractCLIEngine(lang)
@@ -0,0 +1,83 @@
+"""
+Exploitation des sorties image_to_data de Tesseract pour OCR Grec
+=================================================================
+Une seule passe `image_to_data` suffit : le texte est reconstruit à partir
+des numéros de bloc, de paragraphe et de ligne (même mise en forme que
+`image_to_string`), et les boîtes des mots sont conservées.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+# Clé de ligne : (bloc, paragraphe, ligne)
+LineKey = Tuple[int, int, int]
+
+
+def _confidence(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return -1.0
+
+
+def word_boxes(data: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Mots reconnus avec boîte (x1, y1, x2, y2), confiance et position dans la page"""
+    words = []
+    for i, text in enumerate(data.get("text", [])):
+        text = str(text).strip()
+        conf = _confidence(data["conf"][i])
+        # Confiance -1 : page, bloc, paragraphe ou ligne (éléments sans texte)
+        if not text or conf < 0:
+            continue
+        x, y, w, h = data["left"][i], data["top"][i], data["width"][i], data["height"][i]
+        words.append({
+            "text": text,
+            "bbox": (x, y, x + w, y + h),
+            "confidence": conf,
+            "block": data["block_num"][i],
+            "paragraph": data["par_num"][i],
+            "line": data["line_num"][i]
+        })
+    return words
+
+
+def group_lines(words: List[Dict[str, Any]]) -> Dict[LineKey, List[Dict[str, Any]]]:
+    """Mots regroupés par ligne, dans l'ordre de lecture de Tesseract"""
+    lines: Dict[LineKey, List[Dict[str, Any]]] = {}
+    for word in words:
+        lines.setdefault((word["block"], word["paragraph"], word["line"]), []).append(word)
+    return lines
+
+
+def text_from_words(words: List[Dict[str, Any]]) -> str:
+    """Texte mis en forme : mots séparés par des espaces, lignes par des retours,
+    paragraphes et blocs par une ligne vide"""
+    parts = []
+    previous = None
+    for (block, paragraph, _), line_words in group_lines(words).items():
+        if previous is not None:
+            parts.append("\n\n" if (block, paragraph) != previous else "\n")
+        parts.append(" ".join(word["text"] for word in line_words))
+        previous = (block, paragraph)
+    return "".join(parts)
+
+
+def mean_confidence(data: Dict[str, List[Any]]) -> float:
+    """Confiance moyenne des mots reconnus (0 si aucun)"""
+    confidences = [conf for conf in (_confidence(value) for value in data.get("conf", [])) if conf > 0]
+    return sum(confidences) / len(confidences) if confidences else 0.0
+
+
+def text_from_positions(words: List[Dict[str, Any]]) -> str:
+    """Texte reconstruit d'après la géométrie des mots, pour les passes en mode
+    épars (PSM 11) où les numéros de bloc et de ligne ne suivent plus la lecture"""
+    lines: List[Dict[str, Any]] = []
+    for word in sorted(words, key=lambda word: (word["bbox"][1] + word["bbox"][3]) / 2):
+        x1, y1, x2, y2 = word["bbox"]
+        center = (y1 + y2) / 2
+        # Même ligne si le centre du mot tombe dans la hauteur de la ligne courante
+        if lines and lines[-1]["top"] <= center <= lines[-1]["bottom"]:
+            lines[-1]["words"].append(word)
+        else:
+            lines.append({"top": y1, "bottom": y2, "words": [word]})
+    return "\n".join(" ".join(word["text"] for word in sorted(line["words"], key=lambda word: word["bbox"][0]))
+                     for line in lines)
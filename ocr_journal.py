@@ -0,0 +1,239 @@
+"""
+Journal des travaux OCR pour OCR Grec
+=====================================
+Enregistre page par page les résultats d'un OCR de document complet dans une
+base SQLite. Un travail est identifié par l'empreinte du document et par les
+réglages OCR : relancer le même travail reprend à la première page manquante,
+les pages déjà terminées sont relues directement depuis le journal.
+Les travaux inactifs depuis trop longtemps, ou au-delà d'un nombre maximal,
+sont supprimés à l'ouverture du journal et à la fin de chaque travail.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import Config
+from page_source import IMAGE_EXTENSIONS
+
+# Taille des blocs lus pour l'empreinte du document
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _document_files(path: str) -> List[str]:
+    """Fichiers qui composent le document (le fichier, ou les pages d'un dossier)"""
+    if os.path.isdir(path):
+        # Mêmes fichiers que ImageSequenceSource.from_directory : .DS_Store,
+        # Thumbs.db et autres fichiers réécrits par le système sont ignorés
+        return [os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith(IMAGE_EXTENSIONS) and os.path.isfile(os.path.join(path, name))]
+    return [path]
+
+
+def document_hash(path: str) -> str:
+    """Empreinte SHA-256 du contenu du document (fichier ou dossier d'images)"""
+    digest = hashlib.sha256()
+    for file_path in _document_files(path):
+        if file_path != path:
+            digest.update(os.path.basename(file_path).encode("utf-8"))
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def settings_key(settings: Dict[str, Any]) -> str:
+    """Forme canonique des réglages OCR (indépendante de l'ordre des clés)"""
+    return json.dumps(settings, sort_keys=True, ensure_ascii=False)
+
+
+class OCRJob:
+    """Travail OCR en cours : lecture des pages terminées, écriture des nouvelles"""
+
+    def __init__(self, journal: "OCRJobJournal", job_key: str, total_pages: int) -> None:
+        self.journal = journal
+        self.job_key = job_key
+        self.total_pages = total_pages
+
+    def completed_pages(self) -> Dict[int, List[Dict[str, Any]]]:
+        """Résultats des pages déjà terminées (numéro de page 1-based → résultats)"""
+        return self.journal.completed_pages(self.job_key)
+
+    def write_page(self, page: int, results: List[Dict[str, Any]]) -> None:
+        """Enregistre les résultats d'une page terminée"""
+        self.journal.record_page(self.job_key, page, results)
+
+    def finish(self) -> None:
+        """Marque le travail comme terminé"""
+        self.journal.finish_job(self.job_key)
+
+
+class OCRJobJournal:
+    """Journal SQLite des travaux OCR, une ligne par page terminée"""
+
+    def __init__(self, db_path: Path, max_age_days: Optional[float] = None,
+                 max_jobs: Optional[int] = None) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.max_age_days = max_age_days or Config.PERFORMANCE["ocr_journal_max_age_days"]
+        self.max_jobs = max_jobs or Config.PERFORMANCE["ocr_journal_max_jobs"]
+
+        # Empreintes déjà calculées : (chemin, tailles, dates de modification) → hash
+        self._hashes: Dict[Tuple, str] = {}
+
+        self._init_database()
+        # Le fichier ne rétrécit qu'avec VACUUM : fait une fois, à l'ouverture
+        if self.prune():
+            self._vacuum()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _init_database(self) -> None:
+        """Crée les tables du journal"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS ocr_jobs (
+                        job_key TEXT PRIMARY KEY,
+                        document_hash TEXT,
+                        settings TEXT,
+                        file_path TEXT,
+                        total_pages INTEGER,
+                        status TEXT,
+                        created_at REAL,
+                        updated_at REAL
+                    )
+                ''')
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS ocr_job_pages (
+                        job_key TEXT REFERENCES ocr_jobs(job_key) ON DELETE CASCADE,
+                        page INTEGER,
+                        results TEXT,
+                        completed_at REAL,
+                        PRIMARY KEY (job_key, page)
+                    )
+                ''')
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_updated ON ocr_jobs(updated_at)')
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _document_hash(self, path: str) -> str:
+        stats = [os.stat(file_path) for file_path in _document_files(path)]
+        key = (os.path.abspath(path),) + tuple((stat.st_size, stat.st_mtime) for stat in stats)
+        if key not in self._hashes:
+            self._hashes[key] = document_hash(path)
+        return self._hashes[key]
+
+    def open_job(self, file_path: str, settings: Dict[str, Any], total_pages: int) -> OCRJob:
+        """Ouvre le travail (document, réglages), en le créant s'il n'existe pas"""
+        doc_hash = self._document_hash(file_path)
+        settings_text = settings_key(settings)
+        job_key = hashlib.sha256(f"{doc_hash}|{settings_text}".encode("utf-8")).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute('''
+                    INSERT OR IGNORE INTO ocr_jobs
+                    (job_key, document_hash, settings, file_path, total_pages, status, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, 'running', ?, ?)
+                ''', (job_key, doc_hash, settings_text, file_path, total_pages, now, now))
+                conn.execute('''
+                    UPDATE ocr_jobs SET file_path = ?, updated_at = ? WHERE job_key = ?
+                ''', (file_path, now, job_key))
+                conn.commit()
+            finally:
+                conn.close()
+
+        return OCRJob(self, job_key, total_pages)
+
+    def completed_pages(self, job_key: str) -> Dict[int, List[Dict[str, Any]]]:
+        """Résultats enregistrés d'un travail, par numéro de page"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    'SELECT page, results FROM ocr_job_pages WHERE job_key = ? ORDER BY page',
+                    (job_key,)
+                ).fetchall()
+            finally:
+                conn.close()
+
+        completed = {}
+        for page, results in rows:
+            try:
+                completed[page] = json.loads(results)
+            except ValueError as e:
+                # Page illisible : elle sera refaite
+                logging.warning(f"Journal OCR: page {page} illisible, à refaire ({e})")
+        return completed
+
+    def record_page(self, job_key: str, page: int, results: List[Dict[str, Any]]) -> None:
+        """Enregistre une page terminée (validée immédiatement sur disque)"""
+        data = json.dumps(results, ensure_ascii=False, default=str)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute('''
+                    INSERT OR REPLACE INTO ocr_job_pages (job_key, page, results, completed_at)
+                    VALUES (?, ?, ?, ?)
+                ''', (job_key, page, data, now))
+                conn.execute('UPDATE ocr_jobs SET updated_at = ? WHERE job_key = ?', (now, job_key))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def finish_job(self, job_key: str) -> None:
+        """Marque un travail comme terminé"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute('UPDATE ocr_jobs SET status = ?, updated_at = ? WHERE job_key = ?',
+                             ('complete', time.time(), job_key))
+                conn.commit()
+            finally:
+                conn.close()
+        self.prune()
+
+    def prune(self) -> int:
+        """Supprime les travaux (et leurs pages) trop anciens ou en surnombre ; retourne leur nombre"""
+        cutoff = time.time() - self.max_age_days * 86400
+        with self._lock:
+            conn = self._connect()
+            try:
+                removed = conn.execute('DELETE FROM ocr_jobs WHERE updated_at < ?', (cutoff,)).rowcount
+                removed += conn.execute('''
+                    DELETE FROM ocr_jobs WHERE job_key NOT IN (
+                        SELECT job_key FROM ocr_jobs ORDER BY updated_at DESC LIMIT ?
+                    )
+                ''', (self.max_jobs,)).rowcount
+                conn.commit()
+            finally:
+                conn.close()
+        if removed:
+            logging.info(f"Journal OCR: {removed} travail(aux) ancien(s) supprimé(s)")
+        return removed
+
+    def _vacuum(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute('VACUUM')
+            except sqlite3.Error as e:
+                logging.warning(f"Journal OCR: compactage impossible ({e})")
+            finally:
+                conn.close()
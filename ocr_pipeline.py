@@ -0,0 +1,203 @@
+"""
+Pipeline OCR en flux pour OCR Grec
+==================================
+Enchaîne des étapes (rendu → prétraitement → OCR → IA) exécutées chacune dans
+son thread et reliées par des files bornées : chaque page terminée sort du
+pipeline dès qu'elle est prête et la mémoire reste constante quelle que soit
+la longueur du document.
+
+Une étape peut être répartie sur un pool (`ParallelStage`) : plusieurs pages
+y sont traitées en même temps, mais elles sortent toujours dans l'ordre.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+Stage = Tuple[str, Callable[[Any], Any]]
+
+# Marqueur de fin de flux
+_END = object()
+
+# Nombre d'éléments en attente entre deux étapes
+DEFAULT_QUEUE_SIZE = 2
+
+
+class _Failure:
+    """Exception levée par une étape, transmise jusqu'au consommateur"""
+
+    def __init__(self, stage: str, error: Exception) -> None:
+        self.stage = stage
+        self.error = error
+
+
+class ParallelStage:
+    """Étape répartie sur un exécuteur : au plus `window` éléments en cours,
+    sortie dans l'ordre d'entrée. Avec un pool de processus, `function` doit
+    être sérialisable (fonction de module, éventuellement via partial)."""
+
+    def __init__(self, name: str, function: Callable[[Any], Any], executor: Executor,
+                 window: int = 2, bypass: Optional[Callable[[Any], bool]] = None,
+                 on_complete: Optional[Callable[[Any, int], None]] = None) -> None:
+        self.name = name
+        self.function = function
+        self.executor = executor
+        self.window = max(1, window)
+        # Éléments transmis tels quels, sans passer par l'exécuteur
+        self.bypass = bypass
+        # Appelé à chaque élément terminé (dans l'ordre d'achèvement) avec le nombre terminé
+        self.on_complete = on_complete
+        self.busy_time = 0.0
+        self.completed = 0
+        self._lock = threading.Lock()
+
+    def submit(self, item: Any) -> Future:
+        if self.bypass and self.bypass(item):
+            future: Future = Future()
+            future.set_result(item)
+            self._done(future, None)
+            return future
+
+        start = time.perf_counter()
+        future = self.executor.submit(self.function, item)
+        future.add_done_callback(lambda done: self._done(done, start))
+        return future
+
+    def _done(self, future: Future, start: Optional[float]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            if start is not None:
+                # Temps cumulé des tâches (elles se recouvrent)
+                self.busy_time += time.perf_counter() - start
+            self.completed += 1
+            completed = self.completed
+        if self.on_complete:
+            self.on_complete(future.result(), completed)
+
+
+class StreamingPipeline:
+    """Pipeline d'étapes en threads reliées par des files bornées"""
+
+    def __init__(self, stages: List[Union[Stage, ParallelStage]], queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.stage_times: Dict[str, float] = {self._stage_name(stage): 0.0 for stage in stages}
+
+    @staticmethod
+    def _stage_name(stage: Union[Stage, ParallelStage]) -> str:
+        return stage.name if isinstance(stage, ParallelStage) else stage[0]
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """Fait passer les éléments de `source` dans les étapes, dans l'ordre"""
+        stop_event = threading.Event()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+
+        def put(target: queue.Queue, item: Any) -> bool:
+            while not stop_event.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def feed() -> None:
+            # Première étape implicite : la source (rendu des pages)
+            iterator = iter(source)
+            try:
+                for item in iterator:
+                    if not put(queues[0], item):
+                        return
+            except Exception as e:
+                put(queues[0], _Failure("source", e))
+                return
+            finally:
+                # Libère le rendu en cours (lots préparés à l'avance)
+                if hasattr(iterator, "close"):
+                    iterator.close()
+            put(queues[0], _END)
+
+        def work(index: int, name: str, function: Callable[[Any], Any]) -> None:
+            inbox, outbox = queues[index], queues[index + 1]
+            while not stop_event.is_set():
+                try:
+                    item = inbox.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is _END or isinstance(item, _Failure):
+                    put(outbox, item)
+                    return
+                try:
+                    start = time.perf_counter()
+                    result = function(item)
+                    self.stage_times[name] += time.perf_counter() - start
+                except Exception as e:
+                    put(outbox, _Failure(name, e))
+                    return
+                if not put(outbox, result):
+                    return
+
+        def work_parallel(index: int, stage: ParallelStage) -> None:
+            inbox, outbox = queues[index], queues[index + 1]
+            pending: Deque[Future] = deque()
+            finished = False
+            try:
+                while not stop_event.is_set():
+                    # Seule la tête de file peut sortir : l'ordre d'entrée est conservé
+                    while pending and pending[0].done():
+                        if not put(outbox, pending.popleft().result()):
+                            return
+                    if finished and not pending:
+                        put(outbox, _END)
+                        return
+                    if finished or len(pending) >= stage.window:
+                        wait([pending[0]], timeout=0.1)
+                        continue
+                    try:
+                        item = inbox.get(timeout=0.02 if pending else 0.1)
+                    except queue.Empty:
+                        continue
+                    if item is _END:
+                        finished = True
+                    elif isinstance(item, _Failure):
+                        put(outbox, item)
+                        return
+                    else:
+                        pending.append(stage.submit(item))
+            except Exception as e:
+                put(outbox, _Failure(stage.name, e))
+            finally:
+                for future in pending:
+                    future.cancel()
+                self.stage_times[stage.name] = stage.busy_time
+
+        threads = [threading.Thread(target=feed, daemon=True, name="pipeline-source")]
+        for i, stage in enumerate(self.stages):
+            name = self._stage_name(stage)
+            if isinstance(stage, ParallelStage):
+                target, args = work_parallel, (i, stage)
+            else:
+                target, args = work, (i, name, stage[1])
+            threads.append(threading.Thread(target=target, args=args, daemon=True, name=f"pipeline-{name}"))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _END:
+                    break
+                if isinstance(item, _Failure):
+                    logging.error(f"Échec de l'étape {item.stage} du pipeline: {item.error}")
+                    raise item.error
+                yield item
+        finally:
+            # Arrêt des étapes (consommateur interrompu ou erreur)
+            stop_event.set()
+            logging.info("Pipeline OCR: " + ", ".join(
+                f"{name} {seconds:.1f}s" for name, seconds in self.stage_times.items()))
@@ -34,6 +34,25 @@ class MacConfig:
         "line": "--oem 3 --psm 7 -c tessedit_do_invert=0"
     }
     
+    # Prétraitement : profil par défaut ("auto" : "scan" pour les scans
+    # monochromes, variante en niveaux de gris des mêmes étapes, "standard"
+    # sinon), étapes forcées et paramètres par étape.
+    # Tesseract reçoit une page redressée et binarisée (Sauvola)
+    preprocessing_config = {
+        "profile": "auto",
+        "monochrome_profile": "scan",
+        "color_profile": "standard",
+        "overrides": {"deskew": True, "binarize": True},
+        "params": {
+            "deskew": {"max_angle": 5.0, "work_size": 1000},
+            "binarize": {"method": "sauvola", "window": 31, "k": 0.2},
+            "clahe": {"clip_limit": 3.0, "tile_grid": 8},
+            # Débruitage adaptatif : force déduite du bruit estimé, ignoré sous min_sigma
+            "denoise": {"adaptive": True, "min_sigma": 3.0, "strength_factor": 1.0,
+                        "h": 10, "h_color": 10, "template_window": 7, "search_window": 21}
+        }
+    }
+    
     # Configuration UI Mac
     ui_config = {
         "window_title": "OCR Grec Mac v6.0",
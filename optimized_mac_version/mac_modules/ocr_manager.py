@@ -8,17 +8,21 @@ import sys
 import logging
 import threading
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pytesseract
-import cv2
 import numpy as np
 from PIL import Image, ImageEnhance, ImageFilter
 
 # Import de la configuration Mac
 from mac_config import mac_config
+from page_store import ocr_page_array
+from preprocessing import PreprocessingCache, PreprocessingPipeline, PreprocessingResult, is_monochrome
+from tiled_preprocessing import TiledPreprocessor
+from candidate_ocr import CandidateConfig, CandidateOCR
+from engine_pool import get_engine_pool
 
 
 @dataclass
@@ -31,6 +35,9 @@ class OCRResult:
     image_path: str
     preprocessed: bool = False
     enhanced: bool = False
+    preprocessing_times: Dict[str, float] = field(default_factory=dict)
+    preprocessing_metadata: Dict[str, Any] = field(default_factory=dict)
+    word_boxes: List[Dict[str, Any]] = field(default_factory=list)
 
 
 class MacOptimizedOCRManager:
@@ -40,6 +47,21 @@ class MacOptimizedOCRManager:
         self.app = app
         self.is_processing = False
         self.current_task_id = None
+        
+        # Profils de prétraitement choisis par document (chemin → profil)
+        self.document_profiles: Dict[str, str] = {}
+        self.last_preprocessing: Optional[PreprocessingResult] = None
+        
+        # Pages déjà prétraitées (mémoire + disque, adressées par leur contenu) :
+        # un nouvel OCR de la même page ne les recalcule pas
+        self.preprocessing_cache = PreprocessingCache(store_dir=mac_config.paths["cache"] / "preprocessed")
+        
+        # Folios de plus de ~24 Mpx : étapes locales en tuiles sur le pool de processus
+        self.tiled_preprocessor = TiledPreprocessor(max_workers=mac_config.get_performance_config()["max_threads"])
+        
+        # Configurations de langue reconnues en parallèle (OpenMP borné dans chaque processus)
+        self.candidate_ocr = CandidateOCR(max_workers=mac_config.get_performance_config()["max_threads"])
+        
         self.setup_tesseract()
     
     def setup_tesseract(self) -> None:
@@ -93,11 +115,17 @@ class MacOptimizedOCRManager:
         try:
             self.app.set_status("🔍 OCR en cours...")
             
-            # Récupérer l'image courante
-            current_image = self.app.state.current_images[self.app.state.current_page]
+            pages, index = self.app.state.current_images, self.app.state.current_page
+            
+            # Profil choisi sur la page en couleurs : le raster OCR est toujours gris
+            profile = self._resolve_preprocessing_profile(pages, index)
+            
+            # Récupérer les pixels OCR de la page courante : raster OCR en niveaux
+            # de gris (vue memmap sans copie si adossée au disque)
+            current_image = ocr_page_array(pages, index)
             
             # Préprocesser l'image
-            preprocessed_image = self._preprocess_image(current_image)
+            preprocessed_image = self._preprocess_image(current_image, profile)
             
             # Effectuer l'OCR
             results = self._extract_text(preprocessed_image)
@@ -118,42 +146,51 @@ class MacOptimizedOCRManager:
             self.is_processing = False
             self.current_task_id = None
     
-    def _preprocess_image(self, image: Image.Image) -> Image.Image:
+    def set_preprocessing_profile(self, profile: str, file_path: Optional[str] = None) -> None:
+        """Choisit le profil de prétraitement d'un document (courant par défaut)"""
+        file_path = file_path or self.app.state.current_file_path
+        self.document_profiles[file_path] = profile
+    
+    def _resolve_preprocessing_profile(self, pages, index: int) -> str:
+        """Profil du document courant : profil choisi, sinon détecté sur la page d'affichage"""
+        settings = mac_config.preprocessing_config
+        profile = self.document_profiles.get(self.app.state.current_file_path, settings["profile"])
+        if profile == "auto":
+            # Page d'affichage (en couleurs, déjà en cache puisqu'elle est affichée)
+            page = np.asarray(pages[index])
+            profile = settings["monochrome_profile"] if is_monochrome(page) else settings["color_profile"]
+        return profile
+    
+    def _get_preprocessing_pipeline(self, profile: str) -> PreprocessingPipeline:
+        """Pipeline du profil de prétraitement résolu"""
+        settings = mac_config.preprocessing_config
+        return PreprocessingPipeline.from_profile(profile, settings["overrides"], settings["params"],
+                                                  cache=self.preprocessing_cache,
+                                                  tiler=self.tiled_preprocessor)
+    
+    def _preprocess_image(self, image: Union[Image.Image, np.ndarray], profile: str) -> Image.Image:
         """Préprocesse l'image pour améliorer l'OCR"""
         try:
-            # Convertir en RGB si nécessaire
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Convertir en numpy array pour OpenCV
-            img_array = np.array(image)
-            
-            # Conversion BGR pour OpenCV
-            img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-            
-            # Amélioration du contraste
-            lab = cv2.cvtColor(img_cv, cv2.COLOR_BGR2LAB)
-            l, a, b = cv2.split(lab)
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
-            cl = clahe.apply(l)
-            enhanced = cv2.merge((cl,a,b))
-            enhanced = cv2.cvtColor(enhanced, cv2.COLOR_LAB2BGR)
-            
-            # Réduction du bruit
-            denoised = cv2.fastNlMeansDenoisingColored(enhanced, None, 10, 10, 7, 21)
-            
-            # Amélioration de la netteté
-            kernel = np.array([[-1,-1,-1], [-1,9,-1], [-1,-1,-1]])
-            sharpened = cv2.filter2D(denoised, -1, kernel)
+            if isinstance(image, np.ndarray):
+                # Pixels déjà disponibles (memmap) : pas de copie PIL → numpy
+                img_array = image
+            else:
+                # Les scans en niveaux de gris restent sur un seul canal
+                if image.mode not in ('L', 'RGB'):
+                    image = image.convert('RGB')
+                
+                # Convertir en numpy array pour OpenCV
+                img_array = np.array(image)
             
-            # Conversion retour en PIL
-            enhanced_pil = Image.fromarray(cv2.cvtColor(sharpened, cv2.COLOR_BGR2RGB))
+            # Étapes du profil, chronométrées une à une
+            result = self._get_preprocessing_pipeline(profile).run(img_array)
+            self.last_preprocessing = result
             
-            return enhanced_pil
+            return result.to_pil()
             
         except Exception as e:
             logging.warning(f"Erreur préprocessing: {e}, utilisation de l'image originale")
-            return image
+            return Image.fromarray(image) if isinstance(image, np.ndarray) else image
     
     def _extract_text(self, image: Image.Image) -> List[OCRResult]:
         """Extrait le texte de l'image avec différentes configurations"""
@@ -183,49 +220,22 @@ class MacOptimizedOCRManager:
             }
         ]
         
-        for config in configs:
-            try:
-                start_time = time.time()
-                
-                # Extraction du texte
-                text = pytesseract.image_to_string(
-                    image,
-                    lang=config["lang"],
-                    config=config["config"]
-                )
-                
-                # Calcul de la confiance
-                data = pytesseract.image_to_data(
-                    image,
-                    lang=config["lang"],
-                    config=config["config"],
-                    output_type=pytesseract.Output.DICT
-                )
-                
-                # Calculer la confiance moyenne
-                confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-                avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-                
-                processing_time = time.time() - start_time
-                
-                # Créer le résultat
-                result = OCRResult(
-                    text=text.strip(),
-                    confidence=avg_confidence,
-                    language=config["lang"],
-                    processing_time=processing_time,
-                    image_path=self.app.state.current_file_path,
-                    preprocessed=True,
-                    enhanced=True
-                )
-                
-                results.append(result)
-                
-                logging.info(f"OCR {config['name']}: {len(text)} caractères, confiance {avg_confidence:.1f}%")
-                
-            except Exception as e:
-                logging.error(f"Erreur OCR {config['name']}: {e}")
-                continue
+        # Candidats reconnus en parallèle ; arrêt dès qu'un résultat est fiable
+        outcomes = self.candidate_ocr.run(image, [CandidateConfig(**config) for config in configs])
+        
+        for outcome in outcomes:
+            results.append(OCRResult(
+                text=outcome.text,
+                confidence=outcome.confidence,
+                language=outcome.candidate.lang,
+                processing_time=outcome.processing_time,
+                image_path=self.app.state.current_file_path,
+                preprocessed=True,
+                enhanced=True,
+                preprocessing_times=dict(self.last_preprocessing.timings) if self.last_preprocessing else {},
+                preprocessing_metadata=dict(self.last_preprocessing.metadata) if self.last_preprocessing else {},
+                word_boxes=outcome.words
+            ))
         
         return results
     
@@ -384,5 +394,8 @@ class MacOptimizedOCRManager:
                 "apple_silicon": mac_config.is_apple_silicon,
                 "retina_display": mac_config.is_retina,
                 "thread_limit": os.environ.get('OMP_THREAD_LIMIT', '4')
-            }
+            },
+            "candidate_statistics": self.candidate_ocr.get_statistics(),
+            "abandoned_candidates_running": self.candidate_ocr.abandoned_running,
+            "ocr_backend": get_engine_pool().name
         } 
\ No newline at end of file
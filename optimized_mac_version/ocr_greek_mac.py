@@ -13,7 +13,7 @@ import gc
 import logging
 import threading
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from typing import Dict, List, Tuple, Optional, Any, Callable, Sequence
 from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
@@ -37,13 +37,13 @@ import webbrowser
 from datetime import datetime
 import platform
 
-# Support PDF conditionnel
-try:
-    from pdf2image import convert_from_path, pdfinfo_from_path
-    PDF_SUPPORT = True
-except ImportError:
-    PDF_SUPPORT = False
-    logging.warning("pdf2image non installé : support PDF désactivé.")
+# Modules partagés avec la version de base (répertoire racine du projet) ;
+# le support PDF conditionnel (pdf2image) est détecté par page_source
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from page_source import PDF_SUPPORT, LazyPDFPageSource, IMAGE_EXTENSIONS, open_image_document
+from page_store import DiskPageStore
+from document_loader import BackgroundDocumentLoader
+from page_cache import PageCache
 
 # Configuration logging optimisée pour Mac
 logging.basicConfig(
@@ -67,7 +67,7 @@ class AppState:
     ai_processing: bool = False
     zoom_factor: float = 1.0
     current_theme: str = "light"
-    current_images: List[Image.Image] = field(default_factory=list)
+    current_images: Sequence[Image.Image] = field(default_factory=list)
     ocr_results: List[Dict[str, Any]] = field(default_factory=list)
     pdf_cache: Dict[str, Any] = field(default_factory=dict)
     pdf_cache_order: List[str] = field(default_factory=list)
@@ -221,6 +221,7 @@ class MacOptimizedUIManager:
         menubar.add_cascade(label="Fichier", menu=file_menu)
         file_menu.add_command(label="Ouvrir Image", command=self.app.open_image, accelerator="⌘O")
         file_menu.add_command(label="Ouvrir PDF", command=self.app.open_pdf, accelerator="⌘P")
+        file_menu.add_command(label="Ouvrir Dossier d'images", command=self.app.open_image_folder)
         file_menu.add_separator()
         file_menu.add_command(label="Exporter", command=self.app.export_results, accelerator="⌘E")
         file_menu.add_separator()
@@ -349,83 +350,92 @@ class MacOptimizedFileManager:
     
     def __init__(self, app: 'MacOptimizedOCRApp') -> None:
         self.app = app
+        self.loader = BackgroundDocumentLoader(app)
     
     def handle_file_open(self, filename: str) -> None:
-        """Gère l'ouverture d'un fichier optimisé"""
+        """Gère l'ouverture d'un fichier (chargement en arrière-plan)"""
         if not filename:
             return
             
-        if self._is_image_file(filename):
-            self._load_image_safe(filename)
+        if os.path.isdir(filename) or self._is_image_file(filename):
+            opener = self._open_image_document
+            self.app.set_status("Chargement de l'image en cours...")
         elif self._is_pdf_file(filename):
-            self._load_pdf_safe(filename)
+            if not PDF_SUPPORT:
+                messagebox.showerror("Erreur", "Support PDF non disponible")
+                return
+            opener = self._open_pdf_document
+            self.app.set_status("Chargement PDF en cours...")
         else:
             messagebox.showerror("Erreur", f"Format de fichier non supporté: {filename}")
+            return
+        
+        # Décodage hors du thread Tk ; un nouveau fichier annule le chargement en cours
+        self.loader.load(filename, opener, self._on_document_loaded, self._on_load_error, self.app.set_status)
     
     def _is_image_file(self, filename: str) -> bool:
         """Vérifie si c'est un fichier image"""
-        extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif']
-        return any(filename.lower().endswith(ext) for ext in extensions)
+        return filename.lower().endswith(IMAGE_EXTENSIONS)
     
     def _is_pdf_file(self, filename: str) -> bool:
         """Vérifie si c'est un fichier PDF"""
         return filename.lower().endswith('.pdf')
     
-    def _load_image_safe(self, path: str) -> None:
-        """Charge une image de manière sécurisée et optimisée"""
-        try:
-            with Image.open(path) as img:
-                # Conversion en RGB si nécessaire
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Optimisation pour Mac (Retina Display)
-                max_size = 4096 if platform.system() == "Darwin" else 2048
-                if max(img.size) > max_size:
-                    ratio = max_size / max(img.size)
-                    new_size = tuple(int(dim * ratio) for dim in img.size)
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                
-                self.app.state.current_images = [img]
-                self.app.state.current_file_path = path
-                self.app.state.current_page = 0
-                self.app.display_current_image()
-                self.app.set_status(MacOptimizedConfig.MESSAGES["info"]["image_loaded"].format(filename=Path(path).name))
-                
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement de l'image: {e}")
-    
-    def _load_pdf_safe(self, path: str) -> None:
-        """Charge un PDF de manière sécurisée et optimisée"""
-        if not PDF_SUPPORT:
-            messagebox.showerror("Erreur", "Support PDF non disponible")
-            return
+    def _close_current_document(self) -> None:
+        """Libère les pages (fichiers temporaires, cache) du document précédent"""
+        previous = self.app.state.current_images
+        if hasattr(previous, "close"):
+            previous.close()
+    
+    def _open_image_document(self, path: str, progress: Callable[[str], None]) -> Sequence:
+        """Ouvre une image (ou un TIFF multipage, un dossier d'images) — thread de chargement"""
+        # Raster d'affichage optimisé pour Mac (Retina Display) ;
+        # l'OCR relit l'image en pleine résolution
+        max_size = 4096 if platform.system() == "Darwin" else 2048
+        pages = open_image_document(path, max_size=max_size, cache=self.app.page_cache)
+        if len(pages) > 1:
+            # Document multipage : pages lues à la demande, conservées sur disque
+            progress(f"Document de {len(pages)} pages, lecture de la première...")
+            pages = DiskPageStore(pages, cache=self.app.page_cache)
+        return pages
+    
+    def _open_pdf_document(self, path: str, progress: Callable[[str], None]) -> Sequence:
+        """Ouvre un PDF — thread de chargement"""
+        # Source paresseuse optimisée : les pages sont rasterisées à la demande
+        # et conservées sur disque ; seul le cache LRU reste en mémoire
+        dpi = 300 if platform.system() == "Darwin" else 200
+        max_size = 2048 if platform.system() == "Darwin" else 1024
+        pages = DiskPageStore(LazyPDFPageSource(path, dpi=dpi, max_size=max_size),
+                              cache=self.app.page_cache)
+        progress(f"PDF de {len(pages)} pages, rendu de la première...")
+        return pages
+    
+    def _on_document_loaded(self, pages: Sequence, path: str) -> None:
+        """Installe le document chargé (thread Tk) et affiche sa première page"""
+        self._close_current_document()
+        
+        self.app.state.current_images = pages
+        self.app.state.current_file_path = path
+        self.app.state.current_page = 0
+        self.app.display_current_image()
+        
+        if self._is_pdf_file(path):
+            self.app.set_status(f"PDF chargé: {len(pages)} pages")
+        elif len(pages) > 1:
+            self.app.set_status(f"Document chargé: {len(pages)} pages")
+        else:
+            self.app.set_status(MacOptimizedConfig.MESSAGES["info"]["image_loaded"].format(filename=Path(path).name))
         
-        try:
-            self.app.set_status("Chargement PDF en cours...")
-            
-            # Conversion PDF optimisée
-            dpi = 300 if platform.system() == "Darwin" else 200
-            images = convert_from_path(path, dpi=dpi, fmt='RGB')
-            
-            # Optimisation des images pour Mac
-            optimized_images = []
-            max_size = 2048 if platform.system() == "Darwin" else 1024
-            for img in images:
-                if max(img.size) > max_size:
-                    ratio = max_size / max(img.size)
-                    new_size = tuple(int(dim * ratio) for dim in img.size)
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                optimized_images.append(img)
-            
-            self.app.state.current_images = optimized_images
-            self.app.state.current_file_path = path
-            self.app.state.current_page = 0
-            self.app.display_current_image()
-            self.app.set_status(f"PDF chargé: {len(optimized_images)} pages")
-            
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement PDF: {e}")
+        # La page suivante se prépare pendant la lecture de la première
+        self.app._prefetch_page(1)
+    
+    def _on_load_error(self, error: Exception, path: str) -> None:
+        """Affiche l'erreur de chargement (thread Tk)"""
+        self.app.set_status("Prêt")
+        if self._is_pdf_file(path):
+            messagebox.showerror("Erreur", f"Erreur lors du chargement PDF: {error}")
+        else:
+            messagebox.showerror("Erreur", f"Erreur lors du chargement de l'image: {error}")
 
 
 # Import des modules spécialisés
@@ -458,6 +468,9 @@ class MacOptimizedOCRApp(tk.Tk):
         # Initialisation de l'état
         self.state = AppState()
         
+        # Cache LRU des pages rendues, adossé à AppState.pdf_cache / pdf_cache_order
+        self.page_cache = PageCache(self.state.pdf_cache, self.state.pdf_cache_order)
+        
         # Initialisation des gestionnaires
         self.file_manager = MacOptimizedFileManager(self)
         self.ui_manager = MacOptimizedUIManager(self)
@@ -543,12 +556,17 @@ class MacOptimizedOCRApp(tk.Tk):
         filename = filedialog.askopenfilename(
             title="Sélectionner une image",
             filetypes=[
-                ("Images", "*.png *.jpg *.jpeg *.bmp *.tiff *.gif"),
+                ("Images", "*.png *.jpg *.jpeg *.bmp *.tif *.tiff *.gif"),
                 ("Tous les fichiers", "*.*")
             ]
         )
         self.file_manager.handle_file_open(filename)
     
+    def open_image_folder(self) -> None:
+        """Ouvre un dossier d'images comme un seul document (une page par image)"""
+        directory = filedialog.askdirectory(title="Sélectionner un dossier d'images")
+        self.file_manager.handle_file_open(directory)
+    
     def open_pdf(self) -> None:
         """Ouvre un PDF"""
         if not PDF_SUPPORT:
@@ -722,12 +740,19 @@ class MacOptimizedOCRApp(tk.Tk):
         if self.state.current_page > 0:
             self.state.current_page -= 1
             self.display_current_image()
+            self._prefetch_page(self.state.current_page - 1)
     
     def next_page(self) -> None:
         """Page suivante"""
         if self.state.current_page < len(self.state.current_images) - 1:
             self.state.current_page += 1
             self.display_current_image()
+            self._prefetch_page(self.state.current_page + 1)
+    
+    def _prefetch_page(self, page_number: int) -> None:
+        """Prépare en arrière-plan la page voisine dans le cache de pages"""
+        if hasattr(self.state.current_images, "prefetch"):
+            self.state.current_images.prefetch(page_number)
     
     def set_status(self, text: str) -> None:
         """Met à jour la barre de statut"""
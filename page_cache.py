@@ -0,0 +1,161 @@
+"""
+Cache LRU des pages rendues pour OCR Grec
+=========================================
+Cache mémoire borné (nombre d'entrées et octets) des rasters de pages, indexé
+par (fichier, page, dpi, mode). Il s'appuie sur AppState.pdf_cache et
+AppState.pdf_cache_order pour que l'état de l'application reflète son contenu.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from PIL import Image
+
+from config import Config
+
+PageLoader = Callable[[], Image.Image]
+
+
+def image_nbytes(image: Image.Image) -> int:
+    """Taille approximative des pixels décodés d'une image"""
+    return image.width * image.height * len(image.getbands())
+
+
+class PageCache:
+    """Cache LRU de pages avec comptabilité en octets et statistiques d'éviction"""
+
+    def __init__(self, entries: Optional[Dict[str, Any]] = None, order: Optional[List[str]] = None,
+                 max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        # Conteneurs partagés avec AppState (pdf_cache / pdf_cache_order)
+        self.entries = entries if entries is not None else {}
+        self.order = order if order is not None else []
+        self.max_entries = max_entries or Config.pdf.cache_size
+        self.max_bytes = max_bytes or Config.pdf.cache_memory_limit
+
+        self.current_bytes = 0
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._loading: Dict[str, threading.Event] = {}
+        self._prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch")
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "evicted_bytes": 0,
+            "prefetches": 0
+        }
+
+    @staticmethod
+    def make_key(file_path: str, page: int, dpi: int, mode: str) -> str:
+        """Clé de cache (fichier, page, dpi, mode)"""
+        return f"{file_path}|{page}|{dpi}|{mode}"
+
+    def get(self, key: str) -> Optional[Image.Image]:
+        """Retourne la page si elle est en cache (et la marque comme récente)"""
+        with self._lock:
+            image = self.entries.get(key)
+            if image is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self._touch(key)
+            return image
+
+    def put(self, key: str, image: Image.Image) -> None:
+        """Ajoute une page et évince les moins récentes si le cache déborde"""
+        size = image_nbytes(image)
+        with self._lock:
+            if key in self.entries:
+                self.current_bytes -= self._sizes.get(key, 0)
+            self.entries[key] = image
+            self._sizes[key] = size
+            self.current_bytes += size
+            self._touch(key)
+            self._evict()
+
+    def get_or_load(self, key: str, loader: PageLoader) -> Image.Image:
+        """Retourne la page en cache ou la charge une seule fois, même en concurrence"""
+        while True:
+            with self._lock:
+                image = self.entries.get(key)
+                if image is not None:
+                    self.stats["hits"] += 1
+                    self._touch(key)
+                    return image
+
+                pending = self._loading.get(key)
+                if pending is None:
+                    self.stats["misses"] += 1
+                    pending = self._loading[key] = threading.Event()
+                    break
+
+            # Une autre tâche (préchargement, OCR) rend déjà cette page
+            pending.wait()
+
+        try:
+            image = loader()
+            self.put(key, image)
+            return image
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending.set()
+
+    def prefetch(self, key: str, loader: PageLoader) -> None:
+        """Charge une page en arrière-plan (page suivante/précédente)"""
+        with self._lock:
+            if key in self.entries or key in self._loading:
+                return
+            self.stats["prefetches"] += 1
+
+        def task() -> None:
+            try:
+                self.get_or_load(key, loader)
+            except Exception as e:
+                logging.warning(f"Préchargement page impossible ({key}): {e}")
+
+        self._prefetcher.submit(task)
+
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        """Vide le cache, ou seulement les pages d'un fichier"""
+        with self._lock:
+            prefix = f"{file_path}|" if file_path is not None else ""
+            for key in [k for k in self.order if k.startswith(prefix)]:
+                self._remove(key)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statistiques du cache (taux de succès, octets, évictions)"""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "current_bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0
+            }
+
+    def _touch(self, key: str) -> None:
+        if key in self.order:
+            self.order.remove(key)
+        self.order.append(key)
+
+    def _remove(self, key: str) -> int:
+        self.entries.pop(key, None)
+        if key in self.order:
+            self.order.remove(key)
+        size = self._sizes.pop(key, 0)
+        self.current_bytes -= size
+        return size
+
+    def _evict(self) -> None:
+        # On garde toujours au moins la page la plus récente
+        while len(self.order) > 1 and (len(self.order) > self.max_entries
+                                       or self.current_bytes > self.max_bytes):
+            size = self._remove(self.order[0])
+            self.stats["evictions"] += 1
+            self.stats["evicted_bytes"] += size
@@ -0,0 +1,138 @@
+"""
+OCR des pages dans les processus du pool pour OCR Grec
+======================================================
+Fonctions exécutées hors du processus principal (OCR de document complet en
+parallèle) : elles ne reçoivent que des données sérialisables — la tâche de
+page avec son raster OCR et les réglages — et retournent la tâche complétée.
+Redressement, binarisation, découpage en colonnes, détection des langues et
+reconnaissance se font tous dans le processus de la page : aucune étape par
+page ne reste sérialisée dans le processus principal. Le jeu de langues
+détecté repart avec la tâche, pour être mémorisé par le détecteur du
+processus principal ; une page dont le jeu est déjà connu n'est pas
+détectée à nouveau.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from PIL import Image
+
+from engine_pool import get_engine_pool
+from language_detection import DEFAULT_LANGUAGES, LanguageDetector
+from preprocessing import PreprocessingPipeline, unskew_box
+
+# Détecteur du processus (les choix sont mémorisés par le processus principal)
+_language_detector = LanguageDetector()
+
+
+@dataclass
+class PageJobOptions:
+    """Réglages d'un OCR de document complet, transmis à chaque processus"""
+    config: str
+    column_detection: bool = False
+    column_languages: Dict[str, str] = field(default_factory=dict)
+    language_detection: bool = True
+
+
+def prepare_page(image: Image.Image) -> Tuple[Image.Image, Dict[str, Any]]:
+    """Page en niveaux de gris → page redressée et binarisée (Sauvola), avec ses métadonnées
+
+    Pas de cache de prétraitement ici : un parcours de document ne relit pas
+    ses pages, les écrire doublerait le disque occupé par le document.
+    """
+    result = PreprocessingPipeline.from_profile("tesseract").run(np.asarray(image))
+    return result.to_pil(), result.metadata
+
+
+def detect_columns(image: Image.Image) -> List[Dict[str, Any]]:
+    """Détecte les colonnes dans l'image"""
+    try:
+        # Détection des zones de texte
+        # Cette méthode simplifiée divise l'image en colonnes basées sur la densité de pixels
+        width, height = image.size
+        columns = []
+
+        # Division en 2 ou 3 colonnes selon la largeur
+        if width > 800:  # Largeur suffisante pour 2 colonnes
+            col_width = width // 2
+
+            # Colonne gauche
+            left_col = image.crop((0, 0, col_width, height))
+            columns.append({
+                "image": left_col,
+                "region": {"x1": 0, "y1": 0, "x2": col_width, "y2": height}
+            })
+
+            # Colonne droite
+            right_col = image.crop((col_width, 0, width, height))
+            columns.append({
+                "image": right_col,
+                "region": {"x1": col_width, "y1": 0, "x2": width, "y2": height}
+            })
+        else:
+            # Une seule colonne
+            columns.append({
+                "image": image,
+                "region": {"x1": 0, "y1": 0, "x2": width, "y2": height}
+            })
+
+        return columns
+
+    except Exception as e:
+        logging.error(f"Erreur détection colonnes: {e}")
+        # Fallback: retourner l'image entière
+        return [{
+            "image": image,
+            "region": {"x1": 0, "y1": 0, "x2": image.size[0], "y2": image.size[1]}
+        }]
+
+
+def column_language(column_languages: Dict[str, str], column_index: int, total_columns: int) -> str:
+    """Détermine la langue pour une colonne donnée"""
+    if total_columns == 2:
+        return column_languages["left"] if column_index == 0 else column_languages["right"]
+    return column_languages["center"]
+
+
+def display_region(region: Dict[str, int], preprocessing: Dict[str, Any], size: Tuple[int, int],
+                   scale: float) -> Dict[str, int]:
+    """Région de la page prétraitée → repère d'affichage (redressement annulé, bornée
+    à la page de taille `size`, mise à l'échelle)"""
+    x1, y1, x2, y2 = unskew_box((region["x1"], region["y1"], region["x2"], region["y2"]), preprocessing)
+    box = (max(0, x1), max(0, y1), min(size[0], x2), min(size[1], y2))
+    x1, y1, x2, y2 = (int(round(v * scale)) for v in box)
+    return {"x1": x1, "y1": y1, "x2": x2, "y2": y2}
+
+
+def ocr_page_job(job: Dict[str, Any], options: PageJobOptions) -> Dict[str, Any]:
+    """Prétraite la page, la découpe (colonnes ou page entière) et reconnaît chaque segment"""
+    start = time.perf_counter()
+    image, preprocessing = prepare_page(job.pop("image"))
+
+    if options.column_detection:
+        columns = detect_columns(image)
+        job["segments"] = [{
+            "image": column["image"],
+            "language": column_language(options.column_languages, i, len(columns)),
+            "column_index": i,
+            "region": display_region(column["region"], preprocessing, image.size, job["scale"])
+        } for i, column in enumerate(columns)]
+    elif options.language_detection:
+        # Jeu connu (passe précédente sur ce document) ou détecté ici, renvoyé avec la tâche
+        choice = job.get("language_choice") or _language_detector.choose(image)
+        job["language_choice"] = choice
+        job["segments"] = [{"image": image, "language": choice.languages}]
+    else:
+        job["segments"] = [{"image": image, "language": DEFAULT_LANGUAGES}]
+    job["preprocessing_time"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    # Moteur du processus : les modèles restent chargés d'une page à l'autre
+    backend = get_engine_pool()
+    for segment in job["segments"]:
+        segment["text"] = backend.image_to_string(segment.pop("image"), segment["language"], options.config)
+    job["ocr_time"] = time.perf_counter() - start
+    return job
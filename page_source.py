@@ -0,0 +1,316 @@
+"""
+Sources de pages paresseuses pour OCR Grec
+==========================================
+Rasterisation des pages à la demande : seul le nombre de pages est lu à
+l'ouverture, chaque page n'est rendue que lorsqu'elle est réellement demandée.
+
+Chaque page existe sous deux formes :
+- un raster d'affichage léger (`pages[i]`) pour le canvas ;
+- un raster OCR en niveaux de gris au DPI configuré (`get_ocr_image(i)`),
+  produit uniquement quand un OCR le demande.
+"""
+
+import logging
+import os
+from collections.abc import Sequence
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from PIL import Image
+
+from config import Config
+from page_cache import PageCache
+from pdf_rasterizer import PDFRasterizer, page_size_points
+
+# Support PDF conditionnel
+try:
+    from pdf2image import convert_from_path, pdfinfo_from_path
+    PDF_SUPPORT = True
+except ImportError:
+    PDF_SUPPORT = False
+    logging.warning("pdf2image non installé : support PDF désactivé.")
+
+# Extensions reconnues comme pages d'image
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.gif')
+
+
+def fit_image(image: Image.Image, max_size: Optional[int], mode: str = 'RGB') -> Image.Image:
+    """Convertit dans le mode voulu et borne la taille à max_size"""
+    if image.mode != mode:
+        image = image.convert(mode)
+
+    # Redimensionnement si trop grande
+    if max_size and max(image.size) > max_size:
+        ratio = max_size / max(image.size)
+        new_size = tuple(int(dim * ratio) for dim in image.size)
+        image = image.resize(new_size, Image.Resampling.LANCZOS)
+
+    return image
+
+
+def decode_image(path: str, max_size: Optional[int], mode: str = 'RGB', frame: int = 0) -> Image.Image:
+    """Décode une image directement à une taille proche de max_size
+
+    Les JPEG sont décodés à l'échelle 1/2, 1/4 ou 1/8 par libjpeg (draft) ;
+    les autres formats sont réduits par blocs entiers (reduce) avant le
+    LANCZOS final, qui ne porte plus que sur une image de taille voisine.
+    """
+    with Image.open(path) as img:
+        if frame:
+            img.seek(frame)
+        
+        if img.format == 'JPEG':
+            # Décodage direct dans le mode voulu (ex. luminance seule pour 'L')
+            target = img.size
+            if max_size and max(img.size) > max_size:
+                ratio = max_size / max(img.size)
+                target = tuple(max(1, int(dim * ratio)) for dim in img.size)
+            img.draft(mode, target)
+        elif max_size and max(img.size) > max_size:
+            factor = max(img.size) // max_size
+            if factor >= 2:
+                try:
+                    img = img.reduce(factor)
+                except ValueError:
+                    # Mode non supporté par reduce (palette, 1 bit...)
+                    img = img.convert(mode).reduce(factor)
+
+        image = fit_image(img, max_size, mode)
+        image.load()
+        return image
+
+
+class LazyPDFPageSource(Sequence):
+    """Document PDF exposé comme une liste de pages rendues à la demande"""
+
+    def __init__(self, path: str, dpi: int = 300, max_size: Optional[int] = 2048,
+                 ocr_dpi: Optional[int] = None) -> None:
+        if not PDF_SUPPORT:
+            raise RuntimeError("Support PDF non disponible")
+
+        self.path = path
+        self.dpi = dpi
+        self.max_size = max_size
+        self.ocr_dpi = min(ocr_dpi or Config.pdf.default_dpi, Config.pdf.max_dpi)
+
+        # Seules les métadonnées sont lues à l'ouverture
+        self.info = pdfinfo_from_path(path)
+        self.page_count = int(self.info["Pages"])
+
+        # Le raster d'affichage est rendu directement à la taille utile
+        self.display_dpi = self._display_dpi()
+
+        logging.info(f"PDF ouvert en mode paresseux: {path} ({self.page_count} pages, "
+                     f"affichage {self.display_dpi} dpi, OCR {self.ocr_dpi} dpi)")
+
+    def __len__(self) -> int:
+        return self.page_count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Image.Image, list]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.page_count))]
+
+        index = self._normalize_index(index)
+        return fit_image(self._render_page(index, self.display_dpi), self.max_size)
+
+    def __iter__(self) -> Iterator[Image.Image]:
+        """Parcours séquentiel : rendu par lots parallèles bornés en mémoire"""
+        rasterizer = PDFRasterizer(self.path, dpi=self.display_dpi, info=self.info)
+        for _, image in rasterizer.iter_pages():
+            yield fit_image(image, self.max_size)
+
+    def get_ocr_image(self, index: int) -> Image.Image:
+        """Raster OCR de la page : niveaux de gris, au DPI OCR, sans réduction"""
+        index = self._normalize_index(index)
+        return fit_image(self._render_page(index, self.ocr_dpi, grayscale=True), None, 'L')
+
+    def iter_ocr_images(self, indices: Optional[Iterable[int]] = None) -> Iterator[Image.Image]:
+        """Rasters OCR des pages demandées (toutes par défaut), rendus par lots parallèles"""
+        rasterizer = PDFRasterizer(self.path, dpi=self.ocr_dpi, grayscale=True, info=self.info)
+        for _, image in rasterizer.iter_pages(pages=indices):
+            yield fit_image(image, None, 'L')
+
+    def _display_dpi(self) -> int:
+        """DPI d'affichage : le plus grand côté de la page tient dans max_size"""
+        if not self.max_size:
+            return self.dpi
+        longest_pts = max(page_size_points(self.info))
+        return max(36, min(self.dpi, int(self.max_size * 72 / longest_pts)))
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self.page_count
+        if not 0 <= index < self.page_count:
+            raise IndexError(f"Page hors limites: {index}")
+        return index
+
+    def _render_page(self, index: int, dpi: int, grayscale: bool = False) -> Image.Image:
+        """Rasterise une seule page via poppler (first_page/last_page)"""
+        page_number = index + 1
+        images = convert_from_path(
+            self.path,
+            dpi=dpi,
+            fmt='RGB',
+            grayscale=grayscale,
+            first_page=page_number,
+            last_page=page_number
+        )
+        if not images:
+            raise IndexError(f"Page {page_number} introuvable dans {self.path}")
+
+        return images[0]
+
+
+class ImagePageSource(Sequence):
+    """Image unique : raster d'affichage réduit, raster OCR pleine résolution en gris"""
+
+    def __init__(self, path: str, max_size: Optional[int] = 4096, cache: Optional[PageCache] = None) -> None:
+        self.path = path
+        self.max_size = max_size
+        # Le raster OCR décodé est gardé dans le cache de pages partagé
+        self.cache = cache or PageCache(max_entries=1)
+
+        # Décodage réduit : la pleine résolution n'est décodée que pour l'OCR
+        self._display = decode_image(path, max_size)
+
+    def __len__(self) -> int:
+        return 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Image.Image, list]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(1))]
+        if index not in (0, -1):
+            raise IndexError(f"Page hors limites: {index}")
+        return self._display
+
+    def get_ocr_image(self, index: int) -> Image.Image:
+        """Raster OCR : décodage pleine résolution en niveaux de gris, une fois par ouverture"""
+        self[index]
+        return self.cache.get_or_load(PageCache.make_key(self.path, 0, 0, 'L'),
+                                      lambda: decode_image(self.path, None, 'L'))
+
+    def close(self) -> None:
+        """Retire le raster OCR du cache"""
+        self.cache.invalidate(self.path)
+
+
+class ImageSequenceSource(Sequence):
+    """Suite de pages image (TIFF multipage, dossier d'images) lues image par image à la demande"""
+
+    def __init__(self, path: str, frames: List[Tuple[str, int]], max_size: Optional[int] = 4096) -> None:
+        if not frames:
+            raise ValueError(f"Aucune page image dans {path}")
+
+        self.path = path
+        self.frames = frames
+        self.max_size = max_size
+
+        logging.info(f"Document image ouvert en mode paresseux: {path} ({len(frames)} pages)")
+
+    @classmethod
+    def from_multiframe(cls, path: str, max_size: Optional[int] = 4096) -> "ImageSequenceSource":
+        """TIFF multipage : une page par image du fichier (seek à la demande)"""
+        with Image.open(path) as img:
+            count = getattr(img, "n_frames", 1)
+        return cls(path, [(path, frame) for frame in range(count)], max_size)
+
+    @classmethod
+    def from_directory(cls, directory: str, max_size: Optional[int] = 4096) -> "ImageSequenceSource":
+        """Dossier d'images : une page par fichier, dans l'ordre des noms"""
+        names = sorted(name for name in os.listdir(directory)
+                       if name.lower().endswith(IMAGE_EXTENSIONS))
+        return cls(directory, [(os.path.join(directory, name), 0) for name in names], max_size)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Image.Image, list]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        path, frame = self.frames[self._normalize_index(index)]
+        return decode_image(path, self.max_size, frame=frame)
+
+    def get_ocr_image(self, index: int) -> Image.Image:
+        """Raster OCR : image décodée en pleine résolution en niveaux de gris"""
+        path, frame = self.frames[self._normalize_index(index)]
+        return decode_image(path, None, 'L', frame=frame)
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Page hors limites: {index}")
+        return index
+
+
+def open_image_document(path: str, max_size: Optional[int] = 4096,
+                        cache: Optional[PageCache] = None) -> Union[ImagePageSource, ImageSequenceSource]:
+    """Source de pages d'une image, d'un TIFF multipage ou d'un dossier d'images
+    (le cache de pages ne sert qu'à l'image unique ; DiskPageStore gère les autres)"""
+    if os.path.isdir(path):
+        return ImageSequenceSource.from_directory(path, max_size)
+
+    with Image.open(path) as img:
+        is_multipage = img.format == 'TIFF' and getattr(img, "n_frames", 1) > 1
+    if is_multipage:
+        return ImageSequenceSource.from_multiframe(path, max_size)
+    return ImagePageSource(path, max_size, cache)
+
+
+def get_ocr_raster(pages: Sequence, index: int) -> Tuple[Image.Image, float]:
+    """Raster OCR d'une page et facteur d'échelle OCR → affichage"""
+    display = pages[index]
+    if hasattr(pages, "get_ocr_image"):
+        ocr_image = pages.get_ocr_image(index)
+    else:
+        ocr_image = display.convert('L')
+
+    scale = display.width / ocr_image.width if ocr_image.width else 1.0
+    return ocr_image, scale
+
+
+def ocr_raster_scale(pages: Sequence, index: int, ocr_image: Image.Image) -> float:
+    """Facteur d'échelle OCR → affichage d'une page, sans rendre son raster d'affichage
+    quand la source connaît ses DPI ou sa taille d'affichage maximale"""
+    if not ocr_image.width:
+        return 1.0
+    display_dpi = getattr(pages, "display_dpi", None)
+    ocr_dpi = getattr(pages, "ocr_dpi", None)
+    max_size = getattr(pages, "max_size", None)
+    if display_dpi and ocr_dpi:
+        scale = display_dpi / ocr_dpi
+    elif max_size:
+        scale = 1.0
+    else:
+        return pages[index].width / ocr_image.width
+
+    # Le raster d'affichage est ensuite borné à max_size (fit_image)
+    if max_size and max(ocr_image.size) * scale > max_size:
+        scale = max_size / max(ocr_image.size)
+    return scale
+
+
+def page_display_dpi(pages: Sequence, page_size: Tuple[float, float]) -> float:
+    """DPI effectif du raster d'affichage d'une page de taille donnée (points) :
+    DPI de rendu, réduit quand fit_image borne cette page à max_size"""
+    dpi = getattr(pages, "display_dpi", None) or 72
+    max_size = getattr(pages, "max_size", None)
+    longest = max(page_size) / 72.0 * dpi
+    if max_size and longest > max_size:
+        dpi *= max_size / longest
+    return dpi
+
+
+def iter_ocr_rasters(pages: Sequence, indices: Optional[Iterable[int]] = None) -> Iterator[Image.Image]:
+    """Rasters OCR des pages demandées (toutes par défaut), dans l'ordre"""
+    if indices is not None:
+        indices = sorted(set(indices))
+
+    if hasattr(pages, "iter_ocr_images"):
+        yield from pages.iter_ocr_images(indices)
+    elif indices is None:
+        for page in pages:
+            yield page.convert('L')
+    else:
+        for index in indices:
+            yield pages[index].convert('L')
@@ -0,0 +1,208 @@
+"""
+Stockage disque des pages rendues pour OCR Grec
+===============================================
+Les pages rendues sont écrites au format .npy (mappable en mémoire) dans le
+répertoire temporaire ; seules les pages retenues par le cache LRU (PageCache)
+restent décodées en RAM et les traitements numériques lisent les pixels sans
+copie via numpy.memmap.
+Les rasters d'affichage et les rasters OCR sont stockés séparément.
+"""
+
+import logging
+import os
+import shutil
+import threading
+import uuid
+import weakref
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+from PIL import Image
+
+from config import Config
+from page_cache import PageCache
+
+# Nombre de pages décodées gardées en mémoire sans cache partagé
+DEFAULT_MEMORY_PAGES = 4
+
+
+class DiskPageStore(Sequence):
+    """Liste de pages adossée au disque, devant une source de pages quelconque"""
+
+    def __init__(self, source: Sequence, store_dir: Optional[Path] = None,
+                 cache: Optional[PageCache] = None) -> None:
+        self.source = source
+        self.cache = cache or PageCache(max_entries=DEFAULT_MEMORY_PAGES)
+
+        base_dir = Path(store_dir or Config.DEFAULT_PATHS["temp_dir"])
+        self.store_dir = base_dir / f"pages_{uuid.uuid4().hex}"
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._stored = set()
+        self._ocr_stored = set()
+
+        # Suppression des fichiers quand le document est remplacé ou fermé
+        self._finalizer = weakref.finalize(self, shutil.rmtree, str(self.store_dir), True)
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Image.Image, list]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        index = self._normalize_index(index)
+        return self.cache.get_or_load(self.cache_key(index), lambda: self._load_display(index))
+
+    def __iter__(self) -> Iterator[Image.Image]:
+        """Parcours séquentiel : délègue à la source (rendu par lots) si nécessaire"""
+        if len(self._stored) == len(self):
+            for index in range(len(self)):
+                yield self[index]
+            return
+
+        for index, image in enumerate(self.source):
+            if index not in self._stored:
+                self._store(index, image)
+            yield image
+
+    def get_array(self, index: int) -> np.ndarray:
+        """Retourne les pixels de la page en lecture seule, sans copie (memmap)"""
+        index = self._normalize_index(index)
+        if index not in self._stored:
+            self._load_display(index)
+        return np.load(self._page_path(index), mmap_mode='r')
+
+    def get_ocr_image(self, index: int) -> Image.Image:
+        """Raster OCR de la page (cache LRU, sinon relu depuis le disque)"""
+        index = self._normalize_index(index)
+        return self.cache.get_or_load(self.cache_key(index, ocr=True),
+                                      lambda: Image.fromarray(self.get_ocr_array(index)))
+
+    def get_ocr_array(self, index: int) -> np.ndarray:
+        """Pixels OCR de la page en lecture seule, sans copie (memmap)"""
+        index = self._normalize_index(index)
+        if index not in self._ocr_stored:
+            image = self._source_ocr_image(index)
+            self._store(index, image, ocr=True)
+            if index not in self._ocr_stored:
+                return np.asarray(image)
+        return np.load(self._page_path(index, ocr=True), mmap_mode='r')
+
+    def iter_ocr_images(self, indices: Optional[Iterable[int]] = None) -> Iterator[Image.Image]:
+        """Rasters OCR des pages demandées (toutes par défaut), sans écriture sur disque
+
+        Un parcours de tout le document ne relit pas ses rasters : les écrire
+        occuperait plusieurs Go pour un livre, en double du cache de
+        prétraitement. Seules les pages déjà sur disque y sont relues.
+        """
+        indices = sorted(set(indices)) if indices is not None else list(range(len(self)))
+        with self._lock:
+            stored = {index for index in indices if index in self._ocr_stored}
+
+        # Lecture directe des pages absentes : le parcours complet ne doit pas
+        # évincer du cache les pages en cours de consultation
+        missing = [index for index in indices if index not in stored]
+        rendered = self.source.iter_ocr_images(missing) if hasattr(self.source, "iter_ocr_images") else None
+        try:
+            for index in indices:
+                if index in stored:
+                    yield Image.fromarray(np.load(self._page_path(index, ocr=True), mmap_mode='r'))
+                elif rendered is not None:
+                    yield next(rendered)
+                else:
+                    yield self._source_ocr_image(index)
+        finally:
+            if rendered is not None:
+                rendered.close()
+
+    @property
+    def display_dpi(self) -> Optional[int]:
+        """DPI du raster d'affichage de la source, s'il est connu"""
+        return getattr(self.source, "display_dpi", None)
+
+    @property
+    def ocr_dpi(self) -> Optional[int]:
+        """DPI du raster OCR de la source, s'il est connu"""
+        return getattr(self.source, "ocr_dpi", None)
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """Taille maximale du raster d'affichage de la source, si elle est connue"""
+        return getattr(self.source, "max_size", None)
+
+    def prefetch(self, index: int) -> None:
+        """Prépare en arrière-plan le raster d'affichage d'une page voisine"""
+        if 0 <= index < len(self):
+            self.cache.prefetch(self.cache_key(index), lambda: self._load_display(index))
+
+    def cache_key(self, index: int, ocr: bool = False) -> str:
+        """Clé (fichier, page, dpi, mode) de la page dans le cache"""
+        file_path = getattr(self.source, "path", self.store_dir.name)
+        dpi = getattr(self.source, "ocr_dpi" if ocr else "display_dpi", 0)
+        return PageCache.make_key(file_path, index, dpi, 'L' if ocr else 'RGB')
+
+    def close(self) -> None:
+        """Libère la mémoire et supprime les fichiers de pages"""
+        with self._lock:
+            self._stored.clear()
+            self._ocr_stored.clear()
+        self.cache.invalidate(getattr(self.source, "path", self.store_dir.name))
+        self._finalizer()
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Page hors limites: {index}")
+        return index
+
+    def _page_path(self, index: int, ocr: bool = False) -> Path:
+        prefix = "ocr" if ocr else "page"
+        return self.store_dir / f"{prefix}_{index:05d}.npy"
+
+    def _store(self, index: int, image: Image.Image, ocr: bool = False) -> None:
+        """Écrit la page sur disque (écriture atomique)"""
+        path = self._page_path(index, ocr)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.asarray(image))
+            os.replace(tmp_path, path)
+            with self._lock:
+                (self._ocr_stored if ocr else self._stored).add(index)
+        except OSError as e:
+            logging.warning(f"Écriture page {index + 1} sur disque impossible: {e}")
+
+    def _source_ocr_image(self, index: int) -> Image.Image:
+        """Raster OCR rendu par la source (ou page d'affichage en gris)"""
+        if hasattr(self.source, "get_ocr_image"):
+            return self.source.get_ocr_image(index)
+        return self[index].convert('L')
+
+    def _load_display(self, index: int) -> Image.Image:
+        """Relit la page depuis le disque, ou la rend puis l'y écrit"""
+        if index in self._stored:
+            return Image.fromarray(self.get_array(index))
+        image = self.source[index]
+        self._store(index, image)
+        return image
+
+
+def page_array(pages: Sequence, index: int) -> np.ndarray:
+    """Pixels d'affichage d'une page : vue memmap si la source est adossée au disque"""
+    if isinstance(pages, DiskPageStore):
+        return pages.get_array(index)
+    return np.asarray(pages[index])
+
+
+def ocr_page_array(pages: Sequence, index: int) -> np.ndarray:
+    """Pixels OCR d'une page : vue memmap si la source est adossée au disque"""
+    if isinstance(pages, DiskPageStore):
+        return pages.get_ocr_array(index)
+    if hasattr(pages, "get_ocr_image"):
+        return np.asarray(pages.get_ocr_image(index))
+    return np.asarray(pages[index].convert('L'))
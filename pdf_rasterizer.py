@@ -0,0 +1,176 @@
+"""
+Moteur de rasterisation PDF parallèle pour OCR Grec
+===================================================
+Rend des plages de pages en parallèle (poppler multi-processus), découpe le
+document en lots dimensionnés d'après PDFConfig et bloque le rendu des lots
+suivants tant que le budget mémoire est dépassé.
+"""
+
+import logging
+import os
+import queue
+import re
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from PIL import Image
+
+from config import Config, PDFConfig
+
+# Support PDF conditionnel
+try:
+    from pdf2image import convert_from_path, pdfinfo_from_path
+    PDF_SUPPORT = True
+except ImportError:
+    PDF_SUPPORT = False
+    logging.warning("pdf2image non installé : support PDF désactivé.")
+
+# Taille de page par défaut (A4 en points) si pdfinfo ne la fournit pas
+DEFAULT_PAGE_SIZE_PTS = (595.0, 842.0)
+
+
+def page_size_points(info: Dict[str, Any]) -> Tuple[float, float]:
+    """Taille de page (largeur, hauteur) en points d'après pdfinfo"""
+    match = re.match(r"\s*([\d.]+)\s*x\s*([\d.]+)", str(info.get("Page size", "")))
+    if match:
+        return float(match.group(1)), float(match.group(2))
+    return DEFAULT_PAGE_SIZE_PTS
+
+
+class MemoryBudget:
+    """Budget mémoire bloquant partagé entre le producteur et le consommateur"""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, amount: int, stop_event: Optional[threading.Event] = None) -> bool:
+        """Réserve `amount` octets, en attendant que le budget se libère"""
+        with self._condition:
+            # Un lot seul plus gros que le budget passe quand même (sinon blocage)
+            while self.used > 0 and self.used + amount > self.limit:
+                if stop_event is not None and stop_event.is_set():
+                    return False
+                self._condition.wait(timeout=0.1)
+            self.used += amount
+            return True
+
+    def release(self, amount: int) -> None:
+        """Libère `amount` octets et réveille le producteur"""
+        with self._condition:
+            self.used = max(0, self.used - amount)
+            self._condition.notify_all()
+
+
+class PDFRasterizer:
+    """Rasterisation par lots parallèles et bornés en mémoire d'un document PDF"""
+
+    def __init__(self, path: str, dpi: Optional[int] = None, grayscale: bool = False,
+                 pdf_config: Optional[PDFConfig] = None,
+                 info: Optional[Dict[str, Any]] = None) -> None:
+        if not PDF_SUPPORT:
+            raise RuntimeError("Support PDF non disponible")
+
+        self.path = path
+        self.config = pdf_config or Config.pdf
+        self.dpi = min(dpi or self.config.default_dpi, self.config.max_dpi)
+        self.grayscale = grayscale
+
+        self.info = info if info is not None else pdfinfo_from_path(path)
+        self.page_count = int(self.info["Pages"])
+        self.thread_count = max(1, min(self.config.max_concurrent_threads, os.cpu_count() or 1))
+
+    def estimate_page_bytes(self) -> int:
+        """Estime la taille décodée d'une page au DPI demandé"""
+        width_pts, height_pts = page_size_points(self.info)
+        width_px = width_pts / 72.0 * self.dpi
+        height_px = height_pts / 72.0 * self.dpi
+        channels = 1 if self.grayscale else 3
+        return max(1, int(width_px * height_px * channels))
+
+    def pages_per_batch(self) -> int:
+        """Nombre de pages par lot d'après batch_size et le budget mémoire"""
+        # Deux lots doivent tenir dans le budget pour que le rendu du suivant
+        # recouvre la consommation du courant
+        by_memory = self.config.memory_limit_per_batch // (2 * self.estimate_page_bytes())
+        return max(1, min(self.config.batch_size, by_memory))
+
+    def batch_ranges(self, first_page: int = 1, last_page: Optional[int] = None,
+                     pages: Optional[Iterable[int]] = None) -> List[Tuple[int, int]]:
+        """Découpe une plage de pages (1-indexée, bornes incluses) en lots
+
+        Si `pages` (index 0-based) est fourni, seules ces pages sont rendues :
+        chaque suite de pages consécutives forme une plage découpée en lots.
+        """
+        last_page = min(last_page or self.page_count, self.page_count)
+        if pages is None:
+            runs = [(max(1, first_page), last_page)]
+        else:
+            runs = []
+            for page in sorted({p + 1 for p in pages if first_page <= p + 1 <= last_page}):
+                if runs and runs[-1][1] == page - 1:
+                    runs[-1] = (runs[-1][0], page)
+                else:
+                    runs.append((page, page))
+
+        size = self.pages_per_batch()
+        return [(start, min(start + size - 1, run_end))
+                for run_start, run_end in runs
+                for start in range(run_start, run_end + 1, size)]
+
+    def render_range(self, first_page: int, last_page: int) -> List[Image.Image]:
+        """Rend une plage de pages avec plusieurs processus poppler en parallèle"""
+        return convert_from_path(
+            self.path,
+            dpi=self.dpi,
+            fmt='RGB',
+            grayscale=self.grayscale,
+            first_page=first_page,
+            last_page=last_page,
+            thread_count=min(self.thread_count, last_page - first_page + 1)
+        )
+
+    def iter_pages(self, first_page: int = 1, last_page: Optional[int] = None,
+                   pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, Image.Image]]:
+        """Produit (index 0-based, image) dans l'ordre, en rendant les lots en avance"""
+        page_bytes = self.estimate_page_bytes()
+        budget = MemoryBudget(self.config.memory_limit_per_batch)
+        batches = self.batch_ranges(first_page, last_page, pages)
+        pending: queue.Queue = queue.Queue()
+        stop_event = threading.Event()
+
+        def producer() -> None:
+            try:
+                for start, end in batches:
+                    if not budget.acquire((end - start + 1) * page_bytes, stop_event):
+                        return
+                    if stop_event.is_set():
+                        return
+                    pending.put((start, self.render_range(start, end)))
+            except Exception as e:
+                pending.put(e)
+            finally:
+                pending.put(None)
+
+        thread = threading.Thread(target=producer, daemon=True)
+        thread.start()
+        logging.info(f"Rasterisation PDF: {len(batches)} lots, {self.thread_count} processus, "
+                     f"~{page_bytes // (1024 * 1024)} Mo/page")
+
+        try:
+            while True:
+                item = pending.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                start, images = item
+                for offset in range(len(images)):
+                    # Libère la référence du lot dès que la page est transmise
+                    image, images[offset] = images[offset], None
+                    yield start - 1 + offset, image
+                    budget.release(page_bytes)
+        finally:
+            stop_event.set()
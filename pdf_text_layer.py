@@ -0,0 +1,113 @@
+"""
+Couche texte des PDF natifs pour OCR Grec
+=========================================
+Extrait le texte existant et les boîtes des mots via poppler (pdftotext -bbox,
+déjà requis par pdf2image). Les pages dotées d'une couche texte exploitable
+n'ont pas besoin d'être rasterisées ni passées à Tesseract.
+"""
+
+import html
+import logging
+import re
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Seuils d'exploitabilité d'une couche texte
+MIN_TEXT_CHARS = 20
+MIN_LETTER_RATIO = 0.5
+
+_PAGE_RE = re.compile(r'<page\s+width="([\d.]+)"\s+height="([\d.]+)">(.*?)</page>', re.S)
+_WORD_RE = re.compile(
+    r'<word\s+xMin="([\d.]+)"\s+yMin="([\d.]+)"\s+xMax="([\d.]+)"\s+yMax="([\d.]+)">(.*?)</word>', re.S
+)
+
+
+@dataclass
+class TextLayerWord:
+    """Mot de la couche texte, boîte en points PDF"""
+    text: str
+    bbox: Tuple[float, float, float, float]
+
+
+@dataclass
+class TextLayerPage:
+    """Couche texte d'une page"""
+    width: float
+    height: float
+    words: List[TextLayerWord] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return ' '.join(word.text for word in self.words)
+
+    def is_usable(self) -> bool:
+        """Vrai si la couche contient assez de vrai texte (pas de glyphes illisibles)"""
+        chars = [c for c in self.text if not c.isspace()]
+        if len(chars) < MIN_TEXT_CHARS:
+            return False
+        letters = sum(1 for c in chars if c.isalpha())
+        return letters / len(chars) >= MIN_LETTER_RATIO and '�' not in self.text
+
+    def word_positions(self, dpi: float = 72.0) -> List[Dict[str, Any]]:
+        """Positions des mots au format des résultats OCR, en pixels au DPI donné"""
+        factor = dpi / 72.0
+        return [{
+            'text': word.text,
+            'bbox': tuple(int(round(v * factor)) for v in word.bbox),
+            'confidence': 100.0
+        } for word in self.words]
+
+
+def parse_bbox_output(output: str) -> List[TextLayerPage]:
+    """Analyse la sortie XHTML de `pdftotext -bbox`"""
+    pages = []
+    for width, height, body in _PAGE_RE.findall(output):
+        page = TextLayerPage(width=float(width), height=float(height))
+        for x_min, y_min, x_max, y_max, text in _WORD_RE.findall(body):
+            text = html.unescape(text).strip()
+            if text:
+                page.words.append(TextLayerWord(
+                    text=text,
+                    bbox=(float(x_min), float(y_min), float(x_max), float(y_max))
+                ))
+        pages.append(page)
+    return pages
+
+
+def extract_text_layer(path: str, first_page: int = 1, last_page: Optional[int] = None,
+                       timeout: int = 300) -> Dict[int, TextLayerPage]:
+    """Couche texte des pages (index 0-based → page), vide si poppler est absent"""
+    pdftotext = shutil.which("pdftotext")
+    if not pdftotext:
+        logging.warning("pdftotext introuvable : pas de détection de couche texte")
+        return {}
+
+    command = [pdftotext, "-bbox", "-enc", "UTF-8", "-f", str(first_page)]
+    if last_page is not None:
+        command += ["-l", str(last_page)]
+    command += [path, "-"]
+
+    try:
+        completed = subprocess.run(command, capture_output=True, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logging.warning(f"Extraction couche texte impossible: {e}")
+        return {}
+
+    if completed.returncode != 0:
+        logging.warning(f"pdftotext a échoué ({completed.returncode}): "
+                        f"{completed.stderr.decode('utf-8', 'replace').strip()}")
+        return {}
+
+    pages = parse_bbox_output(completed.stdout.decode('utf-8', 'replace'))
+    return {first_page - 1 + offset: page for offset, page in enumerate(pages)}
+
+
+def probe_text_layer(path: str, first_page: int = 1, last_page: Optional[int] = None) -> Dict[int, TextLayerPage]:
+    """Pages dont la couche texte est exploitable (les autres passent à l'OCR)"""
+    layers = extract_text_layer(path, first_page, last_page)
+    usable = {index: page for index, page in layers.items() if page.is_usable()}
+    if layers:
+        logging.info(f"Couche texte: {len(usable)}/{len(layers)} pages exploitables sans OCR")
+    return usable
@@ -0,0 +1,540 @@
+"""
+Pipeline de prétraitement d'images pour OCR Grec
+================================================
+Suite déclarative d'étapes nommées (grayscale, clahe, denoise, sharpen,
+binarize, deskew) activées ou non selon un profil de document. Chaque étape
+est chronométrée et utilise la variante OpenCV en niveaux de gris (moins
+coûteuse) quand l'image est un scan monochrome.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from config import Config
+
+# Une étape reçoit l'image (2D gris ou 3D RGB), ses paramètres et les
+# métadonnées du traitement ; elle retourne la nouvelle image
+StageFunction = Callable[[np.ndarray, Dict[str, Any], Dict[str, Any]], np.ndarray]
+
+# Écart maximal entre canaux pour considérer une image couleur comme monochrome
+MONOCHROME_TOLERANCE = 8
+
+# Nombre de pixels analysés pour l'estimation du bruit
+NOISE_SAMPLE_PIXELS = 1024 * 1024
+
+# Débruitage adaptatif : pas de filtre sous min_sigma, force h = factor × sigma bornée
+DENOISE_MIN_SIGMA = 3.0
+DENOISE_STRENGTH_FACTOR = 1.0
+DENOISE_MIN_STRENGTH = 5
+DENOISE_MAX_STRENGTH = 15
+
+# Nombre de résultats de prétraitement gardés en mémoire
+DEFAULT_CACHE_ENTRIES = 16
+
+# Noyau de Immerkær : annule les variations lentes (fond, traits), garde le bruit
+_NOISE_KERNEL = np.array([[1, -2, 1], [-2, 4, -2], [1, -2, 1]], dtype=np.float32)
+
+
+def is_monochrome(image: np.ndarray, tolerance: int = MONOCHROME_TOLERANCE) -> bool:
+    """Vrai si l'image est en niveaux de gris (ou un scan gris stocké en RGB)"""
+    if image.ndim == 2:
+        return True
+    # Échantillon sous-résolu : inutile de parcourir toute la page
+    sample = image[::8, ::8, :3].astype(np.int16)
+    return int(np.abs(sample - sample[..., :1]).max()) <= tolerance
+
+
+def estimate_noise(image: np.ndarray, sample_pixels: int = NOISE_SAMPLE_PIXELS) -> float:
+    """Écart-type estimé du bruit (MAD du laplacien sur une copie décimée)
+
+    La décimation (un pixel sur n, sans moyennage) conserve la statistique du
+    bruit tout en bornant le coût ; la médiane rend l'estimation insensible
+    aux bords des caractères.
+    """
+    step = max(1, int(np.sqrt(image.shape[0] * image.shape[1] / sample_pixels)))
+    sample = image[::step, ::step]
+    if sample.ndim == 3:
+        sample = cv2.cvtColor(np.ascontiguousarray(sample[..., :3]), cv2.COLOR_RGB2GRAY)
+    if min(sample.shape[:2]) < 3:
+        return 0.0
+
+    response = cv2.filter2D(sample.astype(np.float32), -1, _NOISE_KERNEL)[1:-1, 1:-1]
+    # Le noyau multiplie l'écart-type du bruit par sqrt(36) = 6
+    return float(np.median(np.abs(response)) / 0.6745 / 6.0)
+
+
+def _grayscale(image: np.ndarray, params: Dict[str, Any], metadata: Dict[str, Any]) -> np.ndarray:
+    if image.ndim == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+
+
+def _clahe(image: np.ndarray, params: Dict[str, Any], metadata: Dict[str, Any]) -> np.ndarray:
+    tile = params.get("tile_grid", 8)
+    clahe = cv2.createCLAHE(clipLimit=params.get("clip_limit", 3.0), tileGridSize=(tile, tile))
+    if image.ndim == 2:
+        return clahe.apply(image)
+
+    # Contraste sur la luminance uniquement
+    lab = cv2.cvtColor(image, cv2.COLOR_RGB2LAB)
+    l, a, b = cv2.split(lab)
+    return cv2.cvtColor(cv2.merge((clahe.apply(l), a, b)), cv2.COLOR_LAB2RGB)
+
+
+def _denoise(image: np.ndarray, params: Dict[str, Any], metadata: Dict[str, Any]) -> np.ndarray:
+    h = params.get("h", 10)
+    h_color = params.get("h_color", 10)
+
+    # Bruit mesuré par prepare() ; adaptive=False garde les forces fixes
+    sigma = metadata.get("noise_sigma") if params.get("adaptive", True) else None
+    if sigma is not None:
+        # Force adaptée au bruit mesuré ; les scans propres ne sont pas filtrés
+        if sigma < params.get("min_sigma", DENOISE_MIN_SIGMA):
+            metadata["denoise"] = {"applied": False, "sigma": sigma, "strength": 0}
+            return image
+        h = int(round(min(params.get("max_strength", DENOISE_MAX_STRENGTH),
+                          max(params.get("min_strength", DENOISE_MIN_STRENGTH),
+                              params.get("strength_factor", DENOISE_STRENGTH_FACTOR) * sigma))))
+        h_color = h
+    metadata["denoise"] = {"applied": True, "sigma": sigma, "strength": h}
+
+    template = params.get("template_window", 7)
+    search = params.get("search_window", 21)
+    if image.ndim == 2:
+        return cv2.fastNlMeansDenoising(image, None, h, template, search)
+    return cv2.fastNlMeansDenoisingColored(image, None, h, h_color, template, search)
+
+
+def _sharpen(image: np.ndarray, params: Dict[str, Any], metadata: Dict[str, Any]) -> np.ndarray:
+    kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
+    return cv2.filter2D(image, -1, kernel)
+
+
+def estimate_skew(gray: np.ndarray, max_angle: float = 5.0, work_size: int = 1000,
+                  coarse_step: float = 0.5, fine_step: float = 0.05) -> float:
+    """Angle d'inclinaison des lignes (degrés) par profils de projection
+
+    L'estimation se fait sur une copie réduite : pour chaque angle candidat,
+    les pixels d'encre sont projetés sur des lignes inclinées en une seule
+    opération vectorisée, et l'angle retenu est celui dont le profil est le
+    plus contrasté (somme des carrés maximale). Recherche grossière puis fine.
+    """
+    scale = min(1.0, work_size / max(gray.shape[:2]))
+    small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else gray
+    _, ink = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    ys, xs = np.nonzero(ink)
+    if len(ys) < 50:
+        return 0.0
+
+    # Au-delà, un échantillon régulier des pixels d'encre suffit
+    step = max(1, len(ys) // 200000)
+    ys = ys[::step].astype(np.float64)
+    xs = xs[::step].astype(np.float64)
+
+    def best_angle(angles: np.ndarray) -> float:
+        slopes = np.tan(np.deg2rad(angles))[:, None]
+        rows = np.rint(ys[None, :] - xs[None, :] * slopes).astype(np.int64)
+        rows -= rows.min()
+        row_count = int(rows.max()) + 1
+        rows += np.arange(len(angles))[:, None] * row_count
+        profiles = np.bincount(rows.ravel(), minlength=len(angles) * row_count).reshape(len(angles), row_count)
+        scores = np.square(profiles, dtype=np.float64).sum(axis=1)
+        return float(angles[int(np.argmax(scores))])
+
+    coarse = best_angle(np.arange(-max_angle, max_angle + coarse_step / 2, coarse_step))
+    return round(best_angle(np.arange(coarse - coarse_step, coarse + coarse_step + fine_step / 2, fine_step)), 2)
+
+
+def sauvola_threshold(gray: np.ndarray, window: int = 31, k: float = 0.2, r: float = 128.0) -> np.ndarray:
+    """Binarisation de Sauvola (moyenne et écart-type locaux par filtres boîte)"""
+    values = gray.astype(np.float32)
+    mean = cv2.boxFilter(values, -1, (window, window), borderType=cv2.BORDER_REFLECT)
+    sq_mean = cv2.boxFilter(values * values, -1, (window, window), borderType=cv2.BORDER_REFLECT)
+    std = np.sqrt(np.maximum(sq_mean - mean * mean, 0))
+    threshold = mean * (1 + k * (std / r - 1))
+    return np.where(values > threshold, 255, 0).astype(np.uint8)
+
+
+def _binarize(image: np.ndarray, params: Dict[str, Any], metadata: Dict[str, Any]) -> np.ndarray:
+    gray = _grayscale(image, params, metadata)
+    method = params.get("method", "sauvola")
+    window = params.get("window", 31) | 1
+
+    if method == "sauvola":
+        binary = sauvola_threshold(gray, window, params.get("k", 0.2))
+    elif method == "adaptive":
+        binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+                                       window, params.get("c", 10))
+    else:
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    metadata["binarization"] = method
+    return binary
+
+
+def _deskew(image: np.ndarray, params: Dict[str, Any], metadata: Dict[str, Any]) -> np.ndarray:
+    gray = _grayscale(image, params, metadata)
+    angle = estimate_skew(gray, params.get("max_angle", 5.0), params.get("work_size", 1000))
+    metadata["skew_angle"] = angle
+    if abs(angle) < params.get("min_angle", 0.1):
+        return image
+
+    height, width = image.shape[:2]
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+    # Permet de ramener les boîtes de mots dans le repère de l'image d'origine
+    metadata["deskew_matrix"] = matrix.tolist()
+    return cv2.warpAffine(image, matrix, (width, height), flags=cv2.INTER_LINEAR,
+                          borderMode=cv2.BORDER_REPLICATE)
+
+
+def unskew_box(box: Tuple[int, int, int, int], metadata: Dict[str, Any]) -> Tuple[int, int, int, int]:
+    """Ramène une boîte de l'image redressée dans le repère de l'image d'origine"""
+    matrix = metadata.get("deskew_matrix")
+    if not matrix:
+        return box
+
+    inverse = cv2.invertAffineTransform(np.array(matrix, dtype=np.float64))
+    x1, y1, x2, y2 = box
+    corners = np.array([[x1, y1, 1], [x2, y1, 1], [x1, y2, 1], [x2, y2, 1]], dtype=np.float64)
+    points = corners @ inverse.T
+    return (int(points[:, 0].min()), int(points[:, 1].min()),
+            int(round(points[:, 0].max())), int(round(points[:, 1].max())))
+
+
+# Étapes disponibles, dans leur ordre d'application
+STAGES: Dict[str, StageFunction] = {
+    "grayscale": _grayscale,
+    "clahe": _clahe,
+    "denoise": _denoise,
+    "sharpen": _sharpen,
+    "deskew": _deskew,
+    "binarize": _binarize
+}
+
+# Profils de document : étapes activées
+PROFILES: Dict[str, List[str]] = {
+    # Photos couleur de manuscrits (traitement historique complet)
+    "standard": ["clahe", "denoise", "sharpen"],
+    # Scans monochromes : mêmes étapes sur un seul canal (débruitage fastNlMeansDenoising)
+    "scan": ["grayscale", "clahe", "denoise", "sharpen"],
+    # Scans anciens, bruités ou de travers
+    "degraded": ["grayscale", "clahe", "denoise", "sharpen", "deskew", "binarize"],
+    # Entrée directe de Tesseract : page redressée et binarisée
+    "tesseract": ["grayscale", "deskew", "binarize"],
+    # Pages nettes (PDF rendus) : conversion seule
+    "clean": ["grayscale"]
+}
+
+
+def stage_margin(name: str, params: Dict[str, Any]) -> Optional[int]:
+    """Contexte (pixels) dont une étape a besoin autour d'une tuile ; None si globale
+
+    Les étapes globales (CLAHE, dont la grille dépend de la taille de l'image,
+    redressement, seuil d'Otsu) s'appliquent toujours à la page entière.
+    """
+    if name == "grayscale":
+        return 0
+    if name == "sharpen":
+        return 1
+    if name == "denoise":
+        return params.get("search_window", 21) // 2 + params.get("template_window", 7) // 2
+    if name == "binarize" and params.get("method", "sauvola") in ("sauvola", "adaptive"):
+        return params.get("window", 31) // 2 + 1
+    return None
+
+
+def apply_stages(stages: List[str], params: Dict[str, Dict[str, Any]], image: np.ndarray,
+                 metadata: Dict[str, Any], timings: Dict[str, float]) -> np.ndarray:
+    """Applique des étapes dans l'ordre en cumulant leur durée dans `timings`"""
+    for name in stages:
+        start = time.perf_counter()
+        image = STAGES[name](image, params.get(name, {}), metadata)
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+    return image
+
+
+@dataclass
+class PreprocessingResult:
+    """Image prétraitée et mesures du pipeline"""
+    image: np.ndarray
+    profile: str
+    stages: List[str]
+    timings: Dict[str, float] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.timings.values())
+
+    def to_pil(self) -> Image.Image:
+        return Image.fromarray(self.image)
+
+
+def image_digest(image: np.ndarray) -> str:
+    """Empreinte du contenu de l'image (pixels, forme, type)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.shape}|{image.dtype}".encode("ascii"))
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+class PreprocessingCache:
+    """Cache adressé par contenu des images prétraitées
+
+    Clé : empreinte des pixels source et signature du pipeline (étapes,
+    paramètres). Un LRU mémoire borné en octets sert de façade à un magasin
+    de blobs sur disque (.npy + métadonnées .json), lui aussi borné : changer
+    seulement les réglages OCR (langue, PSM, zone) ne refait pas le prétraitement.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES, max_bytes: Optional[int] = None,
+                 store_dir: Optional[Path] = None, max_disk_bytes: Optional[int] = None,
+                 disk: bool = True) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes or Config.PERFORMANCE["preprocessing_cache_memory"]
+        self.entries: "OrderedDict[str, PreprocessingResult]" = OrderedDict()
+        self.current_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_evictions": 0}
+
+        # Magasin disque (désactivé si le répertoire n'est pas accessible)
+        self.store_dir: Optional[Path] = None
+        self.max_disk_bytes = max_disk_bytes or Config.PERFORMANCE["preprocessing_cache_disk"]
+        self.disk_bytes = 0
+        if disk:
+            try:
+                self.store_dir = Path(store_dir or Path(Config.DEFAULT_PATHS["cache_dir"]) / "preprocessed")
+                self.store_dir.mkdir(parents=True, exist_ok=True)
+                self.disk_bytes = sum(path.stat().st_size for path in self.store_dir.glob("*/*"))
+            except OSError as e:
+                logging.warning(f"Cache disque de prétraitement indisponible: {e}")
+                self.store_dir = None
+
+    @staticmethod
+    def make_key(source_digest: str, signature: str) -> str:
+        """Clé de contenu : (empreinte de l'image source, signature du pipeline)"""
+        return hashlib.sha256(f"{source_digest}|{signature}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str, keep_in_memory: bool = True) -> Optional["PreprocessingResult"]:
+        """Résultat en mémoire, sinon relu du disque (et remonté en mémoire)"""
+        with self._lock:
+            result = self.entries.get(key)
+            if result is not None:
+                self.stats["hits"] += 1
+                self.entries.move_to_end(key)
+                return result
+
+        result = self._read_blob(key)
+        with self._lock:
+            if result is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["disk_hits"] += 1
+        if keep_in_memory:
+            self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: "PreprocessingResult", keep_in_memory: bool = True) -> None:
+        """Enregistre un résultat sur disque et, au besoin, en mémoire"""
+        if keep_in_memory:
+            self._remember(key, result)
+        self._write_blob(key, result)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statistiques des deux niveaux du cache"""
+        with self._lock:
+            return {
+                **self.stats,
+                "entries": len(self.entries),
+                "memory_bytes": self.current_bytes,
+                "disk_bytes": self.disk_bytes,
+                "store_dir": str(self.store_dir) if self.store_dir else None
+            }
+
+    def _remember(self, key: str, result: "PreprocessingResult") -> None:
+        with self._lock:
+            if key in self.entries:
+                self.current_bytes -= self.entries[key].image.nbytes
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            self.current_bytes += result.image.nbytes
+            # On garde toujours au moins le résultat le plus récent
+            while len(self.entries) > 1 and (len(self.entries) > self.max_entries
+                                             or self.current_bytes > self.max_bytes):
+                _, evicted = self.entries.popitem(last=False)
+                self.current_bytes -= evicted.image.nbytes
+                self.stats["evictions"] += 1
+
+    def _blob_paths(self, key: str) -> Tuple[Path, Path]:
+        folder = self.store_dir / key[:2]
+        return folder / f"{key}.npy", folder / f"{key}.json"
+
+    def _read_blob(self, key: str) -> Optional["PreprocessingResult"]:
+        if self.store_dir is None:
+            return None
+        image_path, meta_path = self._blob_paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                info = json.load(f)
+            image = np.load(image_path)
+            # Date d'accès pour l'éviction LRU du disque
+            os.utime(image_path)
+        except (OSError, ValueError):
+            return None
+        return PreprocessingResult(image, info["profile"], info["stages"], {}, info["metadata"])
+
+    def _write_blob(self, key: str, result: "PreprocessingResult") -> None:
+        if self.store_dir is None:
+            return
+        image_path, meta_path = self._blob_paths(key)
+        if image_path.exists():
+            return
+        try:
+            image_path.parent.mkdir(exist_ok=True)
+            tmp_path = image_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, result.image)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"profile": result.profile, "stages": result.stages,
+                           "metadata": result.metadata}, f, default=str)
+            os.replace(tmp_path, image_path)
+        except OSError as e:
+            logging.warning(f"Écriture du cache de prétraitement impossible: {e}")
+            return
+
+        with self._lock:
+            self.disk_bytes += image_path.stat().st_size + meta_path.stat().st_size
+            over_budget = self.disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Supprime les blobs les moins récemment utilisés jusqu'à repasser sous le budget"""
+        blobs = sorted(self.store_dir.glob("*/*.npy"), key=lambda path: path.stat().st_mtime)
+        for image_path in blobs:
+            with self._lock:
+                if self.disk_bytes <= self.max_disk_bytes * 0.9:
+                    return
+            meta_path = image_path.with_suffix(".json")
+            try:
+                size = image_path.stat().st_size + (meta_path.stat().st_size if meta_path.exists() else 0)
+                image_path.unlink()
+                meta_path.unlink(missing_ok=True)
+            except OSError:
+                continue
+            with self._lock:
+                self.disk_bytes -= size
+                self.stats["disk_evictions"] += 1
+
+
+class PreprocessingPipeline:
+    """Pipeline d'étapes de prétraitement nommées, chronométrées une à une"""
+
+    def __init__(self, stages: List[str], params: Optional[Dict[str, Dict[str, Any]]] = None,
+                 profile: str = "custom", cache: Optional[PreprocessingCache] = None,
+                 tiler: Optional[Any] = None) -> None:
+        unknown = [name for name in stages if name not in STAGES]
+        if unknown:
+            raise ValueError(f"Étapes de prétraitement inconnues: {', '.join(unknown)}")
+
+        # Ordre canonique des étapes, quel que soit l'ordre de déclaration
+        self.stages = [name for name in STAGES if name in stages]
+        self.params = params or {}
+        self.profile = profile
+        self.cache = cache
+        # Exécuteur en tuiles (TiledPreprocessor) pour les très grandes pages
+        self.tiler = tiler
+
+    @classmethod
+    def from_profile(cls, profile: str, overrides: Optional[Dict[str, bool]] = None,
+                     params: Optional[Dict[str, Dict[str, Any]]] = None,
+                     cache: Optional[PreprocessingCache] = None,
+                     tiler: Optional[Any] = None) -> "PreprocessingPipeline":
+        """Pipeline d'un profil, avec étapes activées/désactivées individuellement"""
+        if profile not in PROFILES:
+            raise ValueError(f"Profil de prétraitement inconnu: {profile}")
+
+        stages = set(PROFILES[profile])
+        for name, enabled in (overrides or {}).items():
+            if enabled:
+                stages.add(name)
+            else:
+                stages.discard(name)
+        return cls(list(stages), params, profile, cache, tiler)
+
+    @property
+    def signature(self) -> str:
+        """Étapes et paramètres effectifs (partie de la clé de cache)"""
+        return json.dumps({"stages": self.stages,
+                           "params": {name: self.params.get(name, {}) for name in self.stages}},
+                          sort_keys=True, default=str)
+
+    def run(self, image: np.ndarray, keep_in_memory: bool = True) -> PreprocessingResult:
+        """Applique les étapes et mesure le temps de chacune (ou relit le cache)
+
+        keep_in_memory=False réserve le résultat au cache disque (parcours de
+        documents entiers, qui ne doivent pas évincer les pages consultées).
+        """
+        if self.cache is not None:
+            start = time.perf_counter()
+            key = self.cache.make_key(image_digest(image), self.signature)
+            cached = self.cache.get(key, keep_in_memory)
+            if cached is not None:
+                logging.info(f"Prétraitement ({self.profile}): résultat en cache")
+                return PreprocessingResult(cached.image, cached.profile, list(cached.stages),
+                                           {"cache": time.perf_counter() - start},
+                                           {**cached.metadata, "cached": True})
+            result = self._run(image)
+            self.cache.put(key, result, keep_in_memory)
+            return result
+        return self._run(image)
+
+    def _run(self, image: np.ndarray) -> PreprocessingResult:
+        image, metadata, timings = self.prepare(image)
+
+        if self.tiler is not None and self.tiler.should_tile(image):
+            # Très grandes pages : étapes locales réparties en tuiles sur le pool de processus
+            image = self.tiler.apply(self, image, metadata, timings)
+        else:
+            image = apply_stages(self.stages, self.params, image, metadata, timings)
+
+        result = PreprocessingResult(image, self.profile, list(self.stages), timings, metadata)
+        logging.info(f"Prétraitement ({self.profile}): " + ", ".join(
+            f"{name} {seconds:.2f}s" for name, seconds in timings.items()) + f" — total {result.total_time:.2f}s")
+        return result
+
+    def prepare(self, image: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any], Dict[str, float]]:
+        """Mesures sur la page entière, avant les étapes (monochromie, bruit)"""
+        metadata: Dict[str, Any] = {"monochrome": is_monochrome(image)}
+
+        # Scan monochrome stocké en couleur : un seul canal suffit pour toutes les étapes
+        if image.ndim == 3 and metadata["monochrome"]:
+            image = np.ascontiguousarray(image[..., 0])
+        elif image.ndim == 3 and image.shape[2] == 4:
+            image = cv2.cvtColor(image, cv2.COLOR_RGBA2RGB)
+
+        timings: Dict[str, float] = {}
+
+        # Mesure du bruit avant tout traitement, pour chaque page : décide du
+        # débruitage et de sa force, et reste dans les métadonnées du résultat
+        start = time.perf_counter()
+        metadata["noise_sigma"] = estimate_noise(image)
+        timings["noise_estimate"] = time.perf_counter() - start
+        if "denoise" not in self.stages and metadata["noise_sigma"] >= self.params.get(
+                "denoise", {}).get("min_sigma", DENOISE_MIN_SIGMA):
+            logging.info(f"Page bruitée (sigma {metadata['noise_sigma']:.1f}) sans étape de débruitage "
+                         f"dans le profil {self.profile}")
+
+        return image, metadata, timings
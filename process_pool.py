@@ -0,0 +1,96 @@
+"""
+Pool de processus partagé pour OCR Grec
+=======================================
+Un seul ProcessPoolExecutor pour les traitements lourds (tuiles de
+prétraitement, OCR parallèle), créé à la première demande à sa taille
+maximale et arrêté à la sortie ; il n'est jamais remplacé, chaque appelant
+borne lui-même le nombre de tâches qu'il soumet. Les cœurs sont partagés entre les processus : chaque processus limite
+OpenMP (Tesseract) et OpenCV à sa part, un thread dès que les processus
+sont aussi nombreux que les cœurs. La limite OpenMP est placée dans
+l'environnement dès l'import de ce module, avant le chargement de
+libtesseract ; les processus du pool en héritent.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from config import Config
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_lock = threading.Lock()
+
+
+def default_worker_count() -> int:
+    """Nombre de processus : taille de pool configurée, bornée par les cœurs"""
+    return max(1, min(Config.PERFORMANCE["thread_pool_size"], os.cpu_count() or 1))
+
+
+def pool_worker_count() -> int:
+    """Taille du pool partagé : le plus grand nombre de processus configuré"""
+    return max(default_worker_count(), Config.PERFORMANCE["page_workers"] or 0)
+
+
+def worker_thread_count(workers: int) -> int:
+    """Threads OpenMP/OpenCV par processus : part des cœurs, au moins un"""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def limit_openmp_threads(workers: Optional[int] = None) -> None:
+    """Limite OpenMP (threads internes de Tesseract) de ce processus et de ses enfants
+
+    libgomp ne lit OMP_THREAD_LIMIT qu'une fois, à son chargement : la valeur
+    doit être posée avant le premier import de tesserocr. Une valeur déjà
+    fixée dans l'environnement est conservée.
+    """
+    threads = str(worker_thread_count(workers or pool_worker_count()))
+    os.environ.setdefault("OMP_THREAD_LIMIT", threads)
+    os.environ.setdefault("OMP_NUM_THREADS", threads)
+
+
+def _init_worker(threads: int = 1) -> None:
+    # OpenCV se règle à chaud ; OpenMP est déjà borné par l'environnement hérité
+    try:
+        import cv2
+        cv2.setNumThreads(threads)
+    except ImportError:
+        pass
+
+
+def get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Pool partagé, créé une fois à sa taille maximale
+
+    Le remplacer en cours de route arrêterait celui dont d'autres appelants
+    attendent encore les résultats : une demande plus grande que le pool se
+    contente de ses processus (les tâches en trop attendent leur tour).
+    """
+    global _pool, _pool_workers
+    with _lock:
+        if _pool is None:
+            workers = max(max_workers or 0, pool_worker_count())
+            threads = worker_thread_count(workers)
+            _pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(threads,))
+            _pool_workers = workers
+            logging.info(f"Pool de processus démarré: {workers} processus, {threads} thread(s) OpenMP chacun")
+        elif max_workers and max_workers > _pool_workers:
+            logging.debug(f"Pool de processus: {max_workers} demandés, {_pool_workers} disponibles")
+        return _pool
+
+
+def shutdown_process_pool() -> None:
+    """Arrête le pool partagé (tâches en attente annulées)"""
+    global _pool, _pool_workers
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+            _pool_workers = 0
+
+
+atexit.register(shutdown_process_pool)
+
+limit_openmp_threads()
@@ -0,0 +1,91 @@
+"""
+Regroupement des petites zones pour OCR Grec
+============================================
+Vingt notes marginales sélectionnées, c'est vingt lancements de Tesseract
+pour quelques mots chacun. Les petites zones sont recopiées sur une planche
+blanche, empilées avec une marge, et reconnues en une seule passe en mode
+épars. Seuls les pixels sélectionnés figurent sur la planche : aucun texte
+voisin ne peut s'y glisser, et chaque mot est rendu à sa zone d'après sa
+boîte.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from PIL import Image
+
+# Zone « petite » : en dessous de cette surface (pixels du raster OCR)
+MAX_SMALL_REGION_PIXELS = 150_000
+
+# Limites d'une planche
+MAX_BATCH_REGIONS = 12
+MAX_BATCH_HEIGHT = 4000
+
+# Marge blanche autour de chaque zone sur la planche
+BATCH_PADDING = 24
+
+
+@dataclass
+class RegionBatch:
+    """Planche de petites zones reconnue en une seule passe"""
+    indices: List[int]
+    image: Image.Image
+    # Emplacement (x1, y1, x2, y2) de chaque zone sur la planche
+    boxes: List[Tuple[int, int, int, int]] = field(default_factory=list)
+
+
+def is_small_region(crop: Image.Image) -> bool:
+    return crop.width * crop.height < MAX_SMALL_REGION_PIXELS
+
+
+def plan_region_batches(crops: List[Image.Image]) -> Tuple[List[int], List[List[int]]]:
+    """Zones traitées seules, et groupes de petites zones à regrouper"""
+    singles: List[int] = []
+    groups: List[List[int]] = []
+    height = 0
+    for index, crop in enumerate(crops):
+        if not is_small_region(crop):
+            singles.append(index)
+            continue
+        needed = crop.height + 2 * BATCH_PADDING
+        if not groups or len(groups[-1]) >= MAX_BATCH_REGIONS or height + needed > MAX_BATCH_HEIGHT:
+            groups.append([])
+            height = 0
+        groups[-1].append(index)
+        height += needed
+
+    # Une petite zone isolée n'a rien à gagner d'une planche
+    for group in [group for group in groups if len(group) == 1]:
+        groups.remove(group)
+        singles.append(group[0])
+    return sorted(singles), groups
+
+
+def build_region_batch(crops: List[Image.Image], indices: List[int]) -> RegionBatch:
+    """Empile les zones verticalement sur une planche blanche"""
+    width = max(crops[i].width for i in indices) + 2 * BATCH_PADDING
+    height = sum(crops[i].height + 2 * BATCH_PADDING for i in indices)
+    sheet = Image.new("L", (width, height), 255)
+
+    boxes = []
+    y = 0
+    for i in indices:
+        crop = crops[i]
+        x1, y1 = BATCH_PADDING, y + BATCH_PADDING
+        sheet.paste(crop.convert("L"), (x1, y1))
+        boxes.append((x1, y1, x1 + crop.width, y1 + crop.height))
+        y += crop.height + 2 * BATCH_PADDING
+    return RegionBatch(list(indices), sheet, boxes)
+
+
+def split_batch_words(batch: RegionBatch, words: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+    """Rend chaque mot à sa zone (centre de la boîte), en coordonnées de la zone"""
+    by_region: Dict[int, List[Dict[str, Any]]] = {index: [] for index in batch.indices}
+    for word in words:
+        wx1, wy1, wx2, wy2 = word["bbox"]
+        cx, cy = (wx1 + wx2) / 2, (wy1 + wy2) / 2
+        for index, (x1, y1, x2, y2) in zip(batch.indices, batch.boxes):
+            if x1 <= cx <= x2 and y1 <= cy <= y2:
+                by_region[index].append({**word, "bbox": (wx1 - x1, wy1 - y1, wx2 - x1, wy2 - y1)})
+                break
+    return by_region
@@ -0,0 +1,98 @@
+"""Tests du pipeline OCR en flux (ocr_pipeline)"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ocr_pipeline import ParallelStage, StreamingPipeline
+
+
+def slow_square(value):
+    # Durées aléatoires : les éléments se terminent dans le désordre
+    time.sleep(random.uniform(0, 0.01))
+    return value * value
+
+
+def test_sequential_stages_in_order():
+    pipeline = StreamingPipeline([("double", lambda x: 2 * x), ("plus_one", lambda x: x + 1)])
+
+    assert list(pipeline.run(range(10))) == [2 * x + 1 for x in range(10)]
+
+
+def test_parallel_stage_preserves_input_order():
+    completed = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        stage = ParallelStage("square", slow_square, executor, window=4,
+                              on_complete=lambda item, done: completed.append(done))
+        results = list(StreamingPipeline([stage, ("str", str)]).run(range(30)))
+
+    assert results == [str(x * x) for x in range(30)]
+    assert len(completed) == 30
+    assert stage.completed == 30
+
+
+def test_parallel_stage_bypass_skips_executor():
+    calls = []
+
+    def record(item):
+        calls.append(item)
+        return item + 100
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stage = ParallelStage("record", record, executor, window=2, bypass=lambda item: item % 2 == 0)
+        results = list(StreamingPipeline([stage]).run(range(6)))
+
+    assert results == [0, 101, 2, 103, 4, 105]
+    assert sorted(calls) == [1, 3, 5]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_stage_error_reaches_consumer(parallel):
+    def fail_on_three(value):
+        if value == 3:
+            raise ValueError("page 3")
+        return value
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stage = ParallelStage("check", fail_on_three, executor) if parallel else ("check", fail_on_three)
+        received = []
+        with pytest.raises(ValueError, match="page 3"):
+            for item in StreamingPipeline([stage]).run(range(10)):
+                received.append(item)
+
+    assert received == [0, 1, 2]
+
+
+def test_source_error_reaches_consumer():
+    def source():
+        yield 1
+        raise OSError("rendu impossible")
+
+    with pytest.raises(OSError, match="rendu impossible"):
+        list(StreamingPipeline([("identity", lambda x: x)]).run(source()))
+
+
+def test_closing_consumer_stops_stages_and_source():
+    closed = threading.Event()
+    produced = []
+
+    def source():
+        try:
+            for i in range(1000):
+                produced.append(i)
+                yield i
+        finally:
+            closed.set()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stage = ParallelStage("square", slow_square, executor, window=2)
+        results = StreamingPipeline([stage], queue_size=1).run(source())
+        assert [next(results) for _ in range(3)] == [0, 1, 4]
+        results.close()
+
+        assert closed.wait(timeout=2)
+    # Files bornées : la source ne prend que peu d'avance sur le consommateur
+    assert len(produced) < 20
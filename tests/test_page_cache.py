@@ -0,0 +1,132 @@
+"""Tests du cache LRU des pages (page_cache)"""
+
+from collections.abc import Sequence
+
+from PIL import Image
+
+from page_cache import PageCache, image_nbytes
+from page_source import ImagePageSource
+from page_store import DiskPageStore
+
+
+def page(size=(10, 10), mode="L"):
+    return Image.new(mode, size, 255)
+
+
+class ListSource(Sequence):
+    """Source de pages en mémoire, avec un chemin pour les clés du cache"""
+
+    def __init__(self, path, count):
+        self.path = path
+        self.pages = [page((20, 20), "RGB") for _ in range(count)]
+
+    def __len__(self):
+        return len(self.pages)
+
+    def __getitem__(self, index):
+        return self.pages[index]
+
+
+def test_eviction_by_count_drops_least_recent():
+    cache = PageCache(max_entries=2, max_bytes=10 ** 9)
+    cache.put("a", page())
+    cache.put("b", page())
+    cache.get("a")
+    cache.put("c", page())
+
+    assert set(cache.entries) == {"a", "c"}
+    assert cache.order == ["a", "c"]
+    assert cache.stats["evictions"] == 1
+
+
+def test_eviction_by_bytes():
+    cache = PageCache(max_entries=100, max_bytes=250)
+    for key in "abc":
+        cache.put(key, page())
+
+    assert list(cache.entries) == ["b", "c"]
+    assert cache.current_bytes == 200
+    assert cache.stats["evicted_bytes"] == 100
+
+
+def test_most_recent_page_kept_even_over_budget():
+    cache = PageCache(max_entries=4, max_bytes=10)
+    cache.put("big", page((100, 100)))
+
+    assert list(cache.entries) == ["big"]
+    assert cache.current_bytes == image_nbytes(cache.entries["big"])
+
+
+def test_replacing_an_entry_updates_byte_count():
+    cache = PageCache(max_entries=4, max_bytes=10 ** 9)
+    cache.put("a", page((10, 10)))
+    cache.put("a", page((20, 10)))
+
+    assert cache.current_bytes == 200
+    assert cache.order == ["a"]
+
+
+def test_shared_containers_reflect_cache_content():
+    entries, order = {}, []
+    cache = PageCache(entries, order, max_entries=1, max_bytes=10 ** 9)
+    cache.put("a", page())
+    cache.put("b", page())
+
+    assert list(entries) == ["b"]
+    assert order == ["b"]
+
+
+def test_get_or_load_loads_once():
+    cache = PageCache(max_entries=4, max_bytes=10 ** 9)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return page()
+
+    first = cache.get_or_load("a", loader)
+    second = cache.get_or_load("a", loader)
+
+    assert first is second
+    assert len(calls) == 1
+    assert cache.get_statistics()["hit_rate"] == 0.5
+
+
+def test_invalidate_removes_only_one_document():
+    cache = PageCache(max_entries=10, max_bytes=10 ** 9)
+    cache.put(PageCache.make_key("doc1.pdf", 0, 300, "L"), page())
+    cache.put(PageCache.make_key("doc2.pdf", 0, 300, "L"), page())
+
+    cache.invalidate("doc1.pdf")
+
+    assert list(cache.entries) == [PageCache.make_key("doc2.pdf", 0, 300, "L")]
+    assert cache.current_bytes == 100
+
+
+def test_closing_disk_store_releases_pages_and_files(tmp_path):
+    cache = PageCache(max_entries=10, max_bytes=10 ** 9)
+    store = DiskPageStore(ListSource("book.pdf", 3), store_dir=tmp_path, cache=cache)
+    store[0]
+    store.get_ocr_image(1)
+    assert PageCache.make_key("book.pdf", 1, 0, "L") in cache.entries
+    assert any(store.store_dir.iterdir())
+
+    store.close()
+
+    assert cache.entries == {}
+    assert cache.current_bytes == 0
+    assert not store.store_dir.exists()
+
+
+def test_closing_image_source_releases_ocr_raster(tmp_path):
+    path = tmp_path / "page.png"
+    page((300, 200), "RGB").save(path)
+    cache = PageCache(max_entries=10, max_bytes=10 ** 9)
+    source = ImagePageSource(str(path), max_size=100, cache=cache)
+
+    assert source.get_ocr_image(0) is source.get_ocr_image(0)
+    assert len(cache.entries) == 1
+
+    source.close()
+
+    assert cache.entries == {}
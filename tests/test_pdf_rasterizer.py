@@ -0,0 +1,69 @@
+"""Tests du découpage en lots de la rasterisation PDF (pdf_rasterizer)"""
+
+import pytest
+
+from config import PDFConfig
+from pdf_rasterizer import PDF_SUPPORT, PDFRasterizer
+
+pytestmark = pytest.mark.skipif(not PDF_SUPPORT, reason="pdf2image non installé")
+
+
+def rasterizer(pages=20, batch_size=4, memory_limit=10 ** 12, dpi=72, grayscale=True,
+               page_size="100 x 200 pts"):
+    """Rasteriseur sans PDF réel : pdfinfo fourni directement"""
+    config = PDFConfig(batch_size=batch_size, memory_limit_per_batch=memory_limit)
+    return PDFRasterizer("document.pdf", dpi=dpi, grayscale=grayscale, pdf_config=config,
+                         info={"Pages": pages, "Page size": page_size})
+
+
+def test_batch_size_is_capped_by_config():
+    assert rasterizer(batch_size=4).pages_per_batch() == 4
+
+
+def test_batch_size_is_capped_by_memory_budget():
+    # Page de 100 x 200 px en gris : 20 000 octets ; deux lots de 3 pages tiennent en 120 000
+    r = rasterizer(batch_size=50, memory_limit=130_000)
+
+    assert r.estimate_page_bytes() == 20_000
+    assert r.pages_per_batch() == 3
+
+
+def test_batch_size_accounts_for_dpi_and_colour():
+    r = rasterizer(batch_size=50, memory_limit=2 * 6 * 240_000, dpi=144, grayscale=False)
+
+    assert r.estimate_page_bytes() == 200 * 400 * 3
+    assert r.pages_per_batch() == 6
+
+
+def test_page_larger_than_budget_still_gets_one_page_batches():
+    assert rasterizer(memory_limit=1000).pages_per_batch() == 1
+
+
+def test_whole_document_is_split_into_batches():
+    assert rasterizer(pages=10, batch_size=4).batch_ranges() == [(1, 4), (5, 8), (9, 10)]
+
+
+def test_range_is_clamped_to_document():
+    r = rasterizer(pages=10, batch_size=4)
+
+    assert r.batch_ranges(first_page=3, last_page=50) == [(3, 6), (7, 10)]
+    assert r.batch_ranges(first_page=0, last_page=2) == [(1, 2)]
+
+
+def test_selected_pages_are_grouped_into_runs():
+    r = rasterizer(pages=20, batch_size=10)
+
+    # Index 0-based → plages 1-indexées de pages consécutives
+    assert r.batch_ranges(pages=[5, 0, 1, 2, 9, 10, 2]) == [(1, 3), (6, 6), (10, 11)]
+
+
+def test_long_runs_are_split_at_batch_size():
+    r = rasterizer(pages=20, batch_size=3)
+
+    assert r.batch_ranges(pages=list(range(2, 9)) + [15]) == [(3, 5), (6, 8), (9, 9), (16, 16)]
+
+
+def test_selected_pages_outside_range_are_ignored():
+    r = rasterizer(pages=10, batch_size=5)
+
+    assert r.batch_ranges(first_page=3, last_page=6, pages=[0, 2, 3, 5, 7, 25]) == [(3, 4), (6, 6)]
@@ -0,0 +1,59 @@
+"""Tests des estimations d'inclinaison et de bruit (preprocessing)"""
+
+import cv2
+import numpy as np
+import pytest
+
+from preprocessing import estimate_noise, estimate_skew
+
+
+def text_page(angle, size=(1200, 900)):
+    """Page blanche avec des « lignes de texte » (tirets) inclinées de `angle` degrés"""
+    height, width = size
+    page = np.full(size, 255, dtype=np.uint8)
+    slope = np.tan(np.deg2rad(angle))
+    for y0 in range(80, height - 80, 40):
+        for x0 in range(60, width - 100, 50):
+            x1 = x0 + 35
+            cv2.line(page, (x0, int(round(y0 + x0 * slope))), (x1, int(round(y0 + x1 * slope))), 0, 6)
+    return page
+
+
+@pytest.mark.parametrize("angle", [-3.0, -1.2, 0.0, 0.7, 2.5])
+def test_skew_matches_line_angle(angle):
+    assert estimate_skew(text_page(angle)) == pytest.approx(angle, abs=0.15)
+
+
+def test_skew_is_found_on_reduced_copy_of_large_page():
+    assert estimate_skew(text_page(1.5, size=(3000, 2200)), work_size=800) == pytest.approx(1.5, abs=0.2)
+
+
+def test_skew_of_blank_page_is_zero():
+    assert estimate_skew(np.full((500, 400), 255, dtype=np.uint8)) == 0.0
+
+
+@pytest.mark.parametrize("sigma", [4.0, 10.0, 20.0])
+def test_noise_matches_gaussian_sigma(sigma):
+    rng = np.random.default_rng(0)
+    page = np.clip(128 + rng.normal(0, sigma, (800, 600)), 0, 255).astype(np.uint8)
+
+    assert estimate_noise(page) == pytest.approx(sigma, rel=0.15)
+
+
+def test_noise_of_clean_page_ignores_character_edges():
+    assert estimate_noise(text_page(0.0)) < 1.0
+
+
+def test_noise_is_estimated_on_decimated_sample():
+    rng = np.random.default_rng(1)
+    page = np.clip(128 + rng.normal(0, 8.0, (2000, 1500)), 0, 255).astype(np.uint8)
+
+    assert estimate_noise(page, sample_pixels=100_000) == pytest.approx(8.0, rel=0.15)
+
+
+def test_noise_of_rgb_page_matches_gray_page():
+    rng = np.random.default_rng(2)
+    gray = np.clip(128 + rng.normal(0, 10.0, (600, 400)), 0, 255).astype(np.uint8)
+    rgb = np.repeat(gray[..., None], 3, axis=2)
+
+    assert estimate_noise(rgb) == pytest.approx(estimate_noise(gray))
@@ -0,0 +1,86 @@
+"""Tests du regroupement des petites zones (region_batching)"""
+
+from PIL import Image
+
+from region_batching import (BATCH_PADDING, MAX_BATCH_HEIGHT, MAX_BATCH_REGIONS, build_region_batch,
+                             plan_region_batches, split_batch_words)
+
+
+def crop(width=100, height=40, value=0):
+    return Image.new("L", (width, height), value)
+
+
+def large_crop():
+    return crop(1000, 1000)
+
+
+def test_small_regions_are_grouped_and_large_ones_kept_alone():
+    crops = [crop(), large_crop(), crop(), crop()]
+
+    singles, groups = plan_region_batches(crops)
+
+    assert singles == [1]
+    assert groups == [[0, 2, 3]]
+
+
+def test_group_is_split_at_region_count_limit():
+    crops = [crop() for _ in range(MAX_BATCH_REGIONS + 2)]
+
+    singles, groups = plan_region_batches(crops)
+
+    assert singles == []
+    assert [len(group) for group in groups] == [MAX_BATCH_REGIONS, 2]
+
+
+def test_group_is_split_at_sheet_height_limit():
+    height = MAX_BATCH_HEIGHT // 2 - 2 * BATCH_PADDING
+    crops = [crop(50, height) for _ in range(4)]
+
+    singles, groups = plan_region_batches(crops)
+
+    assert groups == [[0, 1], [2, 3]]
+    for group in groups:
+        assert sum(crops[i].height + 2 * BATCH_PADDING for i in group) <= MAX_BATCH_HEIGHT
+
+
+def test_lone_small_region_is_not_batched():
+    crops = [large_crop(), crop(), large_crop()]
+
+    singles, groups = plan_region_batches(crops)
+
+    assert singles == [0, 1, 2]
+    assert groups == []
+
+
+def test_sheet_stacks_regions_with_padding():
+    crops = [crop(100, 40, 10), crop(60, 30, 20)]
+
+    batch = build_region_batch(crops, [0, 1])
+
+    assert batch.image.size == (100 + 2 * BATCH_PADDING, 40 + 30 + 4 * BATCH_PADDING)
+    assert batch.boxes == [
+        (BATCH_PADDING, BATCH_PADDING, BATCH_PADDING + 100, BATCH_PADDING + 40),
+        (BATCH_PADDING, 40 + 3 * BATCH_PADDING, BATCH_PADDING + 60, 40 + 3 * BATCH_PADDING + 30),
+    ]
+    for index, (x1, y1, x2, y2) in zip(batch.indices, batch.boxes):
+        assert batch.image.crop((x1, y1, x2, y2)).getextrema() == crops[index].getextrema()
+
+
+def test_words_are_returned_to_their_region_in_region_coordinates():
+    crops = [large_crop() for _ in range(8)]
+    crops[3] = crops[7] = crop(100, 40)
+    batch = build_region_batch(crops, [3, 7])
+    second_top = batch.boxes[1][1]
+    words = [
+        {"text": "λόγος", "bbox": (BATCH_PADDING + 5, BATCH_PADDING + 5, BATCH_PADDING + 50, BATCH_PADDING + 30)},
+        {"text": "καί", "bbox": (BATCH_PADDING + 10, second_top + 2, BATCH_PADDING + 40, second_top + 20)},
+        # Mot dans la marge entre les zones : rendu à aucune
+        {"text": "bruit", "bbox": (0, BATCH_PADDING + 45, 10, BATCH_PADDING + 55)},
+    ]
+
+    by_region = split_batch_words(batch, words)
+
+    assert by_region == {
+        3: [{"text": "λόγος", "bbox": (5, 5, 50, 30)}],
+        7: [{"text": "καί", "bbox": (10, 2, 40, 20)}],
+    }
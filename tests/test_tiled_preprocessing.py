@@ -0,0 +1,56 @@
+"""Tests du prétraitement en tuiles (tiled_preprocessing)"""
+
+import logging
+
+import numpy as np
+import pytest
+
+from preprocessing import PreprocessingPipeline
+from tiled_preprocessing import TiledPreprocessor, tile_boxes
+
+
+def noisy_page(size=(300, 420), seed=0):
+    """Page grise bruitée avec des blocs d'« encre », assez variée pour les filtres locaux"""
+    rng = np.random.default_rng(seed)
+    page = np.full(size, 200, dtype=np.float64)
+    for _ in range(40):
+        y, x = rng.integers(0, size[0] - 20), rng.integers(0, size[1] - 30)
+        page[y:y + rng.integers(4, 20), x:x + rng.integers(5, 30)] = 40
+    return np.clip(page + rng.normal(0, 12, size), 0, 255).astype(np.uint8)
+
+
+def test_tiles_cover_image_without_overlap():
+    coverage = np.zeros((300, 420), dtype=np.int32)
+    for y0, y1, x0, x1 in tile_boxes(300, 420, 128):
+        coverage[y0:y1, x0:x1] += 1
+
+    assert (coverage == 1).all()
+
+
+@pytest.mark.parametrize("profile", ["scan", "degraded", "tesseract"])
+def test_tiled_output_matches_full_frame(profile, caplog):
+    page = noisy_page()
+    # Tuiles bien plus petites que la page : plusieurs raccords dans chaque direction
+    tiler = TiledPreprocessor(tile_size=128, min_pixels=0, max_workers=2)
+
+    full = PreprocessingPipeline.from_profile(profile).run(page)
+    tiled = PreprocessingPipeline.from_profile(profile, tiler=tiler).run(page)
+
+    # Tuiles traitées par le pool, sans repli sur une passe unique
+    assert "tiles" in tiled.metadata
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+    assert tiled.image.shape == full.image.shape
+    np.testing.assert_array_equal(tiled.image, full.image)
+
+
+def test_tiled_rgb_output_matches_full_frame(caplog):
+    rng = np.random.default_rng(3)
+    page = np.stack([noisy_page(seed=i) for i in range(3)], axis=2)
+    page[..., 0] = np.clip(page[..., 0].astype(np.int16) + rng.integers(0, 40), 0, 255)
+    tiler = TiledPreprocessor(tile_size=128, min_pixels=0, max_workers=2)
+
+    full = PreprocessingPipeline.from_profile("standard").run(page)
+    tiled = PreprocessingPipeline.from_profile("standard", tiler=tiler).run(page)
+
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+    np.testing.assert_array_equal(tiled.image, full.image)
@@ -0,0 +1,146 @@
+"""
+Prétraitement en tuiles pour OCR Grec
+=====================================
+Les scans de folios à 600 dpi dépassent 100 mégapixels : les étapes locales du
+pipeline (débruitage, netteté, binarisation locale) sont alors appliquées à
+des tuiles chevauchantes, réparties sur le pool de processus. L'image source
+et l'image résultat sont en mémoire partagée ; chaque processus traite sa
+tuile avec une marge égale au voisinage utilisé par les filtres et n'écrit
+que le cœur de la tuile, si bien que l'assemblage est sans raccord.
+Les étapes globales (CLAHE, redressement, Otsu) restent appliquées à la page
+entière, entre deux passes en tuiles.
+"""
+
+import logging
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from preprocessing import PreprocessingPipeline, apply_stages, stage_margin
+from process_pool import default_worker_count, get_process_pool
+
+# Côté d'une tuile (hors marge)
+DEFAULT_TILE_SIZE = 2048
+
+# En dessous de cette taille, une seule passe sur la page entière est plus rapide
+MIN_TILED_PIXELS = 24 * 1000 * 1000
+
+# Description d'un tableau en mémoire partagée : (nom, forme, type)
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+def tile_boxes(height: int, width: int, tile_size: int = DEFAULT_TILE_SIZE) -> List[Tuple[int, int, int, int]]:
+    """Cœurs des tuiles (y0, y1, x0, x1) couvrant l'image sans recouvrement"""
+    return [(y, min(y + tile_size, height), x, min(x + tile_size, width))
+            for y in range(0, height, tile_size)
+            for x in range(0, width, tile_size)]
+
+
+def _output_shape(stages: List[str], shape: Tuple[int, ...]) -> Tuple[int, ...]:
+    if len(shape) == 2 or "grayscale" in stages or "binarize" in stages:
+        return shape[:2]
+    return shape
+
+
+def _process_tile(source: ArraySpec, target: ArraySpec, core: Tuple[int, int, int, int], margin: int,
+                  stages: List[str], params: Dict[str, Dict[str, Any]],
+                  metadata: Dict[str, Any]) -> Tuple[Dict[str, float], Dict[str, Any]]:
+    """Traite une tuile dans un processus du pool (lecture et écriture en mémoire partagée)"""
+    source_shm = shared_memory.SharedMemory(name=source[0])
+    target_shm = shared_memory.SharedMemory(name=target[0])
+    try:
+        src = np.ndarray(source[1], dtype=source[2], buffer=source_shm.buf)
+        dst = np.ndarray(target[1], dtype=target[2], buffer=target_shm.buf)
+
+        y0, y1, x0, x1 = core
+        height, width = source[1][:2]
+        ty0, tx0 = max(0, y0 - margin), max(0, x0 - margin)
+        ty1, tx1 = min(height, y1 + margin), min(width, x1 + margin)
+
+        timings: Dict[str, float] = {}
+        tile_metadata = dict(metadata)
+        tile = apply_stages(stages, params, np.ascontiguousarray(src[ty0:ty1, tx0:tx1]), tile_metadata, timings)
+
+        # Seul le cœur est écrit : ses pixels ont été calculés avec tout leur voisinage
+        dst[y0:y1, x0:x1] = tile[y0 - ty0:y1 - ty0, x0 - tx0:x1 - tx0]
+        del src, dst
+        return timings, tile_metadata
+    finally:
+        source_shm.close()
+        target_shm.close()
+
+
+class TiledPreprocessor:
+    """Exécute les étapes locales d'un pipeline en tuiles sur le pool de processus"""
+
+    def __init__(self, tile_size: int = DEFAULT_TILE_SIZE, min_pixels: int = MIN_TILED_PIXELS,
+                 max_workers: Optional[int] = None) -> None:
+        self.tile_size = tile_size
+        self.min_pixels = min_pixels
+        self.max_workers = max_workers or default_worker_count()
+
+    def should_tile(self, image: np.ndarray) -> bool:
+        """Vrai si la page est assez grande et plusieurs processus sont disponibles"""
+        return self.max_workers > 1 and image.shape[0] * image.shape[1] >= self.min_pixels
+
+    def apply(self, pipeline: PreprocessingPipeline, image: np.ndarray,
+              metadata: Dict[str, Any], timings: Dict[str, float]) -> np.ndarray:
+        """Applique les étapes du pipeline : passes en tuiles et étapes globales alternées"""
+        for stages, margin in self._segments(pipeline):
+            if margin is None:
+                image = apply_stages(stages, pipeline.params, image, metadata, timings)
+            else:
+                image = self._apply_tiled(stages, margin, pipeline.params, image, metadata, timings)
+        return image
+
+    def _segments(self, pipeline: PreprocessingPipeline) -> List[Tuple[List[str], Optional[int]]]:
+        """Regroupe les étapes locales consécutives ; marge = somme des voisinages"""
+        segments: List[Tuple[List[str], Optional[int]]] = []
+        for name in pipeline.stages:
+            margin = stage_margin(name, pipeline.params.get(name, {}))
+            if margin is not None and segments and segments[-1][1] is not None:
+                stages, previous = segments[-1]
+                segments[-1] = (stages + [name], previous + margin)
+            else:
+                segments.append(([name], margin))
+        return segments
+
+    def _apply_tiled(self, stages: List[str], margin: int, params: Dict[str, Dict[str, Any]],
+                     image: np.ndarray, metadata: Dict[str, Any], timings: Dict[str, float]) -> np.ndarray:
+        start = time.perf_counter()
+        out_shape = _output_shape(stages, image.shape)
+        boxes = tile_boxes(image.shape[0], image.shape[1], self.tile_size)
+
+        source_shm = shared_memory.SharedMemory(create=True, size=image.nbytes)
+        target_shm = shared_memory.SharedMemory(create=True, size=int(np.prod(out_shape)))
+        try:
+            np.ndarray(image.shape, dtype=image.dtype, buffer=source_shm.buf)[:] = image
+            source = (source_shm.name, image.shape, image.dtype.str)
+            target = (target_shm.name, out_shape, np.dtype(np.uint8).str)
+
+            pool = get_process_pool(self.max_workers)
+            futures = [pool.submit(_process_tile, source, target, core, margin, stages, params, metadata)
+                       for core in boxes]
+
+            # Durées cumulées sur l'ensemble des processus
+            for future in futures:
+                tile_timings, tile_metadata = future.result()
+                for name, seconds in tile_timings.items():
+                    timings[name] = timings.get(name, 0.0) + seconds
+            metadata.update(tile_metadata)
+
+            result = np.array(np.ndarray(out_shape, dtype=np.uint8, buffer=target_shm.buf))
+        except Exception as e:
+            logging.warning(f"Prétraitement en tuiles impossible ({e}), passe unique sur la page")
+            result = apply_stages(stages, params, image, metadata, timings)
+        finally:
+            source_shm.close()
+            source_shm.unlink()
+            target_shm.close()
+            target_shm.unlink()
+
+        metadata.setdefault("tiles", []).append({"stages": stages, "count": len(boxes), "margin": margin})
+        timings["tuiles"] = timings.get("tuiles", 0.0) + time.perf_counter() - start
+        return result
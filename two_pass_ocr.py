@@ -0,0 +1,108 @@
+"""
+OCR en deux passes pour OCR Grec
+================================
+Une première passe bon marché (raster réduit, LSTM seul, jeu de langues
+minimal) reconnaît toute la page. Seules les lignes dont la confiance
+moyenne reste sous le seuil « douteux » sont recadrées dans le raster pleine
+résolution et reconnues à nouveau avec les réglages complets ; la version
+la plus sûre de chaque ligne est gardée.
+"""
+
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from config import Config
+from ocr_backend import OCRBackend
+from ocr_data import group_lines, word_boxes
+
+# Passe brouillon : demi-résolution, moteur LSTM seul
+DRAFT_SCALE = 0.5
+DRAFT_CONFIG = "--oem 1 --psm 6"
+
+# Marge autour d'une ligne recadrée (pixels pleine résolution)
+LINE_PADDING = 8
+
+
+@dataclass
+class TwoPassStats:
+    """Bilan d'un OCR en deux passes"""
+    lines: int = 0
+    uncertain_lines: int = 0
+    improved_lines: int = 0
+    draft_time: float = 0.0
+    refine_time: float = 0.0
+
+
+def line_config(config: str) -> str:
+    """Réglages complets appliqués à une ligne seule (PSM 7)"""
+    if re.search(r"--psm\s+\d+", config):
+        return re.sub(r"--psm\s+\d+", "--psm 7", config)
+    return f"{config} --psm 7".strip()
+
+
+def _mean_confidence(words: List[Dict[str, Any]]) -> float:
+    return sum(word["confidence"] for word in words) / len(words) if words else 0.0
+
+
+def _line_box(words: List[Dict[str, Any]], size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    """Boîte englobante d'une ligne élargie de la marge, bornée à l'image"""
+    return (max(0, min(word["bbox"][0] for word in words) - LINE_PADDING),
+            max(0, min(word["bbox"][1] for word in words) - LINE_PADDING),
+            min(size[0], max(word["bbox"][2] for word in words) + LINE_PADDING),
+            min(size[1], max(word["bbox"][3] for word in words) + LINE_PADDING))
+
+
+def two_pass_words(backend: OCRBackend, image: Image.Image, draft_lang: str, full_lang: str,
+                   full_config: str, threshold: Optional[float] = None, draft_scale: float = DRAFT_SCALE,
+                   max_workers: int = 1) -> Tuple[List[Dict[str, Any]], TwoPassStats]:
+    """Mots de la page (boîtes en pixels de `image`), dans l'ordre de lecture"""
+    threshold = Config.thresholds.uncertain if threshold is None else threshold
+    stats = TwoPassStats()
+
+    start = time.perf_counter()
+    draft = image.resize((max(1, int(image.width * draft_scale)), max(1, int(image.height * draft_scale))),
+                         Image.Resampling.LANCZOS)
+    lines = group_lines(word_boxes(backend.image_to_data(draft, draft_lang, DRAFT_CONFIG)))
+    stats.lines = len(lines)
+    stats.draft_time = time.perf_counter() - start
+
+    # Boîtes du brouillon ramenées en pleine résolution
+    for words in lines.values():
+        for word in words:
+            word["bbox"] = tuple(int(round(v / draft_scale)) for v in word["bbox"])
+
+    uncertain = [key for key, words in lines.items() if _mean_confidence(words) < threshold]
+    stats.uncertain_lines = len(uncertain)
+
+    start = time.perf_counter()
+    config = line_config(full_config)
+
+    def refine(key: Tuple[int, int, int]) -> Optional[List[Dict[str, Any]]]:
+        box = _line_box(lines[key], image.size)
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return None
+        words = word_boxes(backend.image_to_data(image.crop(box), full_lang, config))
+        for word in words:
+            x1, y1, x2, y2 = word["bbox"]
+            word.update({"bbox": (x1 + box[0], y1 + box[1], x2 + box[0], y2 + box[1]),
+                         "block": key[0], "paragraph": key[1], "line": key[2]})
+        return words
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="ocr-ligne") as executor:
+        for key, words in zip(uncertain, executor.map(refine, uncertain)):
+            # La relecture ne remplace la ligne que si elle est plus sûre
+            if words and _mean_confidence(words) > _mean_confidence(lines[key]):
+                lines[key] = words
+                stats.improved_lines += 1
+    stats.refine_time = time.perf_counter() - start
+
+    logging.info(f"OCR deux passes: {stats.uncertain_lines}/{stats.lines} lignes relues, "
+                 f"{stats.improved_lines} améliorées (brouillon {stats.draft_time:.2f}s, "
+                 f"relecture {stats.refine_time:.2f}s)")
+    return [word for words in lines.values() for word in words], stats